@@ -17,7 +17,7 @@ import logging
 import threading
 import time
 import uuid
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Mapping
 from dataclasses import dataclass
 
 from .kernel_interface import (
@@ -282,7 +282,7 @@ class FVOASController:
                  poll_interval: float = 0.1,
                  enable_ml: bool = True,
                  ml_model_path: Optional[str] = None,
-                 ml_device: str = "CPU"):
+                 ml_device: str = "AUTO"):
         """
         Initialize FVOAS controller.
 
@@ -292,7 +292,7 @@ class FVOASController:
             poll_interval: Telemetry poll interval in seconds
             enable_ml: Enable ML-based voice processing with OpenVINO
             ml_model_path: Path to OpenVINO model (optional)
-            ml_device: ML inference device (CPU, GPU, VPU)
+            ml_device: ML inference device (CPU, GPU, VPU, AUTO)
         """
         self.session_id = str(uuid.uuid4())[:8]
 
@@ -330,7 +330,7 @@ class FVOASController:
         # Callbacks
         self.on_threat: Optional[Callable[[VoiceTelemetry], None]] = None
         self.on_telemetry: Optional[Callable[[VoiceTelemetry], None]] = None
-        self.on_dynamic_update: Optional[Callable[[Dict[str, Any]], None]] = None
+        self.on_dynamic_update: Optional[Callable[[Mapping[str, Any]], None]] = None
 
         # Statistics
         self.stats = {
@@ -571,8 +571,9 @@ class FVOASController:
         else:
             self._disable_dynamic_mode()
 
-        self.set_mode(preset['mode'])
-        self.set_params(preset['params'])
+        # Mode and params go down together in one SET_STATE ioctl
+        self.kernel.apply({'mode': preset['mode'], 'params': preset['params']})
+        self.stats['mode_changes'] += 1
         self._current_preset = preset_name
 
         logger.info(f"Applied preset: {preset_name} - {preset.get('description', '')}")
@@ -632,7 +633,7 @@ class FVOASController:
     def get_dynamic_state(self) -> Optional[Dict[str, Any]]:
         """Get current dynamic anonymization state"""
         if self._dynamic_anonymizer:
-            return self._dynamic_anonymizer.get_state()
+            return dict(self._dynamic_anonymizer.get_state())
         return None
 
     def get_state(self) -> DeviceState:
@@ -718,13 +719,13 @@ class FVOASController:
 
         return result
     
-    def enable_ml(self, model_path: Optional[str] = None, device: str = "CPU") -> bool:
+    def enable_ml(self, model_path: Optional[str] = None, device: str = "AUTO") -> bool:
         """
         Enable ML-based voice processing.
         
         Args:
             model_path: Path to OpenVINO model
-            device: Inference device (CPU, GPU, VPU)
+            device: Inference device (CPU, GPU, VPU, AUTO)
             
         Returns:
             True if ML processing enabled successfully
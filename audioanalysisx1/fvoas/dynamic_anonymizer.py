@@ -16,10 +16,12 @@ Key Features:
 """
 
 import logging
+import operator
 import time
 import threading
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, Tuple, Callable
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Tuple, Callable, Mapping
 from enum import Enum
 import math
 
@@ -33,6 +35,257 @@ except ImportError:
     np = None
     HAS_NUMPY = False
 
+# Semitone lookup table covering the physiological F0 range
+LUT_MIN_HZ = 50.0
+LUT_MAX_HZ = 500.0
+LUT_SIZE = 1024
+LUT_SCALE = (LUT_SIZE - 1) / (LUT_MAX_HZ - LUT_MIN_HZ)
+
+# Try numba for the per-sample arithmetic kernel
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    njit = None
+    HAS_NUMBA = False
+
+# F0 history window shared by DynamicState and DynamicAnonymizer
+HISTORY_SIZE = 50
+
+# Resync the running F0 sums from the buffer every N samples to bound
+# floating point drift
+RESYNC_INTERVAL = 10000
+
+
+def _make_f0_buffer():
+    """Preallocated storage for the F0 ring buffer"""
+    if HAS_NUMPY:
+        return np.zeros(HISTORY_SIZE, dtype=np.float32)
+    return [0.0] * HISTORY_SIZE
+
+
+def _make_time_buffer():
+    """Preallocated storage for ring buffer timestamps (ns)"""
+    if HAS_NUMPY:
+        return np.zeros(HISTORY_SIZE, dtype=np.int64)
+    return [0] * HISTORY_SIZE
+
+
+def _ring_ordered(buf, write_idx: int, count: int) -> list:
+    """Ring buffer contents in chronological order (oldest first)"""
+    if count < HISTORY_SIZE:
+        ordered = list(buf[:count])
+    else:
+        ordered = list(buf[write_idx:]) + list(buf[:write_idx])
+    return [x.item() if hasattr(x, 'item') else x for x in ordered]
+
+
+def _build_semitone_lut(target_f0: float):
+    """
+    Precompute 12 * log2(target_f0 / f) for f evenly spaced over
+    [LUT_MIN_HZ, LUT_MAX_HZ]. Returns a numpy array when the numba kernel
+    is in use, a plain list otherwise (faster to index from Python).
+    """
+    step = (LUT_MAX_HZ - LUT_MIN_HZ) / (LUT_SIZE - 1)
+    lut = [12.0 * math.log2(target_f0 / (LUT_MIN_HZ + i * step))
+           for i in range(LUT_SIZE)]
+    if HAS_NUMBA:
+        return np.asarray(lut, dtype=np.float64)
+    return lut
+
+
+# Layout of DynamicState's contiguous frequency buffer
+IDX_CURRENT = slice(0, 4)   # current F0, F1, F2, F3
+IDX_AVG = slice(4, 8)       # smoothed F0, F1, F2, F3
+
+
+def _make_hot_buffer():
+    """Contiguous storage for current + averaged frequencies (32 bytes)"""
+    if HAS_NUMPY:
+        return np.zeros(8, dtype=np.float32)
+    return None
+
+
+def _ema4_loop(cur, avg, tmp, alpha, one_minus_alpha):
+    """
+    In-place EMA over the four tracked frequencies. Used as the numba
+    kernel (LLVM vectorises the fixed-length loop) and as the pure
+    Python fallback; tmp is unused here.
+    """
+    if avg[0] == 0.0:
+        # First sample - initialize
+        for i in range(4):
+            avg[i] = cur[i]
+    else:
+        for i in range(4):
+            avg[i] = alpha * cur[i] + one_minus_alpha * avg[i]
+
+
+def _ema4_ufunc(cur, avg, tmp, alpha, one_minus_alpha):
+    """
+    In-place EMA over the four tracked frequencies as numpy ufunc calls,
+    using the caller's scratch buffer tmp (4 floats) for the cur term
+    """
+    if avg[0] == 0.0:
+        # First sample - initialize
+        avg[:] = cur
+    else:
+        np.multiply(cur, alpha, out=tmp)
+        avg *= one_minus_alpha
+        avg += tmp
+
+
+def _clamp_py(x, lo, hi):
+    """Clamp x to [lo, hi] (lowers to minsd/maxsd under numba)"""
+    return lo if x < lo else hi if x > hi else x
+
+
+def _adjust_py(avg_f0, avg_f1, pitch_adj, formant_ratio,
+               smoothing, one_minus_smoothing, target_f0, target_f1,
+               lock_pitch, lock_formants, semitone_lut):
+    """
+    Pitch and formant adjustment towards the target profile.
+
+    Returns (pitch_adj, formant_ratio, adjustments).
+    """
+    adjustments = 0
+
+    # === Pitch Adjustment ===
+    if lock_pitch and avg_f0 > 0.0:
+        # semitones = 12 * log2(target_f0 / current_f0)
+        ratio = target_f0 / avg_f0
+        if ratio > 0.0:
+            if LUT_MIN_HZ <= avg_f0 < LUT_MAX_HZ:
+                # Table lookup with linear interpolation
+                pos = (avg_f0 - LUT_MIN_HZ) * LUT_SCALE
+                i = int(pos)
+                lo = semitone_lut[i]
+                raw_semitones = lo + (pos - i) * (semitone_lut[i + 1] - lo)
+            else:
+                raw_semitones = 12.0 * math.log2(ratio)
+            new_pitch = smoothing * pitch_adj + one_minus_smoothing * raw_semitones
+            new_pitch = _clamp(new_pitch, -12.0, 12.0)
+
+            # Only update if change is significant
+            if abs(new_pitch - pitch_adj) > 0.1:
+                pitch_adj = new_pitch
+                adjustments += 1
+
+    # === Formant Adjustment (F1 as primary reference) ===
+    if lock_formants and avg_f1 > 0.0:
+        raw_ratio = target_f1 / avg_f1
+        new_ratio = smoothing * formant_ratio + one_minus_smoothing * raw_ratio
+        new_ratio = _clamp(new_ratio, 0.5, 2.0)
+
+        if abs(new_ratio - formant_ratio) > 0.02:
+            formant_ratio = new_ratio
+            adjustments += 1
+
+    return pitch_adj, formant_ratio, adjustments
+
+
+def _step_py(cur, avg, tmp, pitch_adj, formant_ratio,
+             alpha, one_minus_alpha, smoothing, one_minus_smoothing,
+             target_f0, target_f1,
+             lock_pitch, lock_formants, adjust, semitone_lut):
+    """
+    Per-sample adaptation step: EMA update of ``avg`` (in place, with
+    ``tmp`` as scratch) plus pitch/formant adjustment.
+
+    Returns (pitch_adj, formant_ratio, adjustments).
+    """
+    _ema4(cur, avg, tmp, alpha, one_minus_alpha)
+    if adjust:
+        return _adjust(float(avg[0]), float(avg[1]), pitch_adj, formant_ratio,
+                       smoothing, one_minus_smoothing, target_f0, target_f1,
+                       lock_pitch, lock_formants, semitone_lut)
+    return pitch_adj, formant_ratio, 0
+
+
+def _ema_rows_py(x, out, start, prev, alpha, one_minus_alpha):
+    """Row-wise EMA of x (N, 4) into out, continuing from prev"""
+    for n in range(start, x.shape[0]):
+        for i in range(4):
+            prev[i] = alpha * x[n, i] + one_minus_alpha * prev[i]
+            out[n, i] = prev[i]
+
+
+def _adjust_batch_py(avg_f0s, avg_f1s, first_count, min_samples,
+                     pitch_adj, formant_ratio,
+                     smoothing, one_minus_smoothing, target_f0, target_f1,
+                     lock_pitch, lock_formants, semitone_lut,
+                     pitch_out, formant_out):
+    """
+    Run the adjustment recursion over a window of averaged F0/F1.
+
+    The update thresholds make this recursion non-linear, so it is a
+    sequential loop (compiled by numba when available). Fills pitch_out
+    and formant_out; returns (pitch_adj, formant_ratio, adjustments).
+    """
+    adjustments = 0
+    for n in range(avg_f0s.shape[0]):
+        if first_count + n >= min_samples:
+            pitch_adj, formant_ratio, made = _adjust(
+                float(avg_f0s[n]), float(avg_f1s[n]), pitch_adj, formant_ratio,
+                smoothing, one_minus_smoothing, target_f0, target_f1,
+                lock_pitch, lock_formants, semitone_lut)
+            adjustments += made
+        pitch_out[n] = pitch_adj
+        formant_out[n] = formant_ratio
+    return pitch_adj, formant_ratio, adjustments
+
+
+# Compile the kernels when numba is available (cached on disk to skip
+# recompilation on later runs)
+if HAS_NUMBA:
+    _jit = njit(cache=True, fastmath=True)
+    _clamp = _jit(_clamp_py)
+    _ema4 = _jit(_ema4_loop)
+    _adjust = _jit(_adjust_py)
+    _step = _jit(_step_py)
+    _ema_rows = _jit(_ema_rows_py)
+    _adjust_batch = _jit(_adjust_batch_py)
+else:
+    _clamp = _clamp_py
+    _ema4 = _ema4_ufunc if HAS_NUMPY else _ema4_loop
+    _adjust = _adjust_py
+    _step = _step_py
+    _ema_rows = _ema_rows_py
+    _adjust_batch = _adjust_batch_py
+
+
+def _ema_batch(x, avg, alpha: float, one_minus_alpha: float):
+    """
+    EMA over the rows of x (N, 4), continuing from the running averages
+    ``avg``. Returns the (N, 4) smoothed values.
+    """
+    out = np.empty_like(x)
+    prev = np.array(avg, dtype=np.float64)
+    start = 0
+    if prev[0] == 0.0:
+        # First sample - initialize
+        prev[:] = x[0]
+        out[0] = x[0]
+        start = 1
+    if start >= x.shape[0]:
+        return out
+
+    if not HAS_NUMBA:
+        # y[n] = alpha*x[n] + (1-alpha)*y[n-1] is a first-order IIR filter
+        try:
+            from scipy.signal import lfilter
+        except ImportError:
+            lfilter = None
+        if lfilter is not None:
+            out[start:], _ = lfilter(
+                [alpha], [1.0, -one_minus_alpha], x[start:], axis=0,
+                zi=(one_minus_alpha * prev)[np.newaxis, :],
+            )
+            return out
+
+    _ema_rows(x, out, start, prev, alpha, one_minus_alpha)
+    return out
+
 
 class TargetProfile(Enum):
     """Predefined target voice profiles for anonymization"""
@@ -99,20 +352,22 @@ class VoiceProfile:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicState:
     """Real-time tracking of voice characteristics and adjustments"""
-    # Current detected values
-    current_f0: float = 0.0
-    current_f1: float = 0.0
-    current_f2: float = 0.0
-    current_f3: float = 0.0
-
-    # Smoothed running averages
-    avg_f0: float = 0.0
-    avg_f1: float = 0.0
-    avg_f2: float = 0.0
-    avg_f3: float = 0.0
+    # Current and averaged frequencies share one buffer so the per-sample
+    # working set stays within a single cache line
+    _hot: Any = field(default_factory=_make_hot_buffer, repr=False)
+
+    # Current detected values (F0, F1, F2, F3) - view into _hot
+    current: Any = field(init=False)
+
+    # Smoothed running averages (F0, F1, F2, F3) - view into _hot
+    avg: Any = field(init=False)
+
+    # Scratch for the numpy EMA step, one per state so concurrent
+    # anonymizers never share it
+    _ema_tmp: Any = field(init=False, repr=False)
 
     # Computed adjustments
     pitch_adjustment: float = 0.0   # Semitones
@@ -123,10 +378,94 @@ class DynamicState:
     adjustments_made: int = 0
     profile_stable: bool = False
     stability_score: float = 0.0    # 0.0-1.0
+    settled: bool = False           # Last adjustment step changed nothing
+
+    # F0 ring buffer for stability analysis
+    f0_buf: Any = field(default_factory=_make_f0_buffer)
+    f0_write_idx: int = 0
+    f0_count: int = 0
+    f0_sum: float = 0.0             # Running sum of buffered F0
+    f0_sqsum: float = 0.0           # Running sum of squared F0
+
+    # Adjustment history ring buffer (only filled when recording is enabled)
+    adj_pitch: Any = field(default_factory=_make_f0_buffer)
+    adj_formant: Any = field(default_factory=_make_f0_buffer)
+    adj_time_ns: Any = field(default_factory=_make_time_buffer)
+    adj_write_idx: int = 0
+    adj_count: int = 0
+
+    def __post_init__(self):
+        if self._hot is not None:
+            self.current = self._hot[IDX_CURRENT]
+            self.avg = self._hot[IDX_AVG]
+            self._ema_tmp = np.empty(4, dtype=np.float32)
+        else:
+            self.current = [0.0] * 4
+            self.avg = [0.0] * 4
+            self._ema_tmp = None
+
+    @property
+    def current_f0(self) -> float:
+        return float(self.current[0])
+
+    @property
+    def current_f1(self) -> float:
+        return float(self.current[1])
+
+    @property
+    def current_f2(self) -> float:
+        return float(self.current[2])
+
+    @property
+    def current_f3(self) -> float:
+        return float(self.current[3])
+
+    @property
+    def avg_f0(self) -> float:
+        return float(self.avg[0])
+
+    @property
+    def avg_f1(self) -> float:
+        return float(self.avg[1])
+
+    @property
+    def avg_f2(self) -> float:
+        return float(self.avg[2])
 
-    # History for analysis
-    f0_history: list = field(default_factory=list)
-    adjustment_history: list = field(default_factory=list)
+    @property
+    def avg_f3(self) -> float:
+        return float(self.avg[3])
+
+    @property
+    def f0_history(self) -> list:
+        """F0 history in chronological order (oldest first)"""
+        return _ring_ordered(self.f0_buf, self.f0_write_idx, self.f0_count)
+
+    def f0_window(self):
+        """
+        F0 history as an array in chronological order. Returns a view of
+        the ring buffer until it wraps, then a single concatenated copy.
+        Requires numpy.
+        """
+        if self.f0_count < HISTORY_SIZE:
+            return self.f0_buf[:self.f0_count]
+        idx = self.f0_write_idx
+        return np.concatenate((self.f0_buf[idx:], self.f0_buf[:idx]))
+
+    @property
+    def adjustment_history(self) -> list:
+        """
+        Recorded adjustments (oldest first) as {'pitch', 'formant', 'time'}
+        dicts, time in time.time() seconds. Read-only, built from the same
+        ring buffers as DynamicAnonymizer.get_adjustment_history(); empty
+        unless the anonymizer was created with record_history=True.
+        """
+        idx, count = self.adj_write_idx, self.adj_count
+        wall_offset_ns = time.time_ns() - time.monotonic_ns()
+        return [{'pitch': pitch, 'formant': formant, 'time': (t + wall_offset_ns) * 1e-9}
+                for pitch, formant, t in zip(_ring_ordered(self.adj_pitch, idx, count),
+                                             _ring_ordered(self.adj_formant, idx, count),
+                                             _ring_ordered(self.adj_time_ns, idx, count))]
 
 
 class DynamicAnonymizer:
@@ -149,7 +488,7 @@ class DynamicAnonymizer:
     """
 
     # History window for stability detection
-    HISTORY_SIZE = 50
+    HISTORY_SIZE = HISTORY_SIZE
 
     # Stability threshold (variance below this = stable)
     STABILITY_THRESHOLD = 0.05
@@ -157,76 +496,123 @@ class DynamicAnonymizer:
     # Minimum samples before making adjustments
     MIN_SAMPLES = 10
 
+    # Input changes below these (relative to the running averages) are
+    # perceptually irrelevant once adjustments have settled
+    F0_JND_HZ = 0.5
+    FORMANT_JND_HZ = 5.0
+
+    # Factories for the predefined target profiles
+    _PROFILE_FACTORIES: Dict[TargetProfile, Callable[[], VoiceProfile]] = {
+        TargetProfile.NEUTRAL: VoiceProfile.neutral,
+        TargetProfile.MALE: VoiceProfile.male,
+        TargetProfile.FEMALE: VoiceProfile.female,
+        TargetProfile.ROBOT: VoiceProfile.robot,
+    }
+
     def __init__(self,
                  target: TargetProfile = TargetProfile.NEUTRAL,
-                 custom_profile: Optional[VoiceProfile] = None):
+                 custom_profile: Optional[VoiceProfile] = None,
+                 record_history: bool = False):
         """
         Initialize dynamic anonymizer.
 
         Args:
             target: Target voice profile type
             custom_profile: Custom VoiceProfile (used when target=CUSTOM)
+            record_history: Keep a timestamped history of adjustments
+                (off by default; see get_adjustment_history() and
+                state.adjustment_history)
         """
         self.target_type = target
-        self.profile = self._get_profile(target, custom_profile)
+        self._set_profile(self._get_profile(target, custom_profile))
         self.state = DynamicState()
 
         self._running = False
+
+        # process_telemetry is the single writer of the state fields and
+        # runs lock-free; _seq is odd while an update is in flight so
+        # readers can retry (seqlock). Control threads never mutate the
+        # state in place - they swap in a new DynamicState under _lock.
+        self._seq = 0
         self._lock = threading.Lock()
+        self._record_history = record_history
+
+        # Telemetry field extractor, cached per telemetry type
+        self._extractor: Optional[Callable] = None
+        self._extractor_type: Optional[type] = None
+
+        # Read-only snapshot returned by get_state(). Writers only mark it
+        # stale; get_state() rebuilds it on demand, so samples nobody reads
+        # cost no allocation
+        self._state_view: Mapping[str, Any] = MappingProxyType({})
+        self._state_dirty = True
 
         # Callback for parameter updates
-        self.on_params_changed: Optional[Callable[[Dict[str, Any]], None]] = None
+        self.on_params_changed: Optional[Callable[[Mapping[str, Any]], None]] = None
 
         # Base parameters (before dynamic adjustment)
         self._base_pitch = 0.0
         self._base_formant = 1.0
 
-        logger.info(f"DynamicAnonymizer initialized: target={target.value}, "
-                   f"F0={self.profile.f0_hz}Hz")
+        logger.info("DynamicAnonymizer initialized: target=%s, F0=%sHz",
+                    target.value, self.profile.f0_hz)
 
     def _get_profile(self, target: TargetProfile,
                      custom: Optional[VoiceProfile]) -> VoiceProfile:
         """Get voice profile for target type"""
-        if target == TargetProfile.NEUTRAL:
-            return VoiceProfile.neutral()
-        elif target == TargetProfile.MALE:
-            return VoiceProfile.male()
-        elif target == TargetProfile.FEMALE:
-            return VoiceProfile.female()
-        elif target == TargetProfile.ROBOT:
-            return VoiceProfile.robot()
-        elif target == TargetProfile.CUSTOM and custom:
+        factory = self._PROFILE_FACTORIES.get(target)
+        if factory:
+            return factory()
+        if target == TargetProfile.CUSTOM and custom:
             return custom
-        else:
-            return VoiceProfile.neutral()
+        return VoiceProfile.neutral()
+
+    def _set_profile(self, profile: VoiceProfile):
+        """
+        Install a profile and rebuild the values derived from it.
+
+        The anonymizer keeps its own copy, so later edits to the caller's
+        profile object can't leave the EMA complements or the semitone
+        table stale; change profiles with set_target().
+        """
+        profile = replace(profile)
+        self.profile = profile
+        self._one_minus_alpha = 1.0 - profile.adaptation_rate
+        self._one_minus_smoothing = 1.0 - profile.smoothing
+        self._semitone_lut = _build_semitone_lut(profile.f0_hz)
 
     def set_target(self, target: TargetProfile,
                    custom_profile: Optional[VoiceProfile] = None):
         """Change target profile"""
+        profile = self._get_profile(target, custom_profile)
         with self._lock:
             self.target_type = target
-            self.profile = self._get_profile(target, custom_profile)
-            self.reset()
+            self._set_profile(profile)
+            self.state = DynamicState()
+            self._state_dirty = True
 
-        logger.info(f"Target changed to: {target.value}")
+        logger.info("Target changed to: %s", target.value)
 
     def reset(self):
         """Reset dynamic state"""
         with self._lock:
             self.state = DynamicState()
+            self._state_dirty = True
         logger.info("Dynamic state reset")
 
     def start(self):
         """Start dynamic adaptation"""
         self._running = True
+        self._state_dirty = True
         logger.info("Dynamic anonymization started")
 
     def stop(self):
         """Stop dynamic adaptation"""
         self._running = False
+        self._state_dirty = True
         logger.info("Dynamic anonymization stopped")
 
-    def process_telemetry(self, telemetry) -> Dict[str, Any]:
+    def process_telemetry(self, telemetry) -> Mapping[str, Any]:
         """
         Process voice telemetry and compute adaptive parameters.
 
@@ -234,198 +620,377 @@ class DynamicAnonymizer:
             telemetry: VoiceTelemetry or dict with f0/formant data
 
         Returns:
-            Dict with computed obfuscation parameters
+            Read-only mapping of computed obfuscation parameters; the same
+            object is passed to on_params_changed (dict(...) it for a
+            mutable copy)
         """
         if not self._running:
             return self._get_static_params()
 
-        # Extract voice characteristics from telemetry
-        if hasattr(telemetry, 'f0_median'):
-            f0 = telemetry.f0_median
-            formants = telemetry.formants if hasattr(telemetry, 'formants') else (0, 0, 0)
-        elif isinstance(telemetry, dict):
-            f0 = telemetry.get('f0_median', telemetry.get('f0_hz', 0))
-            formants = telemetry.get('formants', (0, 0, 0))
-        else:
+        # Extract voice characteristics
+        values = self._extract(telemetry)
+        if values is None:
             return self._get_static_params()
 
         # Skip if no valid F0 detected
+        f0 = values[0]
         if f0 <= 0:
             return self._get_current_params()
 
-        f1, f2, f3 = formants if len(formants) >= 3 else (0, 0, 0)
+        self._seq += 1
+        try:
+            state = self.state
+            profile = self.profile
 
-        with self._lock:
             # Update current values
-            self.state.current_f0 = f0
-            self.state.current_f1 = f1
-            self.state.current_f2 = f2
-            self.state.current_f3 = f3
-            self.state.samples_analyzed += 1
-
-            # Update smoothed averages (exponential moving average)
-            alpha = self.profile.adaptation_rate
-            if self.state.avg_f0 == 0:
-                # First sample - initialize
-                self.state.avg_f0 = f0
-                self.state.avg_f1 = f1
-                self.state.avg_f2 = f2
-                self.state.avg_f3 = f3
+            state.current[:] = values
+            state.samples_analyzed += 1
+
+            avg = state.avg
+            if (state.settled
+                    and abs(f0 - avg[0]) < self.F0_JND_HZ
+                    and abs(values[1] - avg[1]) < self.FORMANT_JND_HZ
+                    and abs(values[2] - avg[2]) < self.FORMANT_JND_HZ
+                    and abs(values[3] - avg[3]) < self.FORMANT_JND_HZ):
+                # Input within JND of the settled averages - adaptation
+                # would not change the output, so only track stability
+                adjust = False
             else:
-                self.state.avg_f0 = alpha * f0 + (1 - alpha) * self.state.avg_f0
-                self.state.avg_f1 = alpha * f1 + (1 - alpha) * self.state.avg_f1
-                self.state.avg_f2 = alpha * f2 + (1 - alpha) * self.state.avg_f2
-                self.state.avg_f3 = alpha * f3 + (1 - alpha) * self.state.avg_f3
+                # Smoothed averages and adjustments in one kernel call
+                adjust = state.samples_analyzed >= self.MIN_SAMPLES
+                state.pitch_adjustment, state.formant_ratio, made = _step(
+                    state.current, avg, state._ema_tmp,
+                    state.pitch_adjustment, state.formant_ratio,
+                    profile.adaptation_rate, self._one_minus_alpha,
+                    profile.smoothing, self._one_minus_smoothing,
+                    profile.f0_hz, profile.f1_hz,
+                    profile.lock_pitch, profile.lock_formants, adjust,
+                    self._semitone_lut,
+                )
+                state.adjustments_made += made
+                state.settled = adjust and made == 0
 
             # Track history
-            self.state.f0_history.append(f0)
-            if len(self.state.f0_history) > self.HISTORY_SIZE:
-                self.state.f0_history.pop(0)
+            self._push_f0(state, f0)
 
             # Check stability
-            self._update_stability()
+            self._update_stability(state)
 
-            # Compute adjustments
-            if self.state.samples_analyzed >= self.MIN_SAMPLES:
-                self._compute_adjustments()
+            if adjust and self._record_history:
+                self._track_adjustment(state)
+        finally:
+            self._state_dirty = True
+            self._seq += 1
 
         params = self._get_current_params()
+        self._notify(params)
+        return params
+
+    def process_telemetry_batch(self, f0s, formants) -> Tuple[Any, Any]:
+        """
+        Process a window of telemetry at once (offline analysis, buffered
+        kernel drains).
+
+        Runs the same EMA, stability and adjustment pipeline as calling
+        process_telemetry once per sample, vectorised over the window,
+        and leaves the anonymizer in the state it would have after those
+        calls. Samples with F0 <= 0 are skipped. Adjustment history is not
+        recorded and the JND early-out is not applied.
+
+        Args:
+            f0s: Array of N F0 values (Hz)
+            formants: Array of shape (N, 3) with F1, F2, F3 (Hz)
+
+        Returns:
+            (pitch_semitones, formant_ratio) arrays of length N with the
+            parameters in effect after each sample
+        """
+        if not HAS_NUMPY:
+            raise RuntimeError("NumPy required for batch telemetry processing")
+
+        f0s = np.asarray(f0s, dtype=np.float64).reshape(-1)
+        formants = np.asarray(formants, dtype=np.float64).reshape(-1, 3)
+        n_total = f0s.shape[0]
+        if formants.shape[0] != n_total:
+            raise ValueError(f"Expected {n_total} formant rows, got {formants.shape[0]}")
 
-        # Notify callback
+        if not self._running:
+            static = self._get_static_params()
+            return (np.full(n_total, static['pitch_semitones']),
+                    np.full(n_total, static['formant_ratio']))
+
+        initial = self._get_current_params()
+        initial_pitch = initial['pitch_semitones']
+        initial_formant = initial['formant_ratio']
+
+        valid = f0s > 0
+        x = np.column_stack((f0s[valid], formants[valid]))
+        m = x.shape[0]
+        if m == 0:
+            return np.full(n_total, initial_pitch), np.full(n_total, initial_formant)
+
+        self._seq += 1
+        try:
+            state = self.state
+            profile = self.profile
+
+            # Smoothed averages over the whole window
+            avgs = _ema_batch(x, state.avg, profile.adaptation_rate,
+                              self._one_minus_alpha)
+
+            # Adjustment recursion
+            pitch = np.empty(m)
+            formant = np.empty(m)
+            state.pitch_adjustment, state.formant_ratio, made = _adjust_batch(
+                avgs[:, 0], avgs[:, 1], state.samples_analyzed + 1, self.MIN_SAMPLES,
+                state.pitch_adjustment, state.formant_ratio,
+                profile.smoothing, self._one_minus_smoothing,
+                profile.f0_hz, profile.f1_hz,
+                profile.lock_pitch, profile.lock_formants,
+                self._semitone_lut, pitch, formant,
+            )
+
+            # Stability over the sliding F0 window (prefix sums)
+            history = state.f0_window().astype(np.float64)
+            series = np.concatenate((history, x[:, 0]))
+            csum = np.concatenate(([0.0], np.cumsum(series)))
+            csq = np.concatenate(([0.0], np.cumsum(series * series)))
+            ends = history.shape[0] + 1 + np.arange(m)
+            counts = np.minimum(ends, self.HISTORY_SIZE)
+            starts = ends - counts
+            mean = (csum[ends] - csum[starts]) / counts
+            var = (csq[ends] - csq[starts]) / counts - mean * mean
+            cv = np.sqrt(np.maximum(var, 0.0)) / mean
+            stable = (cv < self.STABILITY_THRESHOLD) & (counts >= self.HISTORY_SIZE // 2)
+
+            # Carry the end-of-window state forward
+            state.current[:] = x[-1]
+            state.avg[:] = avgs[-1]
+            state.adjustments_made += made
+            state.settled = False
+            for f0 in x[-self.HISTORY_SIZE:, 0]:
+                state.samples_analyzed += 1
+                self._push_f0(state, float(f0))
+            state.samples_analyzed += m - min(m, self.HISTORY_SIZE)
+            self._update_stability(state)
+        finally:
+            self._state_dirty = True
+            self._seq += 1
+
+        # Combine with base params and apply the variation limit
+        total_pitch = self._base_pitch + pitch
+        total_formant = self._base_formant * formant
+        total_pitch = np.where(stable, total_pitch, np.clip(total_pitch, -6, 6))
+        total_formant = np.where(stable, total_formant, np.clip(total_formant, 0.8, 1.3))
+
+        # Skipped (F0 <= 0) samples keep the previous parameters
+        pitch_out = np.full(n_total, initial_pitch)
+        formant_out = np.full(n_total, initial_formant)
+        pitch_out[valid] = total_pitch
+        formant_out[valid] = total_formant
+        last = np.maximum.accumulate(np.where(valid, np.arange(n_total), -1))
+        carried = (~valid) & (last >= 0)
+        pitch_out[carried] = pitch_out[last[carried]]
+        formant_out[carried] = formant_out[last[carried]]
+
+        return pitch_out, formant_out
+
+    def _extract(self, telemetry) -> Optional[Tuple[float, float, float, float]]:
+        """Extract (f0, f1, f2, f3), caching the extractor per telemetry type"""
+        telemetry_type = type(telemetry)
+        if telemetry_type is not self._extractor_type:
+            self._extractor = self._make_extractor(telemetry)
+            self._extractor_type = telemetry_type
+        if self._extractor is None:
+            return None
+        return self._extractor(telemetry)
+
+    def _notify(self, params: Mapping[str, Any]):
+        """Notify the params callback"""
         if self.on_params_changed:
             try:
                 self.on_params_changed(params)
             except Exception as e:
-                logger.error(f"Params callback error: {e}")
+                logger.error("Params callback error: %s", e)
+
+    def _push_f0(self, state: DynamicState, f0: float):
+        """Write F0 into the ring buffer and update the running sums in O(1)"""
+        buf = state.f0_buf
+        idx = state.f0_write_idx
+
+        # Sums track the stored (possibly float32-rounded) values so that
+        # evicting a sample removes exactly what was added
+        old = float(buf[idx])
+        buf[idx] = f0
+        new = float(buf[idx])
+        state.f0_sum += new - old
+        state.f0_sqsum += new * new - old * old
+
+        state.f0_write_idx = (idx + 1) % self.HISTORY_SIZE
+        state.f0_count = min(state.f0_count + 1, self.HISTORY_SIZE)
+
+        if state.samples_analyzed % RESYNC_INTERVAL == 0:
+            view = buf[:state.f0_count]
+            if HAS_NUMPY:
+                state.f0_sum = float(view.sum(dtype=np.float64))
+                state.f0_sqsum = float(np.dot(view, view.astype(np.float64)))
+            else:
+                state.f0_sum = float(sum(view))
+                state.f0_sqsum = float(sum(x * x for x in view))
 
-        return params
+    @staticmethod
+    def _make_extractor(telemetry) -> Optional[Callable[[Any], Tuple[float, float, float, float]]]:
+        """
+        Build an (f0, f1, f2, f3) extractor for the given telemetry's type.
+
+        Returns None for unsupported telemetry types.
+        """
+        def split(f0, formants):
+            try:
+                return f0, formants[0], formants[1], formants[2]
+            except (IndexError, TypeError):
+                return f0, 0, 0, 0
+
+        if hasattr(telemetry, 'f0_median'):
+            if hasattr(telemetry, 'formants'):
+                get_fields = operator.attrgetter('f0_median', 'formants')
+                return lambda t: split(*get_fields(t))
+            get_f0 = operator.attrgetter('f0_median')
+            return lambda t: (get_f0(t), 0, 0, 0)
+
+        if isinstance(telemetry, dict):
+            def extract_dict(t):
+                f0 = t.get('f0_median', t.get('f0_hz', 0))
+                return split(f0, t.get('formants', (0, 0, 0)))
+            return extract_dict
 
-    def _update_stability(self):
+        return None
+
+    def _update_stability(self, state: DynamicState):
         """Check if voice profile is stable"""
-        if len(self.state.f0_history) < self.HISTORY_SIZE // 2:
-            self.state.profile_stable = False
-            self.state.stability_score = 0.0
+        count = state.f0_count
+        if count < self.HISTORY_SIZE // 2:
+            state.profile_stable = False
+            state.stability_score = 0.0
             return
 
-        # Calculate coefficient of variation
-        if HAS_NUMPY:
-            f0_arr = np.array(self.state.f0_history)
-            mean_f0 = np.mean(f0_arr)
-            std_f0 = np.std(f0_arr)
-        else:
-            mean_f0 = sum(self.state.f0_history) / len(self.state.f0_history)
-            variance = sum((x - mean_f0) ** 2 for x in self.state.f0_history) / len(self.state.f0_history)
-            std_f0 = math.sqrt(variance)
+        # Calculate coefficient of variation from the running sums
+        mean_f0 = state.f0_sum / count
+        variance = state.f0_sqsum / count - mean_f0 * mean_f0
+        std_f0 = math.sqrt(max(variance, 0.0))
 
         if mean_f0 > 0:
             cv = std_f0 / mean_f0
-            self.state.stability_score = max(0, 1 - cv / self.STABILITY_THRESHOLD)
-            self.state.profile_stable = cv < self.STABILITY_THRESHOLD
-
-    def _compute_adjustments(self):
-        """Compute dynamic pitch and formant adjustments"""
-        target = self.profile
-
-        # === Pitch Adjustment ===
-        if target.lock_pitch and self.state.avg_f0 > 0:
-            # Calculate semitones needed to reach target F0
-            # semitones = 12 * log2(target_f0 / current_f0)
-            ratio = target.f0_hz / self.state.avg_f0
-            if ratio > 0:
-                raw_semitones = 12 * math.log2(ratio)
-
-                # Apply smoothing
-                smoothing = target.smoothing
-                new_pitch = smoothing * self.state.pitch_adjustment + (1 - smoothing) * raw_semitones
-
-                # Clamp to reasonable range
-                new_pitch = max(-12, min(12, new_pitch))
-
-                # Only update if change is significant
-                if abs(new_pitch - self.state.pitch_adjustment) > 0.1:
-                    self.state.pitch_adjustment = new_pitch
-                    self.state.adjustments_made += 1
-
-        # === Formant Adjustment ===
-        if target.lock_formants and self.state.avg_f1 > 0:
-            # Calculate formant ratio needed to reach target
-            # Using F1 as primary reference
-            raw_ratio = target.f1_hz / self.state.avg_f1
-
-            # Apply smoothing
-            smoothing = target.smoothing
-            new_ratio = smoothing * self.state.formant_ratio + (1 - smoothing) * raw_ratio
-
-            # Clamp to reasonable range
-            new_ratio = max(0.5, min(2.0, new_ratio))
+            state.stability_score = max(0, 1 - cv / self.STABILITY_THRESHOLD)
+            state.profile_stable = cv < self.STABILITY_THRESHOLD
+
+    def _track_adjustment(self, state: DynamicState):
+        """Record the current adjustment in the history window"""
+        idx = state.adj_write_idx
+        state.adj_pitch[idx] = state.pitch_adjustment
+        state.adj_formant[idx] = state.formant_ratio
+        state.adj_time_ns[idx] = time.monotonic_ns()
+        state.adj_write_idx = (idx + 1) % self.HISTORY_SIZE
+        state.adj_count = min(state.adj_count + 1, self.HISTORY_SIZE)
+
+    def get_adjustment_history(self) -> Dict[str, list]:
+        """
+        Get recorded adjustment history (oldest first).
 
-            # Only update if change is significant
-            if abs(new_ratio - self.state.formant_ratio) > 0.02:
-                self.state.formant_ratio = new_ratio
-                self.state.adjustments_made += 1
-
-        # Track adjustment history
-        self.state.adjustment_history.append({
-            'pitch': self.state.pitch_adjustment,
-            'formant': self.state.formant_ratio,
-            'time': time.time(),
-        })
-        if len(self.state.adjustment_history) > self.HISTORY_SIZE:
-            self.state.adjustment_history.pop(0)
+        Only populated when the anonymizer was created with
+        record_history=True. Timestamps are time.monotonic_ns() values.
+        """
+        def snapshot():
+            state = self.state
+            idx, count = state.adj_write_idx, state.adj_count
+            return {
+                'pitch': _ring_ordered(state.adj_pitch, idx, count),
+                'formant': _ring_ordered(state.adj_formant, idx, count),
+                'time_ns': _ring_ordered(state.adj_time_ns, idx, count),
+            }
+        return self._read_consistent(snapshot)
 
-    def _get_static_params(self) -> Dict[str, Any]:
+    def _get_static_params(self) -> Mapping[str, Any]:
         """Get static (non-adaptive) parameters"""
-        return {
+        return MappingProxyType({
             'pitch_semitones': self._base_pitch,
             'formant_ratio': self._base_formant,
             'dynamic_enabled': False,
-        }
+        })
 
-    def _get_current_params(self) -> Dict[str, Any]:
+    def _get_current_params(self) -> Mapping[str, Any]:
         """Get current computed parameters"""
+        state = self.state
+
         # Combine base params with dynamic adjustments
-        total_pitch = self._base_pitch + self.state.pitch_adjustment
-        total_formant = self._base_formant * self.state.formant_ratio
+        total_pitch = self._base_pitch + state.pitch_adjustment
+        total_formant = self._base_formant * state.formant_ratio
 
         # Apply variation limit
-        limit = self.profile.variation_limit
-        if self.state.profile_stable:
-            # When stable, allow full adjustment
-            pass
-        else:
+        if not state.profile_stable:
             # When unstable, limit rapid changes
-            total_pitch = max(-6, min(6, total_pitch))
-            total_formant = max(0.8, min(1.3, total_formant))
+            total_pitch = _clamp_py(total_pitch, -6.0, 6.0)
+            total_formant = _clamp_py(total_formant, 0.8, 1.3)
 
-        return {
+        # Read-only, so the caller and the callback can share it
+        return MappingProxyType({
             'pitch_semitones': total_pitch,
             'formant_ratio': total_formant,
             'dynamic_enabled': True,
-            'stability_score': self.state.stability_score,
-            'profile_stable': self.state.profile_stable,
-            'samples_analyzed': self.state.samples_analyzed,
-            'adjustments_made': self.state.adjustments_made,
-        }
-
-    def get_state(self) -> Dict[str, Any]:
-        """Get full dynamic state"""
-        with self._lock:
-            return {
-                'target_profile': self.target_type.value,
-                'target_f0': self.profile.f0_hz,
-                'target_f1': self.profile.f1_hz,
-                'current_f0': self.state.current_f0,
-                'current_f1': self.state.current_f1,
-                'avg_f0': self.state.avg_f0,
-                'avg_f1': self.state.avg_f1,
-                'pitch_adjustment': self.state.pitch_adjustment,
-                'formant_ratio': self.state.formant_ratio,
-                'samples_analyzed': self.state.samples_analyzed,
-                'adjustments_made': self.state.adjustments_made,
-                'profile_stable': self.state.profile_stable,
-                'stability_score': self.state.stability_score,
-                'running': self._running,
-            }
+            'stability_score': state.stability_score,
+            'profile_stable': state.profile_stable,
+            'samples_analyzed': state.samples_analyzed,
+            'adjustments_made': state.adjustments_made,
+        })
+
+    def _read_consistent(self, snapshot: Callable[[], Any]) -> Any:
+        """Take a snapshot that no concurrent state update has torn"""
+        while True:
+            seq = self._seq
+            if not seq & 1:
+                result = snapshot()
+                if self._seq == seq:
+                    return result
+            # Writer mid-update - yield and retry
+            time.sleep(0)
+
+    def _state_snapshot(self) -> Mapping[str, Any]:
+        """Build a read-only snapshot of the current state"""
+        state = self.state
+        profile = self.profile
+        return MappingProxyType({
+            'target_profile': self.target_type.value,
+            'target_f0': profile.f0_hz,
+            'target_f1': profile.f1_hz,
+            'current_f0': state.current_f0,
+            'current_f1': state.current_f1,
+            'avg_f0': state.avg_f0,
+            'avg_f1': state.avg_f1,
+            'pitch_adjustment': state.pitch_adjustment,
+            'formant_ratio': state.formant_ratio,
+            'samples_analyzed': state.samples_analyzed,
+            'adjustments_made': state.adjustments_made,
+            'profile_stable': state.profile_stable,
+            'stability_score': state.stability_score,
+            'running': self._running,
+        })
+
+    def get_state(self) -> Mapping[str, Any]:
+        """
+        Get full dynamic state.
+
+        Returns a read-only snapshot as of the last update. It never
+        changes afterwards; call again for fresh state.
+        """
+        if self._state_dirty:
+            # _lock keeps out control-thread swaps and other readers (so an
+            # older snapshot can't replace a newer one); the seqlock retries
+            # around a concurrent process_telemetry
+            with self._lock:
+                if self._state_dirty:
+                    self._state_dirty = False
+                    self._state_view = self._read_consistent(self._state_snapshot)
+        return self._state_view
 
     def set_base_params(self, pitch: float = 0.0, formant: float = 1.0):
         """Set base parameters that dynamic adjustments are applied on top of"""
@@ -18,19 +18,28 @@ Improvements in v1.1:
 import os
 import sys
 import fcntl
+import json
 import struct
 import socket
 import logging
 import asyncio
+import time
 from enum import IntEnum
-from dataclasses import dataclass, field
-from typing import Optional, Callable, List, Dict, Any
+from dataclasses import dataclass, field, fields, replace
+from typing import Optional, Callable, List, Dict, Any, Tuple
 from pathlib import Path
 import threading
-import ctypes
 
 logger = logging.getLogger(__name__)
 
+# NumPy is optional; only used to expose telemetry feature arrays
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
 # ============================================================================
 # Constants (must match kernel header dsmil_audio_fvoas.h)
 # ============================================================================
@@ -56,7 +65,7 @@ def _IOWR(type_: int, nr: int, size: int) -> int:
 
 
 # Structure sizes (must match C structs with proper padding)
-SIZEOF_OBFUSCATION_PARAMS = 24  # 4+4+4+4+4+1+1+6 = 24
+SIZEOF_OBFUSCATION_PARAMS = 24  # 4+4+4+4+4+1+1+1+1 = 24
 SIZEOF_DEVICE_STATE = 8 + SIZEOF_OBFUSCATION_PARAMS  # 1+1+1+1+4 + params = 32
 SIZEOF_TELEMETRY = 240  # Match kernel struct
 
@@ -75,6 +84,13 @@ FVOAS_IOC_VERIFY_CLEARANCE = _IOR(FVOAS_IOC_MAGIC, 0x40, 4)
 Q16_16_SCALE = 65536  # 2^16
 Q8_8_SCALE = 256      # 2^8
 
+# Precompiled struct layouts (avoid re-parsing format strings per ioctl).
+# A ctypes.Structure view over the ioctl buffer was measured as slower:
+# each ctypes field read costs more than one unpack_from of the header.
+_PARAMS_STRUCT = struct.Struct('<iIIIIBBBx')        # 24 bytes, 1-byte padding
+_STATE_HDR_STRUCT = struct.Struct('<BBBBI')         # 1+1+1+1+4 = 8 bytes
+_TELEM_HDR_STRUCT = struct.Struct('<QIIIIIIIIBB6x')  # 48 bytes
+
 
 class ObfuscationMode(IntEnum):
     """Voice obfuscation modes"""
@@ -98,6 +114,16 @@ class ThreatType(IntEnum):
     COMBINED = 6
 
 
+# Members indexed by value, so parsing avoids IntEnum construction
+_MODES = tuple(ObfuscationMode)
+_THREAT_TYPES = tuple(ThreatType)
+
+# Pre-serialised payloads for the single-value control ioctls
+_BYTE_TRUE = b'\x01'
+_BYTE_FALSE = b'\x00'
+_MODE_PACKED = {m: struct.pack('<I', m.value) for m in ObfuscationMode}
+
+
 @dataclass
 class ObfuscationParams:
     """Voice obfuscation parameters"""
@@ -110,25 +136,27 @@ class ObfuscationParams:
     compression_enabled: bool = False
     dynamic_enabled: bool = False     # Dynamic adaptation on/off
 
-    def to_bytes(self) -> bytes:
-        """Convert to kernel struct format (24 bytes)"""
-        pitch_fixed = int(self.pitch_semitones * Q8_8_SCALE)
-        formant_fixed = int(self.formant_ratio * Q16_16_SCALE)
-        reverb_fixed = int(self.reverb_wet * Q16_16_SCALE)
-        echo_fixed = int(self.echo_wet * Q16_16_SCALE)
-
-        return struct.pack(
-            '<iIIIIBBB5x',  # little-endian, with 5-byte padding
-            pitch_fixed,
-            formant_fixed,
-            reverb_fixed,
-            echo_fixed,
+    def _packed_fields(self) -> tuple:
+        """Field values in kernel struct order and fixed-point form"""
+        return (
+            int(self.pitch_semitones * Q8_8_SCALE),
+            int(self.formant_ratio * Q16_16_SCALE),
+            int(self.reverb_wet * Q16_16_SCALE),
+            int(self.echo_wet * Q16_16_SCALE),
             self.echo_delay_ms,
             1 if self.noise_gate_enabled else 0,
             1 if self.compression_enabled else 0,
             1 if self.dynamic_enabled else 0,
         )
 
+    def to_bytes(self) -> bytes:
+        """Convert to kernel struct format (24 bytes)"""
+        return _PARAMS_STRUCT.pack(*self._packed_fields())
+
+    def pack_into(self, buf: bytearray, offset: int = 0):
+        """Write kernel struct format into buf at offset (24 bytes)"""
+        _PARAMS_STRUCT.pack_into(buf, offset, *self._packed_fields())
+
     @classmethod
     def from_bytes(cls, data: bytes) -> 'ObfuscationParams':
         """Parse from kernel struct format"""
@@ -136,9 +164,7 @@ class ObfuscationParams:
             raise ValueError(f"Expected 24 bytes, got {len(data)}")
 
         (pitch_fixed, formant_fixed, reverb_fixed, echo_fixed,
-         echo_delay_ms, noise_gate, compression, dynamic) = struct.unpack(
-            '<iIIIIBBB5x', data[:24]
-        )
+         echo_delay_ms, noise_gate, compression, dynamic) = _PARAMS_STRUCT.unpack_from(data, 0)
 
         return cls(
             pitch_semitones=pitch_fixed / Q8_8_SCALE,
@@ -162,17 +188,24 @@ class DeviceState:
     mode: ObfuscationMode = ObfuscationMode.BYPASS
     params: ObfuscationParams = field(default_factory=ObfuscationParams)
 
-    def to_bytes(self) -> bytes:
-        """Convert to kernel struct format (32 bytes)"""
-        header = struct.pack(
-            '<BBBBI',  # 1+1+1+1+4 = 8 bytes
+    def _packed_header(self) -> tuple:
+        """Header values in kernel struct order"""
+        return (
             1 if self.enabled else 0,
             1 if self.bypass else 0,
             1 if self.telemetry_enabled else 0,
             1 if self.analysis_enabled else 0,
             self.mode.value,
         )
-        return header + self.params.to_bytes()
+
+    def to_bytes(self) -> bytes:
+        """Convert to kernel struct format (32 bytes)"""
+        return _STATE_HDR_STRUCT.pack(*self._packed_header()) + self.params.to_bytes()
+
+    def pack_into(self, buf: bytearray, offset: int = 0):
+        """Write kernel struct format into buf at offset (32 bytes)"""
+        _STATE_HDR_STRUCT.pack_into(buf, offset, *self._packed_header())
+        self.params.pack_into(buf, offset + _STATE_HDR_STRUCT.size)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> 'DeviceState':
@@ -180,76 +213,115 @@ class DeviceState:
         if len(data) < 32:
             raise ValueError(f"Expected 32 bytes, got {len(data)}")
 
-        (enabled, bypass, telemetry, analysis, mode) = struct.unpack(
-            '<BBBBI', data[:8]
-        )
+        (enabled, bypass, telemetry, analysis, mode) = _STATE_HDR_STRUCT.unpack_from(data, 0)
 
         return cls(
             enabled=bool(enabled),
             bypass=bool(bypass),
             telemetry_enabled=bool(telemetry),
             analysis_enabled=bool(analysis),
-            mode=ObfuscationMode(mode),
+            mode=_MODES[mode] if mode < len(_MODES) else ObfuscationMode(mode),
             params=ObfuscationParams.from_bytes(data[8:]),
         )
 
 
 @dataclass
 class KernelTelemetry:
-    """Raw telemetry from kernel driver"""
+    """
+    Raw telemetry from kernel driver.
+
+    Frequency and confidence values are kept in the kernel's Q16.16
+    fixed-point form and only converted to float when read.
+    """
     timestamp_ns: int = 0
     sample_rate: int = 48000
     buffer_level: int = 0
-    f0_hz: float = 0.0
-    formant_f1_hz: float = 0.0
-    formant_f2_hz: float = 0.0
-    formant_f3_hz: float = 0.0
-    manipulation_confidence: float = 0.0
-    ai_voice_probability: float = 0.0
+    f0_fixed: int = 0
+    f1_fixed: int = 0
+    f2_fixed: int = 0
+    f3_fixed: int = 0
+    manipulation_fixed: int = 0
+    ai_probability_fixed: int = 0
     threat_detected: bool = False
-    threat_type: ThreatType = ThreatType.NONE
+    threat_type_raw: int = 0
     mel_features: bytes = b''
     phase_features: bytes = b''
 
     @classmethod
     def from_bytes(cls, data: bytes) -> 'KernelTelemetry':
         """Parse from kernel struct format"""
+        return cls().update_from_bytes(data)
+
+    def update_from_bytes(self, data: bytes) -> 'KernelTelemetry':
+        """Parse from kernel struct format, overwriting this instance"""
         if len(data) < 48:
             raise ValueError(f"Expected at least 48 bytes, got {len(data)}")
 
         # Parse header (48 bytes)
-        (timestamp_ns, sample_rate, buffer_level,
-         f0_fixed, f1_fixed, f2_fixed, f3_fixed,
-         manip_fixed, ai_fixed,
-         threat_detected, threat_type) = struct.unpack(
-            '<QIIIIIIIBB6x', data[:48]
-        )
+        (self.timestamp_ns, self.sample_rate, self.buffer_level,
+         self.f0_fixed, self.f1_fixed, self.f2_fixed, self.f3_fixed,
+         self.manipulation_fixed, self.ai_probability_fixed,
+         threat_detected, self.threat_type_raw) = _TELEM_HDR_STRUCT.unpack_from(data, 0)
+        self.threat_detected = bool(threat_detected)
+
+        # Extract feature arrays if present (copied out, since data may be
+        # a view onto a reused ioctl buffer)
+        self.mel_features = bytes(data[48:176]) if len(data) >= 176 else b''
+        self.phase_features = bytes(data[176:240]) if len(data) >= 240 else b''
+        return self
 
-        # Extract feature arrays if present
-        mel_features = data[48:176] if len(data) >= 176 else b''
-        phase_features = data[176:240] if len(data) >= 240 else b''
+    @property
+    def f0_hz(self) -> float:
+        return self.f0_fixed / Q16_16_SCALE
 
-        return cls(
-            timestamp_ns=timestamp_ns,
-            sample_rate=sample_rate,
-            buffer_level=buffer_level,
-            f0_hz=f0_fixed / Q16_16_SCALE,
-            formant_f1_hz=f1_fixed / Q16_16_SCALE,
-            formant_f2_hz=f2_fixed / Q16_16_SCALE,
-            formant_f3_hz=f3_fixed / Q16_16_SCALE,
-            manipulation_confidence=manip_fixed / Q16_16_SCALE,
-            ai_voice_probability=ai_fixed / Q16_16_SCALE,
-            threat_detected=bool(threat_detected),
-            threat_type=ThreatType(threat_type) if threat_type < len(ThreatType) else ThreatType.NONE,
-            mel_features=mel_features,
-            phase_features=phase_features,
-        )
+    @property
+    def formant_f1_hz(self) -> float:
+        return self.f1_fixed / Q16_16_SCALE
+
+    @property
+    def formant_f2_hz(self) -> float:
+        return self.f2_fixed / Q16_16_SCALE
+
+    @property
+    def formant_f3_hz(self) -> float:
+        return self.f3_fixed / Q16_16_SCALE
+
+    @property
+    def manipulation_confidence(self) -> float:
+        return self.manipulation_fixed / Q16_16_SCALE
+
+    @property
+    def ai_voice_probability(self) -> float:
+        return self.ai_probability_fixed / Q16_16_SCALE
+
+    @property
+    def threat_type(self) -> ThreatType:
+        raw = self.threat_type_raw
+        return _THREAT_TYPES[raw] if raw < len(_THREAT_TYPES) else ThreatType.NONE
+
+    @property
+    def mel_array(self) -> Optional['np.ndarray']:
+        """Mel features as a read-only float32 view (no copy)"""
+        if not HAS_NUMPY or not self.mel_features:
+            return None
+        return np.frombuffer(self.mel_features, dtype='<f4')
+
+    @property
+    def phase_array(self) -> Optional['np.ndarray']:
+        """Phase features as a read-only float32 view (no copy)"""
+        if not HAS_NUMPY or not self.phase_features:
+            return None
+        return np.frombuffer(self.phase_features, dtype='<f4')
 
     @classmethod
     def empty(cls) -> 'KernelTelemetry':
         """Create empty telemetry (for software fallback)"""
-        import time
-        return cls(timestamp_ns=int(time.time() * 1e9))
+        return cls(timestamp_ns=time.time_ns())
+
+
+# Field names accepted by FVOASKernelInterface.apply()
+_STATE_FIELDS = frozenset(f.name for f in fields(DeviceState))
+_PARAMS_FIELDS = frozenset(f.name for f in fields(ObfuscationParams))
 
 
 class FVOASKernelInterface:
@@ -269,6 +341,26 @@ class FVOASKernelInterface:
         self._software_mode = False
         self._simulated_state = DeviceState()
 
+        # Per-thread preallocated ioctl buffers, keyed by size. The kernel
+        # serialises ioctls per fd, and since no buffer is shared between
+        # threads the ioctls themselves run outside any userspace lock.
+        self._tls = threading.local()
+
+        # ioctls in flight on self.fd; close() waits for them to finish so
+        # the fd is never closed (and its number reused) under a running call
+        self._fd_users = 0
+        self._fd_idle = threading.Condition(self._lock)
+
+        # Lazily opened sysfs attribute fds, keyed by (attr, open flags)
+        self._sysfs_fds: Dict[tuple, int] = {}
+
+        # Short-lived cache of the device state so polling callers don't
+        # issue a GET_STATE per read; set_* calls write through to it and
+        # skip the ioctl when it already holds the requested value
+        self._state_cache: Optional[DeviceState] = None
+        self._state_cache_ts = 0.0
+        self._cache_ttl = 0.05
+
     def open(self) -> bool:
         """Open connection to kernel driver with robust error handling"""
         try:
@@ -278,17 +370,17 @@ class FVOASKernelInterface:
                     # Verify device is actually accessible
                     try:
                         test_state = self.get_state()
-                        logger.info(f"Opened FVOAS device: {FVOAS_DEVICE_PATH}")
+                        logger.info("Opened FVOAS device: %s", FVOAS_DEVICE_PATH)
                         return True
                     except (OSError, IOError, ValueError) as e:
-                        logger.warning(f"Device opened but not functional: {e}")
+                        logger.warning("Device opened but not functional: %s", e)
                         try:
                             os.close(self.fd)
                         except OSError:
                             pass
                         self.fd = None
                 except (OSError, IOError, PermissionError) as e:
-                    logger.warning(f"Failed to open FVOAS device: {e}")
+                    logger.warning("Failed to open FVOAS device: %s", e)
                     if self.fd is not None:
                         try:
                             os.close(self.fd)
@@ -296,7 +388,7 @@ class FVOASKernelInterface:
                             pass
                         self.fd = None
         except Exception as e:
-            logger.error(f"Unexpected error opening device: {e}")
+            logger.error("Unexpected error opening device: %s", e)
             if self.fd is not None:
                 try:
                     os.close(self.fd)
@@ -314,7 +406,7 @@ class FVOASKernelInterface:
                     self._software_mode = True
                     return True
             except Exception as e:
-                logger.debug(f"Sysfs test failed: {e}")
+                logger.debug("Sysfs test failed: %s", e)
 
         # Pure software mode
         logger.warning("FVOAS driver not loaded - running in software simulation mode")
@@ -324,12 +416,29 @@ class FVOASKernelInterface:
 
     def close(self):
         """Close connection to kernel driver"""
-        if self.fd is not None:
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self):
+        """Body of close(); the caller holds _lock"""
+        for sysfs_fd in self._sysfs_fds.values():
             try:
-                os.close(self.fd)
+                os.close(sysfs_fd)
             except OSError:
                 pass
+        self._sysfs_fds.clear()
+
+        fd = self.fd
+        if fd is not None:
+            # New ioctls see no fd from here; wait out the ones in flight
             self.fd = None
+            while self._fd_users:
+                self._fd_idle.wait()
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+            self._state_cache = None
             logger.info("Closed FVOAS device")
 
     @property
@@ -337,122 +446,262 @@ class FVOASKernelInterface:
         """Check if using hardware driver"""
         return self.fd is not None and not self._software_mode
 
-    def _ioctl(self, cmd: int, data: bytes = b'', size: int = 0) -> bytes:
-        """Execute ioctl on device with robust error handling"""
-        if self.fd is None:
+    def _ioctl_into(self, cmd: int, buf: bytearray) -> memoryview:
+        """
+        Execute ioctl in place on a preallocated buffer.
+
+        The kernel reads from / writes straight into buf, so there is no
+        per-call allocation or bytes() copy. Buffers are zeroed once when
+        created and never re-zeroed: reads are fully overwritten by the
+        kernel and write payloads fill the whole struct. buf must belong
+        to the calling thread (see _thread_buf) and the returned view is
+        only valid until that thread's next ioctl.
+        """
+        try:
+            issued = self._ioctl_fd(cmd, buf)
+        except (OSError, IOError) as e:
+            if self._ioctl_failed(cmd, e):
+                buf[:] = bytes(len(buf))
+                return memoryview(buf)
+            raise
+        except Exception as e:
+            logger.error("Unexpected ioctl error: %s", e)
+            raise
+
+        if not issued:
             if self._software_mode:
-                # Return empty/default data in software mode
-                buf_size = max(len(data), size, (cmd >> 16) & 0x3FFF)
-                return bytes(buf_size)
+                buf[:] = bytes(len(buf))
+                return memoryview(buf)
             raise RuntimeError("Device not open")
+        return memoryview(buf)
+
+    def _ioctl_fd(self, cmd: int, buf: bytearray) -> bool:
+        """
+        Run one ioctl on the device fd, keeping it open for the call.
 
+        Returns False without issuing anything if the device is closed.
+        """
         with self._lock:
-            # Determine buffer size
-            buf_size = max(len(data), size, (cmd >> 16) & 0x3FFF)
-            buf = bytearray(buf_size)
-            if data:
-                buf[:len(data)] = data
+            fd = self.fd
+            if fd is None:
+                return False
+            self._fd_users += 1
+        try:
+            fcntl.ioctl(fd, cmd, buf)
+        finally:
+            with self._lock:
+                self._fd_users -= 1
+                if not self._fd_users:
+                    self._fd_idle.notify_all()
+        return True
 
-            try:
-                fcntl.ioctl(self.fd, cmd, buf)
-                return bytes(buf)
-            except (OSError, IOError) as e:
-                errno = getattr(e, 'errno', None)
-                if errno == 19:  # ENODEV - device removed
-                    logger.error("Device removed during operation")
-                    self.close()
-                    self._software_mode = True
-                elif errno == 5:  # EIO - I/O error
-                    logger.error("I/O error during ioctl operation")
-                else:
-                    logger.error(f"ioctl 0x{cmd:08x} failed: {e} (errno={errno})")
-                
-                # Fallback to software mode if device fails
-                if not self._software_mode:
-                    logger.warning("Falling back to software simulation mode")
-                    self._software_mode = True
-                    buf_size = max(len(data), size, (cmd >> 16) & 0x3FFF)
-                    return bytes(buf_size)
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected ioctl error: {e}")
-                raise
+    def _thread_buf(self, size: int) -> bytearray:
+        """Return the calling thread's reusable ioctl buffer of this size"""
+        try:
+            bufs = self._tls.bufs
+        except AttributeError:
+            bufs = self._tls.bufs = {}
+        buf = bufs.get(size)
+        if buf is None:
+            buf = bufs[size] = bytearray(size)
+        return buf
+
+    def _ioctl_failed(self, cmd: int, e: Exception) -> bool:
+        """Log an ioctl failure; returns True if we fell back to software mode"""
+        # Only the failure path mutates shared state, so only it locks
+        with self._lock:
+            errno = getattr(e, 'errno', None)
+            if errno == 19:  # ENODEV - device removed
+                logger.error("Device removed during operation")
+                # Switch first: callers that find the fd gone while close()
+                # waits out in-flight ioctls then take the software path
+                self._software_mode = True
+                self._close_locked()
+            elif errno == 5:  # EIO - I/O error
+                logger.error("I/O error during ioctl operation")
+            else:
+                logger.error("ioctl 0x%08x failed: %s (errno=%s)", cmd, e, errno)
+
+            # Fallback to software mode if device fails
+            if not self._software_mode:
+                logger.warning("Falling back to software simulation mode")
+                self._software_mode = True
+                return True
+            return False
 
     def get_state(self) -> DeviceState:
-        """Get current device state"""
+        """
+        Get current device state (may be served from the short-lived cache).
+
+        Returns a copy, so callers can modify it and pass it back to
+        set_state() without touching the cache the no-op checks read.
+        """
         if self._software_mode:
             return self._simulated_state
 
-        data = self._ioctl(FVOAS_IOC_GET_STATE, size=SIZEOF_DEVICE_STATE)
-        return DeviceState.from_bytes(data)
+        cached = self._cached_state()
+        if cached is not None:
+            return replace(cached, params=replace(cached.params))
+        return self._read_state()
+
+    def _read_state(self) -> DeviceState:
+        """GET_STATE from the driver, refreshing the cache; returns a copy"""
+        data = self._ioctl_into(FVOAS_IOC_GET_STATE,
+                                self._thread_buf(SIZEOF_DEVICE_STATE))
+        state = DeviceState.from_bytes(data)
+        self._state_cache = state
+        self._state_cache_ts = time.monotonic()
+        return replace(state, params=replace(state.params))
+
+    def _cached_state(self) -> Optional[DeviceState]:
+        """Return the cached state if it is still within the TTL"""
+        if (self._state_cache is not None
+                and time.monotonic() - self._state_cache_ts < self._cache_ttl):
+            return self._state_cache
+        return None
+
+    def _update_cache(self, **changes):
+        """Write changes through to the cached state, if any"""
+        if self._state_cache is not None:
+            self._state_cache = replace(self._state_cache, **changes)
 
     def set_state(self, state: DeviceState):
         """Set device state with error recovery"""
         if self._software_mode:
             self._simulated_state = state
-            logger.debug(f"[SIM] Set state: mode={state.mode.name}, bypass={state.bypass}")
+            logger.debug("[SIM] Set state: mode=%s, bypass=%s", state.mode.name, state.bypass)
             return
 
         try:
-            self._ioctl(FVOAS_IOC_SET_STATE, state.to_bytes())
-            logger.info(f"Set state: mode={state.mode.name}, bypass={state.bypass}")
+            buf = self._thread_buf(SIZEOF_DEVICE_STATE)
+            state.pack_into(buf)
+            self._ioctl_into(FVOAS_IOC_SET_STATE, buf)
+            # Cache a copy: the caller may go on mutating its objects
+            self._state_cache = replace(state, params=replace(state.params))
+            self._state_cache_ts = time.monotonic()
+            logger.info("Set state: mode=%s, bypass=%s", state.mode.name, state.bypass)
         except (OSError, IOError, RuntimeError) as e:
-            logger.warning(f"Failed to set state via ioctl: {e}, using software mode")
+            logger.warning("Failed to set state via ioctl: %s, using software mode", e)
             self._software_mode = True
             self._simulated_state = state
-            logger.info(f"[SIM] Set state: mode={state.mode.name}, bypass={state.bypass}")
+            logger.info("[SIM] Set state: mode=%s, bypass=%s", state.mode.name, state.bypass)
+
+    def apply(self, updates: Dict[str, Any]) -> DeviceState:
+        """
+        Apply several state changes with a single SET_STATE ioctl.
+
+        Prefer this over back-to-back set_mode/set_params/set_bypass calls,
+        which each cost a lock round-trip and a syscall. The updates are
+        merged into a fresh GET_STATE rather than the cached state, so
+        fields changed behind the cache (enabled, bypass, ...) are not
+        written back with stale values.
+
+        Args:
+            updates: DeviceState field names (enabled, bypass, mode, params, ...)
+                and/or ObfuscationParams field names (pitch_semitones, ...)
+
+        Returns:
+            The state that was written
+        """
+        if self._software_mode:
+            current = self._simulated_state
+            state = replace(current, params=replace(current.params))
+        else:
+            state = self._read_state()
+
+        for key, value in updates.items():
+            if key in _STATE_FIELDS:
+                if key == 'mode':
+                    value = ObfuscationMode(value)
+                elif key == 'params':
+                    value = replace(value)
+                setattr(state, key, value)
+            elif key in _PARAMS_FIELDS:
+                setattr(state.params, key, value)
+            else:
+                raise ValueError(f"Unknown state field: {key}")
+
+        self.set_state(state)
+        return state
 
     def get_params(self) -> ObfuscationParams:
         """Get current obfuscation parameters"""
         if self._software_mode:
             return self._simulated_state.params
 
-        data = self._ioctl(FVOAS_IOC_GET_PARAMS, size=SIZEOF_OBFUSCATION_PARAMS)
+        cached = self._cached_state()
+        if cached is not None:
+            return replace(cached.params)
+
+        data = self._ioctl_into(FVOAS_IOC_GET_PARAMS,
+                                self._thread_buf(SIZEOF_OBFUSCATION_PARAMS))
         return ObfuscationParams.from_bytes(data)
 
     def set_params(self, params: ObfuscationParams):
         """Set obfuscation parameters with error recovery"""
         if self._software_mode:
             self._simulated_state.params = params
-            logger.debug(f"[SIM] Set params: pitch={params.pitch_semitones:.2f}, formant={params.formant_ratio:.2f}")
+            logger.debug("[SIM] Set params: pitch=%.2f, formant=%.2f", params.pitch_semitones, params.formant_ratio)
+            return
+
+        # Only skip against the TTL-bounded cache, so a change made behind
+        # our back (another process, a driver reset) is not masked for long
+        cached = self._cached_state()
+        if cached is not None and cached.params == params:
             return
 
         try:
-            self._ioctl(FVOAS_IOC_SET_PARAMS, params.to_bytes())
-            logger.info(f"Set params: pitch={params.pitch_semitones:.2f}, formant={params.formant_ratio:.2f}")
+            buf = self._thread_buf(SIZEOF_OBFUSCATION_PARAMS)
+            params.pack_into(buf)
+            self._ioctl_into(FVOAS_IOC_SET_PARAMS, buf)
+            self._update_cache(params=replace(params))
+            logger.info("Set params: pitch=%.2f, formant=%.2f", params.pitch_semitones, params.formant_ratio)
         except (OSError, IOError, RuntimeError) as e:
-            logger.warning(f"Failed to set params via ioctl: {e}, using software mode")
+            logger.warning("Failed to set params via ioctl: %s, using software mode", e)
             self._software_mode = True
             self._simulated_state.params = params
-            logger.info(f"[SIM] Set params: pitch={params.pitch_semitones:.2f}, formant={params.formant_ratio:.2f}")
+            logger.info("[SIM] Set params: pitch=%.2f, formant=%.2f", params.pitch_semitones, params.formant_ratio)
 
     def set_mode(self, mode: ObfuscationMode):
         """Set obfuscation mode"""
         if self._software_mode:
             self._simulated_state.mode = mode
-            logger.info(f"[SIM] Set mode: {mode.name}")
+            logger.info("[SIM] Set mode: %s", mode.name)
+            return
+
+        cached = self._cached_state()
+        if cached is not None and cached.mode == mode:
             return
 
-        data = struct.pack('<I', mode.value)
-        self._ioctl(FVOAS_IOC_SET_MODE, data)
-        logger.info(f"Set mode: {mode.name}")
+        buf = self._thread_buf(4)
+        buf[:] = _MODE_PACKED[mode]
+        self._ioctl_into(FVOAS_IOC_SET_MODE, buf)
+        self._update_cache(mode=mode)
+        logger.info("Set mode: %s", mode.name)
 
     def set_bypass(self, enabled: bool):
         """Enable/disable bypass mode"""
         if self._software_mode:
             self._simulated_state.bypass = enabled
-            logger.info(f"[SIM] Bypass: {enabled}")
+            logger.info("[SIM] Bypass: %s", enabled)
+            return
+
+        cached = self._cached_state()
+        if cached is not None and cached.bypass == enabled:
             return
 
         # Try sysfs first (more reliable)
         if self._write_sysfs('bypass', '1' if enabled else '0'):
-            logger.info(f"Bypass: {enabled}")
+            self._update_cache(bypass=enabled)
+            logger.info("Bypass: %s", enabled)
             return
 
         # Fallback to ioctl
-        data = struct.pack('<B', 1 if enabled else 0)
-        self._ioctl(FVOAS_IOC_SET_BYPASS, data)
-        logger.info(f"Bypass: {enabled}")
+        buf = self._thread_buf(1)
+        buf[:] = _BYTE_TRUE if enabled else _BYTE_FALSE
+        self._ioctl_into(FVOAS_IOC_SET_BYPASS, buf)
+        self._update_cache(bypass=enabled)
+        logger.info("Bypass: %s", enabled)
 
     def set_telemetry(self, enabled: bool):
         """Enable/disable telemetry"""
@@ -460,53 +709,103 @@ class FVOASKernelInterface:
             self._simulated_state.telemetry_enabled = enabled
             return
 
-        data = struct.pack('<B', 1 if enabled else 0)
-        self._ioctl(FVOAS_IOC_SET_TELEMETRY, data)
-        logger.info(f"Telemetry: {enabled}")
+        buf = self._thread_buf(1)
+        buf[:] = _BYTE_TRUE if enabled else _BYTE_FALSE
+        self._ioctl_into(FVOAS_IOC_SET_TELEMETRY, buf)
+        self._update_cache(telemetry_enabled=enabled)
+        logger.info("Telemetry: %s", enabled)
 
     def get_telemetry(self) -> KernelTelemetry:
-        """Get latest telemetry data"""
+        """
+        Get latest telemetry data.
+
+        In hardware mode the returned object is reused by the calling
+        thread's next get_telemetry()/snapshot(); use dataclasses.replace()
+        on it to keep a copy.
+        """
         if self._software_mode:
             return KernelTelemetry.empty()
 
-        data = self._ioctl(FVOAS_IOC_GET_TELEMETRY, size=SIZEOF_TELEMETRY)
-        return KernelTelemetry.from_bytes(data)
+        data = self._ioctl_into(FVOAS_IOC_GET_TELEMETRY,
+                                self._thread_buf(SIZEOF_TELEMETRY))
+        return self._thread_telemetry().update_from_bytes(data)
+
+    def _thread_telemetry(self) -> KernelTelemetry:
+        """Return the calling thread's reusable KernelTelemetry"""
+        try:
+            return self._tls.telem
+        except AttributeError:
+            telem = self._tls.telem = KernelTelemetry()
+            return telem
+
+    def snapshot(self) -> Tuple[DeviceState, KernelTelemetry]:
+        """
+        Get device state and latest telemetry together.
+
+        For monitoring loops that want both every frame. The driver has no
+        composite ioctl yet, so this is two reads back to back; the state
+        half is normally served from the state cache, leaving one ioctl.
+        """
+        if self._software_mode:
+            return self._simulated_state, KernelTelemetry.empty()
+
+        state = self.get_state()
+        data = self._ioctl_into(FVOAS_IOC_GET_TELEMETRY,
+                                self._thread_buf(SIZEOF_TELEMETRY))
+        return state, self._thread_telemetry().update_from_bytes(data)
 
     def verify_clearance(self) -> int:
         """Verify SECRET clearance level"""
         if self._software_mode:
             return 0x03030303  # Simulated clearance
 
-        data = self._ioctl(FVOAS_IOC_VERIFY_CLEARANCE, size=4)
-        clearance, = struct.unpack('<I', data[:4])
+        data = self._ioctl_into(FVOAS_IOC_VERIFY_CLEARANCE, self._thread_buf(4))
+        clearance, = struct.unpack_from('<I', data, 0)
         return clearance
 
     # ========================================================================
     # Sysfs Interface (Fallback)
     # ========================================================================
 
+    def _sysfs_fd(self, attr: str, flags: int) -> int:
+        """Get a cached fd for a sysfs attribute, opening it on first use"""
+        key = (attr, flags)
+        sysfs_fd = self._sysfs_fds.get(key)
+        if sysfs_fd is None:
+            sysfs_fd = os.open(os.path.join(FVOAS_SYSFS_PATH, attr), flags)
+            self._sysfs_fds[key] = sysfs_fd
+        return sysfs_fd
+
+    def _drop_sysfs_fd(self, attr: str, flags: int):
+        """Forget (and close) a cached sysfs fd after an error"""
+        sysfs_fd = self._sysfs_fds.pop((attr, flags), None)
+        if sysfs_fd is not None:
+            try:
+                os.close(sysfs_fd)
+            except OSError:
+                pass
+
     def _read_sysfs(self, attr: str) -> Optional[str]:
         """Read sysfs attribute"""
-        path = os.path.join(FVOAS_SYSFS_PATH, attr)
         try:
-            with open(path, 'r') as f:
-                return f.read().strip()
+            # sysfs regenerates the value on every read at offset 0
+            data = os.pread(self._sysfs_fd(attr, os.O_RDONLY), 4096, 0)
+            return data.decode().strip()
         except (OSError, IOError):
+            self._drop_sysfs_fd(attr, os.O_RDONLY)
             return None
 
     def _write_sysfs(self, attr: str, value: str) -> bool:
         """Write sysfs attribute"""
-        path = os.path.join(FVOAS_SYSFS_PATH, attr)
         try:
-            with open(path, 'w') as f:
-                f.write(value)
+            os.pwrite(self._sysfs_fd(attr, os.O_WRONLY), value.encode(), 0)
             return True
         except (OSError, IOError):
+            self._drop_sysfs_fd(attr, os.O_WRONLY)
             return False
 
     def get_stats_sysfs(self) -> Optional[Dict[str, Any]]:
         """Get statistics via sysfs (JSON)"""
-        import json
         stats_str = self._read_sysfs('stats')
         if stats_str:
             try:
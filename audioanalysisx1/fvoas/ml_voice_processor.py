@@ -32,14 +32,14 @@ class MLVoiceProcessor:
     
     def __init__(self, 
                  model_path: Optional[str] = None,
-                 device: str = "CPU",
+                 device: str = "AUTO",
                  enable_ml: bool = True):
         """
         Initialize ML voice processor.
         
         Args:
             model_path: Path to OpenVINO model
-            device: Inference device (CPU, GPU, VPU)
+            device: Inference device (CPU, GPU, VPU, AUTO)
             enable_ml: Enable ML processing
         """
         self.enable_ml = enable_ml and ML_AVAILABLE
@@ -62,7 +62,8 @@ class MLVoiceProcessor:
     def process_audio(self,
                      audio: np.ndarray,
                      sample_rate: int = 16000,
-                     target_profile: str = "neutral") -> Tuple[np.ndarray, Dict[str, Any]]:
+                     target_profile: str = "neutral",
+                     copy: bool = True) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
         Process audio with ML-based modification.
         
@@ -70,6 +71,8 @@ class MLVoiceProcessor:
             audio: Input audio signal
             sample_rate: Sample rate
             target_profile: Target voice profile
+            copy: On passthrough, return a copy of audio (False returns
+                audio itself, which then aliases the caller's buffer)
             
         Returns:
             Tuple of (modified_audio, metadata)
@@ -82,7 +85,7 @@ class MLVoiceProcessor:
             )
         else:
             # Fallback: return original with metadata
-            return audio.copy(), {
+            return audio.copy() if copy else audio, {
                 'method': 'passthrough',
                 'ml_enabled': False,
             }
@@ -15,26 +15,26 @@ Features:
 Classification: SECRET
 """
 
+from __future__ import annotations
+
+import hashlib
+import importlib.util
 import logging
 import os
+import queue
+import stat
 import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Tuple, List
+from functools import lru_cache
+from math import gcd
+from typing import Optional, Dict, Any, Tuple, List, Iterable, Iterator, Callable
 from pathlib import Path
 import time
 
 logger = logging.getLogger(__name__)
 
-# Try importing OpenVINO
-try:
-    from openvino.runtime import Core, Model
-    from openvino.preprocess import PrePostProcessor
-    import openvino.runtime as ov
-    HAS_OPENVINO = True
-except ImportError:
-    HAS_OPENVINO = False
-    logger.warning("OpenVINO not available. Install with: pip install openvino")
-
 # Try numpy
 try:
     import numpy as np
@@ -44,13 +44,280 @@ except ImportError:
     HAS_NUMPY = False
     logger.warning("NumPy not available")
 
-# Audio processing
+# OpenVINO and librosa are heavy imports (librosa pulls in numba, scipy and
+# soundfile); they are loaded on first use so availability checks and the
+# rule-based fallback stay cheap. HAS_OPENVINO / HAS_LIBROSA resolve lazily
+# through the module __getattr__ below.
+ov = None
+librosa = None
+_ov_checked = False
+_librosa_checked = False
+
+
+def _lazy_ov():
+    """openvino.runtime, imported on first call (None if not installed)"""
+    global ov, _ov_checked
+    if not _ov_checked:
+        _ov_checked = True
+        try:
+            import openvino.runtime as runtime
+            ov = runtime
+        except ImportError:
+            logger.warning("OpenVINO not available. Install with: pip install openvino")
+    return ov
+
+
+def _lazy_librosa():
+    """librosa, imported on first call (None if not installed)"""
+    global librosa, _librosa_checked
+    if not _librosa_checked:
+        _librosa_checked = True
+        try:
+            import librosa as module
+            librosa = module
+        except ImportError:
+            pass
+    return librosa
+
+
+def __getattr__(name):
+    if name == 'HAS_OPENVINO':
+        return _lazy_ov() is not None
+    if name == 'HAS_LIBROSA':
+        return _lazy_librosa() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Resampling backends (preferred over librosa.resample on the hot path)
+try:
+    import soxr
+    HAS_SOXR = True
+except ImportError:
+    soxr = None
+    HAS_SOXR = False
+
 try:
-    import librosa
-    HAS_LIBROSA = True
+    from scipy.fft import next_fast_len
+    from scipy.signal import firwin, resample_poly
+    HAS_SCIPY = True
 except ImportError:
-    librosa = None
-    HAS_LIBROSA = False
+    HAS_SCIPY = False
+
+
+@lru_cache(maxsize=1)
+def _cpu_flags() -> frozenset:
+    """CPU feature flags from /proc/cpuinfo (empty if unavailable)"""
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('flags'):
+                    return frozenset(line.split(':', 1)[1].split())
+    except OSError:
+        pass
+    return frozenset()
+
+
+# Device-name substring -> device kind, in detection priority order
+_DEVICE_PRIORITY = (
+    ('GAUDI', 'GAUDI'),
+    ('HABANA', 'GAUDI'),
+    ('NPU', 'NPU'),
+    ('GPU', 'GPU'),
+    ('VPU', 'VPU'),
+    ('MYRIAD', 'VPU'),
+    ('CPU', 'CPU'),
+)
+
+# Single-device capability presets per kind (unknown devices use CPU)
+_DEVICE_CAPS = {
+    'GAUDI': {'estimated_tops': 1000, 'supports_int8': True, 'supports_fp16': True, 'max_batch_size': 128},
+    'NPU': {'estimated_tops': 200, 'supports_int8': True, 'supports_fp16': True, 'max_batch_size': 64},
+    'GPU': {'estimated_tops': 200, 'supports_int8': True, 'supports_fp16': True, 'max_batch_size': 32},
+    'VPU': {'estimated_tops': 4, 'supports_int8': True, 'supports_fp16': False, 'max_batch_size': 8},
+    'CPU': {'estimated_tops': 10, 'supports_int8': True, 'supports_fp16': False, 'max_batch_size': 16},
+}
+
+# TOPS contributed by each kind inside a MULTI: configuration
+# (CPU counts higher than alone: it gains DMA shared memory)
+_MULTI_TOPS = {'GAUDI': 1000, 'NPU': 200, 'GPU': 200, 'VPU': 4, 'CPU': 50}
+
+# Preference order of device kinds in an AUTO: priority list
+_AUTO_ORDER = ('GAUDI', 'NPU', 'GPU', 'VPU', 'CPU')
+
+
+# In-process LRU of compiled models, so reloading the same model skips even
+# the XML parse. Key: (model file, mtime_ns, device, precision, chunk_samples,
+# batch_size, num_streams, dynamic_length); value: see OpenVINOVoiceModifier._compile()
+_COMPILED_CACHE: OrderedDict = OrderedDict()
+_COMPILED_CACHE_SIZE = 4
+_COMPILED_CACHE_LOCK = threading.Lock()
+
+# Recent inferences kept for get_stats() (per-field ring buffers)
+STATS_WINDOW = 1024
+
+
+def _device_kind(device: str) -> Optional[str]:
+    """Classify an OpenVINO device name (GAUDI/NPU/GPU/VPU/CPU, or None)"""
+    upper = device.upper()
+    return next((kind for key, kind in _DEVICE_PRIORITY if key in upper), None)
+
+
+# YIN threshold on the cumulative-mean-normalized difference (de Cheveigne
+# & Kawahara use 0.1-0.15); frames with no dip below it are unvoiced
+YIN_THRESHOLD = 0.15
+
+# Peak below which a signal is treated as silence (no F0 analysis)
+SILENCE_PEAK = 1e-4
+
+
+def _yin_pick_py(cmnd, min_lag, max_lag, threshold, sample_rate):
+    """
+    F0 in Hz from one frame's cumulative-mean-normalized difference
+    (indexed by lag 0..max_lag), or 0.0 if the frame is unvoiced.
+    """
+    tau = min_lag
+    while tau <= max_lag and cmnd[tau] >= threshold:
+        tau += 1
+    if tau > max_lag:
+        return 0.0
+    # Walk down to the bottom of the dip
+    while tau < max_lag and cmnd[tau + 1] < cmnd[tau]:
+        tau += 1
+    # Parabolic interpolation around the minimum
+    shift = 0.0
+    if tau > 1 and tau < max_lag:
+        a, b, c = cmnd[tau - 1], cmnd[tau], cmnd[tau + 1]
+        denom = a - 2.0 * b + c
+        if denom != 0.0:
+            shift = 0.5 * (a - c) / denom
+    return sample_rate / (tau + shift)
+
+
+def _yin_frames_py(signal, frame_length, hop, min_lag, max_lag, threshold, sample_rate, f0_out):
+    """
+    YIN over frames of signal (one per f0_out entry, hop samples apart).
+    Compiled serially: a handful of frames per call doesn't repay a
+    parallel launch, and numba's default threading layer is not safe
+    for concurrent callers.
+    """
+    window = frame_length - max_lag
+    for f in range(f0_out.shape[0]):
+        start = f * hop
+        cmnd = np.empty(max_lag + 1)
+        cmnd[0] = 1.0
+        running = 0.0
+        for tau in range(1, max_lag + 1):
+            d = 0.0
+            for j in range(start, start + window):
+                diff = signal[j] - signal[j + tau]
+                d += diff * diff
+            running += d
+            cmnd[tau] = d * tau / running if running > 0.0 else 1.0
+        f0_out[f] = _yin_pick(cmnd, min_lag, max_lag, threshold, sample_rate)
+
+
+def _yin_frames_np(signal, frame_length, hop, min_lag, max_lag, threshold, sample_rate, f0_out):
+    """NumPy variant of _yin_frames_py (vectorized over frames), used without numba"""
+    window = frame_length - max_lag
+    starts = np.arange(f0_out.shape[0]) * hop
+    frames = signal[starts[:, None] + np.arange(frame_length)].astype(np.float64)
+    head = frames[:, :window]
+    diff = np.empty((len(starts), max_lag + 1))
+    diff[:, 0] = 0.0
+    for tau in range(1, max_lag + 1):
+        delta = head - frames[:, tau:tau + window]
+        diff[:, tau] = np.einsum('ij,ij->i', delta, delta)
+    running = np.cumsum(diff[:, 1:], axis=1)
+    cmnd = np.ones_like(diff)
+    np.divide(diff[:, 1:] * np.arange(1, max_lag + 1), running, out=cmnd[:, 1:], where=running > 0)
+    for f in range(len(starts)):
+        f0_out[f] = _yin_pick(cmnd[f], min_lag, max_lag, threshold, sample_rate)
+
+
+# numba is as heavy to import as librosa, so the YIN kernel is compiled on
+# first use rather than at import
+_yin_pick = _yin_pick_py
+_yin_frames = None
+_YIN_LOCK = threading.Lock()
+
+
+def _yin_kernel():
+    """Compiled YIN frame kernel (numba, cached on disk), else the NumPy one"""
+    global _yin_frames, _yin_pick
+    with _YIN_LOCK:
+        if _yin_frames is None:
+            try:
+                import numba
+                _yin_pick = numba.njit(cache=True, fastmath=True)(_yin_pick_py)
+                _yin_frames = numba.njit(cache=True, fastmath=True)(_yin_frames_py)
+            except ImportError:
+                _yin_frames = _yin_frames_np
+    return _yin_frames
+
+
+def yin_f0(signal: np.ndarray, sample_rate: int, fmin: float = 50.0, fmax: float = 400.0,
+           frame_length: Optional[int] = None) -> np.ndarray:
+    """
+    F0 track (Hz, 0.0 for unvoiced frames) over non-overlapping frames.
+    
+    Replaces librosa.yin for the coarse F0 this module needs: frames are
+    hopped a full frame apart rather than densely, and silent input
+    returns without analysis.
+    
+    Args:
+        signal: Mono audio signal
+        sample_rate: Sample rate of signal
+        fmin: Lowest F0 searched (Hz)
+        fmax: Highest F0 searched (Hz)
+        frame_length: Analysis frame in samples (default: 4 periods of
+            fmin; shorter input is analysed as a single frame)
+        
+    Returns:
+        float64 array with one F0 estimate per frame
+    """
+    min_lag = max(1, int(sample_rate / fmax))
+    max_lag = int(sample_rate / fmin)
+    if not frame_length:
+        frame_length = 4 * max_lag
+        if max_lag < len(signal) < frame_length:
+            # One frame over the whole chunk, zero-padded up to the least
+            # YIN can work with (a window of one fmin period past max_lag)
+            frame_length = max(len(signal), 2 * max_lag + 1)
+            if len(signal) < frame_length:
+                signal = np.pad(np.asarray(signal, dtype=np.float32),
+                                (0, frame_length - len(signal)))
+    n_frames = (len(signal) - frame_length) // frame_length + 1 if len(signal) >= frame_length else 0
+    f0 = np.zeros(n_frames)
+    if n_frames == 0 or max_lag >= frame_length:
+        return f0
+    
+    signal = np.ascontiguousarray(signal, dtype=np.float32)
+    if max(float(signal.max()), -float(signal.min())) < SILENCE_PEAK:
+        return f0
+    
+    _yin_kernel()(signal, frame_length, frame_length, min_lag, max_lag,
+                  YIN_THRESHOLD, float(sample_rate), f0)
+    return f0
+
+
+def _mark_last(items: Iterable) -> Iterator[Tuple[Any, bool]]:
+    """(item, is_last) pairs, reading one item ahead"""
+    it = iter(items)
+    try:
+        current = next(it)
+    except StopIteration:
+        return
+    for following in it:
+        yield current, False
+        current = following
+    yield current, True
+
+
+def _median_f0(f0: Optional[np.ndarray], default: float = 0.0) -> float:
+    """Median over the voiced frames of an F0 track (default if none)"""
+    if f0 is None:
+        return default
+    voiced = f0[f0 > 0]
+    return float(np.median(voiced)) if voiced.size else default
 
 
 @dataclass
@@ -67,12 +334,15 @@ class MLVoiceProfile:
 @dataclass
 class MLInferenceResult:
     """Result from ML inference"""
+    # float32 in [-1, 1]; for int16 PCM use
+    # np.multiply(modified_audio, 32767).astype(np.int16)
     modified_audio: np.ndarray
     pitch_shift: float  # semitones
     formant_ratio: float
     confidence: float
     processing_time_ms: float
     model_used: str
+    f0_median: float = 0.0  # Input F0 (Hz) from the caller's pre_f0 track, 0.0 if unknown
 
 
 class OpenVINOVoiceModifier:
@@ -96,7 +366,14 @@ class OpenVINOVoiceModifier:
                  precision: str = "INT8",
                  batch_size: int = 1,
                  num_streams: int = 1,
-                 enable_profiling: bool = False):
+                 enable_profiling: bool = False,
+                 calibration_dataset: Optional[Iterable[np.ndarray]] = None,
+                 chunk_samples: Optional[int] = None,
+                 cpu_list: Optional[Iterable[int]] = None,
+                 assume_normalized: bool = False,
+                 cache_dir: Optional[str] = None,
+                 silence_threshold_db: Optional[float] = None,
+                 dynamic_length: Optional[bool] = None):
         """
         Initialize OpenVINO voice modifier with Intel hardware optimization.
         
@@ -104,12 +381,31 @@ class OpenVINOVoiceModifier:
             model_path: Path to OpenVINO model (.xml/.bin) or ONNX model
             device: Inference device (auto-detects best Intel hardware if None)
                    Options: "CPU", "GPU", "NPU", "VPU", "Gaudi", "AUTO"
+                   ("AUTO" hands off to OpenVINO's AUTO plugin, which serves
+                   first inferences on CPU while accelerators compile)
             precision: Model precision (INT8 for max performance, FP16, FP32)
-            batch_size: Batch size for processing (larger = higher throughput)
-            num_streams: Number of inference streams (parallel processing)
+            batch_size: Inputs stacked per infer_batch() request (larger = higher throughput)
+            num_streams: Number of inference streams for infer_batch() (parallel processing)
             enable_profiling: Enable performance profiling
+            calibration_dataset: Small set of preprocessed float32 model
+                   inputs; enables NNCF INT8 quantization when precision="INT8"
+            chunk_samples: Samples per inference at the model rate; dynamic model
+                   inputs are fixed to this length (default: one second)
+            cpu_list: CPUs (e.g. isolated cores) to pin the calling thread to (Linux)
+            assume_normalized: Inputs are already in [-1, 1] (int16 PCM is
+                   scaled by 1/32768); skip per-call peak normalization
+            cache_dir: Directory for OpenVINO's compiled-blob cache and
+                   INT8 weight-compressed IRs, so later processes skip device
+                   compilation and recompression (default: ~/.cache/openvino;
+                   "" disables caching)
+            silence_threshold_db: RMS level (dBFS) below which infer() skips
+                   the model and returns silence (None: always infer)
+            dynamic_length: Compile infer()'s model with a length bounded by
+                   chunk_samples instead of fixed to it, so short frames run at
+                   their own length rather than padded (dynamic-length models
+                   only; default: on for CPU, where bounded shapes are cheap)
         """
-        if not HAS_OPENVINO:
+        if _lazy_ov() is None:
             raise RuntimeError("OpenVINO not installed. Install with: pip install openvino")
         
         if not HAS_NUMPY:
@@ -119,30 +415,86 @@ class OpenVINOVoiceModifier:
         self.batch_size = batch_size
         self.num_streams = num_streams
         self.enable_profiling = enable_profiling
-        
-        self.core = Core() if HAS_OPENVINO else None
+        self.calibration_dataset = calibration_dataset
+        self.assume_normalized = assume_normalized
+        self._dynamic_length_requested = dynamic_length
+        self.dynamic_length = False  # Whether infer()'s model takes exact-length input
+        
+        self.core = ov.Core()
+        
+        # Enable caching for faster subsequent loads (core-wide, set once)
+        if cache_dir is None:
+            cache_dir = str(Path.home() / '.cache' / 'openvino')
+        self.cache_dir = cache_dir or None
+        if self.cache_dir:
+            try:
+                self.core.set_property({'CACHE_DIR': self.cache_dir})
+            except Exception as e:
+                logger.debug(f"Model cache unavailable: {e}")
+                self.cache_dir = None
         self.model = None
         self.compiled_model = None
         self.infer_request = None
-        self._lock = threading.Lock()
+        self._queue = None
+        
+        # infer() runs a batch-1 latency-tuned model; infer_batch() runs a
+        # separate throughput-tuned model taking _batch_rows stacked inputs
+        self._latency_model = None
+        self._throughput_model = None
+        self._batch_rows = 1
+        self._stream_counts: Dict[str, Any] = {}  # Streams OpenVINO actually chose
+        self.load_time_ms = 0.0  # Last load_model() wall time (cache hits show here)
+        self._int8_compress = False  # Load with INT8 weight compression
+        self._int8_ir: Optional[Path] = None  # Cached compressed IR (under cache_dir)
+        self._lock = threading.Lock()  # Guards the inference counters
+        self._batch_lock = threading.Lock()  # One infer_batch() on _queue at a time
+        
+        # Idle infer() slots: (request, input buffer, output buffer). Buffers
+        # are bound to the request as shared tensors; output is None when
+        # binding isn't possible
+        self._request_pool = queue.SimpleQueue()
+        
+        if cpu_list is not None:
+            self._pin_calling_thread(cpu_list)
         
         # Auto-detect best Intel hardware
-        if device is None or device == "AUTO":
+        if device is None:
             self.device = self._detect_best_device()
+        elif device.upper() == "AUTO":
+            self.device = self._auto_device()
         else:
             self.device = device
+        self.execution_devices = self.device  # What AUTO actually picked, once loaded
         
         # Model configuration
         self.input_shape = None
         self.output_shape = None
         self.sample_rate = 16000  # Default model sample rate
-        
-        # Performance tracking
-        self.inference_times = []
+        self.chunk_samples = chunk_samples or self.sample_rate
+        
+        # Performance tracking: one ring-buffer row per field (time ms,
+        # pitch shift, formant ratio, confidence) over the last STATS_WINDOW
+        # inferences, so get_stats() reduces each field in one vector op
+        self._history = np.zeros((4, STATS_WINDOW), dtype=np.float32)
+        self._history_len = 0
+        self._history_pos = 0
+        self._total_time_ms = 0.0  # All inferences, paired with total_ops
         self.total_inferences = 0
         self.total_ops = 0  # Track operations for TOPS calculation
+        self.silence_skipped = 0
+        self._fallback_logged = False  # Fallback mode is logged once, not per call
+        
+        # Energy gate: mean-square level (full scale = 1.0) of frames that
+        # skip inference
+        self._silence_ms = None if silence_threshold_db is None else 10.0 ** (silence_threshold_db / 10.0)
         self.profiling_data = []
         
+        # Polyphase resampling (up, down, FIR) per input rate, built once
+        self._resample_filters: Dict[int, Tuple[int, int, np.ndarray]] = {}
+        
+        # Resamples infer_batch() inputs in parallel (created on first use)
+        self._prep_pool = None
+        
         # Intel hardware capabilities
         self.device_capabilities = self._get_device_capabilities()
         
@@ -163,6 +515,18 @@ class OpenVINOVoiceModifier:
             if dma_enabled:
                 logger.info("DMA shared memory: ENABLED (zero-copy data transfer)")
     
+    @staticmethod
+    def _pin_calling_thread(cpu_list: Iterable[int]):
+        """Restrict the calling thread to cpu_list (no-op where unsupported)"""
+        if not hasattr(os, 'sched_setaffinity'):
+            logger.warning("CPU affinity not supported on this platform; cpu_list ignored")
+            return
+        try:
+            os.sched_setaffinity(0, set(cpu_list))
+            logger.info(f"Pinned inference thread to CPUs {sorted(set(cpu_list))}")
+        except OSError as e:
+            logger.warning(f"Could not pin to CPUs {cpu_list}: {e}")
+    
     def _detect_best_device(self) -> str:
         """
         Auto-detect best available Intel hardware configuration.
@@ -177,27 +541,18 @@ class OpenVINOVoiceModifier:
         if not self.core:
             return "CPU"
         
-        available = self.core.available_devices
-        
-        # Collect available Intel devices
-        vpus = []
-        gpus = []
-        npus = []
-        gaudis = []
-        cpus = []
-        
-        for device in available:
-            device_upper = device.upper()
-            if 'GAUDI' in device_upper or 'HABANA' in device_upper:
-                gaudis.append(device)
-            elif 'NPU' in device_upper:
-                npus.append(device)
-            elif 'GPU' in device_upper:
-                gpus.append(device)
-            elif 'VPU' in device_upper or 'MYRIAD' in device_upper:
-                vpus.append(device)
-            elif 'CPU' in device_upper:
-                cpus.append(device)
+        # Collect available Intel devices (classified in one pass)
+        found: Dict[str, List[str]] = {kind: [] for kind in _DEVICE_CAPS}
+        for device in self.core.available_devices:
+            kind = _device_kind(device)
+            if kind:
+                found[kind].append(device)
+        
+        vpus = found['VPU']
+        gpus = found['GPU']
+        npus = found['NPU']
+        gaudis = found['GAUDI']
+        cpus = found['CPU']
         
         # Strategy 1: Combine multiple Movidius VPUs + Arc GPU + CPU (1000+ TOPS)
         if len(vpus) >= 2 and gpus and cpus:
@@ -243,6 +598,28 @@ class OpenVINOVoiceModifier:
         logger.info("Using CPU (no specialized Intel hardware detected)")
         return "CPU"
     
+    def _priority_available_devices(self) -> List[str]:
+        """Available devices of known kinds, most preferred first"""
+        ranked = []
+        for device in self.core.available_devices:
+            kind = _device_kind(device)
+            if kind in _AUTO_ORDER:
+                ranked.append((_AUTO_ORDER.index(kind), device))
+        return [device for _, device in sorted(ranked, key=lambda r: r[0])]
+    
+    def _auto_device(self) -> str:
+        """AUTO:<priority list> device string (the device itself if only one is found)"""
+        devices = self._priority_available_devices()
+        if not devices:
+            return "CPU"
+        if len(devices) == 1:
+            # Nothing to choose between: compile for the device directly so
+            # its device-specific tuning (e.g. CPU pinning, BF16) applies
+            return devices[0]
+        auto = f"AUTO:{','.join(devices)}"
+        logger.info(f"Using OpenVINO AUTO device selection: {auto}")
+        return auto
+    
     def _get_device_capabilities(self) -> Dict[str, Any]:
         """Get capabilities of the selected Intel hardware device(s)"""
         capabilities = {
@@ -256,36 +633,19 @@ class OpenVINOVoiceModifier:
             'dma_shared_memory': False,
         }
         
-        device_upper = self.device.upper()
-        
         # Check if MULTI-device configuration
-        if device_upper.startswith('MULTI:'):
+        if self.device.upper().startswith('MULTI:'):
             # Parse multi-device string: MULTI:VPU,VPU,GPU,CPU
             devices_str = self.device.split(':', 1)[1]
             devices = [d.strip() for d in devices_str.split(',')]
             capabilities['devices'] = devices
             
             # Calculate combined TOPS
-            total_tops = 0
-            vpu_count = 0
-            has_gpu = False
-            has_cpu = False
-            
-            for device in devices:
-                device_upper = device.upper()
-                if 'VPU' in device_upper or 'MYRIAD' in device_upper:
-                    vpu_count += 1
-                    total_tops += 4  # ~4 TOPS per Movidius VPU
-                elif 'GPU' in device_upper:
-                    has_gpu = True
-                    total_tops += 200  # Intel Arc GPU: ~200 TOPS
-                elif 'CPU' in device_upper:
-                    has_cpu = True
-                    total_tops += 50  # CPU contribution with DMA
-                elif 'NPU' in device_upper:
-                    total_tops += 200  # Intel NPU: ~200 TOPS
-                elif 'GAUDI' in device_upper or 'HABANA' in device_upper:
-                    total_tops += 1000  # Intel Gaudi: 1000+ TOPS
+            kinds = [_device_kind(d) for d in devices]
+            total_tops = sum(_MULTI_TOPS.get(kind, 0) for kind in kinds)
+            vpu_count = kinds.count('VPU')
+            has_gpu = 'GPU' in kinds
+            has_cpu = 'CPU' in kinds
             
             # Combined configuration with DMA shared memory
             if vpu_count >= 2 and has_gpu and has_cpu:
@@ -301,39 +661,13 @@ class OpenVINOVoiceModifier:
             else:
                 capabilities['estimated_tops'] = total_tops
                 capabilities['supports_int8'] = True
-                capabilities['supports_fp16'] = has_gpu or any('NPU' in d.upper() for d in devices)
+                capabilities['supports_fp16'] = has_gpu or 'NPU' in kinds
                 capabilities['max_batch_size'] = 128
             
             return capabilities
         
         # Single device capabilities
-        if 'GAUDI' in device_upper or 'HABANA' in device_upper:
-            capabilities['estimated_tops'] = 1000  # Intel Gaudi: 1000+ TOPS
-            capabilities['supports_int8'] = True
-            capabilities['supports_fp16'] = True
-            capabilities['max_batch_size'] = 128
-        elif 'NPU' in device_upper:
-            capabilities['estimated_tops'] = 200  # Intel NPU: ~200 TOPS
-            capabilities['supports_int8'] = True
-            capabilities['supports_fp16'] = True
-            capabilities['max_batch_size'] = 64
-        elif 'GPU' in device_upper:
-            # Intel Arc GPU: up to 200+ TOPS
-            capabilities['estimated_tops'] = 200
-            capabilities['supports_int8'] = True
-            capabilities['supports_fp16'] = True
-            capabilities['max_batch_size'] = 32
-        elif 'VPU' in device_upper or 'MYRIAD' in device_upper:
-            capabilities['estimated_tops'] = 4  # Movidius VPU: ~4 TOPS
-            capabilities['supports_int8'] = True
-            capabilities['supports_fp16'] = False
-            capabilities['max_batch_size'] = 8
-        else:
-            # CPU: varies, estimate based on cores
-            capabilities['estimated_tops'] = 10  # Conservative estimate
-            capabilities['supports_int8'] = True
-            capabilities['supports_fp16'] = False
-            capabilities['max_batch_size'] = 16
+        capabilities.update(_DEVICE_CAPS[_device_kind(self.device) or 'CPU'])
         
         return capabilities
     
@@ -349,62 +683,111 @@ class OpenVINOVoiceModifier:
         
         path = Path(model_path)
         
-        if not path.exists():
+        # One stat per candidate file; its mtime also keys the compile cache
+        try:
+            st = os.stat(path)
+        except OSError:
             logger.warning(f"Model path not found: {model_path}")
             logger.info("Using fallback signal processing mode")
             return
         
+        load_start = time.perf_counter_ns()
+        
         try:
-            # Load model
-            if path.is_dir():
+            # Locate model file
+            if stat.S_ISDIR(st.st_mode):
                 # OpenVINO IR format (.xml + .bin)
-                xml_path = path / "model.xml"
-                if xml_path.exists():
-                    self.model = self.core.read_model(str(xml_path))
-                else:
+                model_file = path / "model.xml"
+                try:
+                    st = os.stat(model_file)
+                except OSError:
                     raise FileNotFoundError(f"No model.xml found in {model_path}")
-            elif path.suffix == '.onnx':
-                # ONNX model
-                self.model = self.core.read_model(str(path))
-            elif path.suffix == '.xml':
-                # OpenVINO IR XML
-                self.model = self.core.read_model(str(path))
+            elif path.suffix in ('.onnx', '.xml'):
+                # ONNX model or OpenVINO IR XML
+                model_file = path
             else:
                 raise ValueError(f"Unsupported model format: {path.suffix}")
             
-            # Get input/output info
-            inputs = self.model.inputs
-            outputs = self.model.outputs
+            # Without calibration data, INT8 means weight compression; prefer
+            # a compressed IR an earlier load saved for this exact source
+            self._int8_compress = (self.precision == "INT8" and self.calibration_dataset is None
+                                   and self.device_capabilities['supports_int8']
+                                   and self._int8_worthwhile())
+            self._int8_ir = None
+            if self._int8_compress and self.cache_dir:
+                int8_file = self._int8_cache_path(model_file, st)
+                self._int8_ir = int8_file
+                try:
+                    st = os.stat(int8_file)
+                    model_file = int8_file
+                except OSError:
+                    pass
             
-            if inputs:
-                self.input_shape = inputs[0].shape
-                logger.info(f"Model input shape: {self.input_shape}")
+            # Reuse an identical earlier compile in this process. Calibration
+            # data changes the result and isn't hashable, so quantized loads
+            # always compile
+            key = None
+            if self.calibration_dataset is None:
+                key = (os.path.abspath(model_file), st.st_mtime_ns, self.device,
+                       self.precision, self.chunk_samples, self.batch_size, self.num_streams,
+                       self._dynamic_length_requested)
             
-            if outputs:
-                self.output_shape = outputs[0].shape
-                logger.info(f"Model output shape: {self.output_shape}")
+            with _COMPILED_CACHE_LOCK:
+                compiled = _COMPILED_CACHE.get(key) if key else None
+                if compiled:
+                    _COMPILED_CACHE.move_to_end(key)
             
-            # Optimize model for Intel hardware
-            self._optimize_model_for_device()
+            if compiled:
+                logger.info(f"Reusing compiled model for {model_file}")
+            else:
+                compiled = self._compile(model_file)
+                if key:
+                    with _COMPILED_CACHE_LOCK:
+                        _COMPILED_CACHE[key] = compiled
+                        while len(_COMPILED_CACHE) > _COMPILED_CACHE_SIZE:
+                            _COMPILED_CACHE.popitem(last=False)
             
-            # Configure compilation properties for maximum performance
-            config = self._get_compilation_config()
+            (self.model, self._latency_model, self._throughput_model, self._batch_rows,
+             self.input_shape, self.output_shape, self.chunk_samples, self.precision,
+             self.dynamic_length) = compiled
+            self.compiled_model = self._latency_model
             
-            # Compile model for target device with optimizations
-            self.compiled_model = self.core.compile_model(
-                self.model,
-                device_name=self.device,
-                config=config
-            )
+            if self.device.upper().startswith('AUTO'):
+                try:
+                    execution = self.compiled_model.get_property('EXECUTION_DEVICES')
+                    self.execution_devices = ','.join(execution)
+                    logger.info(f"AUTO executing on: {self.execution_devices}")
+                except Exception:
+                    pass
             
-            # Create inference request
-            self.infer_request = self.compiled_model.create_infer_request()
+            # Inference requests for infer(), as many as the device runs
+            # concurrently; callers check one out instead of sharing a lock
+            slots = [self._make_slot(self.compiled_model.create_infer_request())
+                     for _ in range(self._optimal_requests(self.compiled_model, 1))]
+            self._request_pool = queue.SimpleQueue()
+            for slot in slots:
+                self._request_pool.put(slot)
+            self.infer_request = slots[0][0]
             
-            # Enable profiling if requested
+            # Async request pool for infer_batch, sized the same way
+            self._queue = ov.AsyncInferQueue(
+                self._throughput_model, self._optimal_requests(self._throughput_model, self.num_streams))
+            
+            self._stream_counts = {}
+            for name, compiled in (('latency', self._latency_model), ('throughput', self._throughput_model)):
+                try:
+                    self._stream_counts[name] = compiled.get_property('NUM_STREAMS')
+                except Exception:
+                    pass
+            
+            # Enable profiling if requested (on every pooled request, since
+            # any of them may serve a given infer() call)
             if self.enable_profiling:
-                self.infer_request.enable_profiling()
+                for request, _, _ in slots:
+                    request.enable_profiling()
             
-            logger.info(f"Model loaded and optimized for {self.device}")
+            self.load_time_ms = (time.perf_counter_ns() - load_start) * 1e-6
+            logger.info(f"Model loaded and optimized for {self.device} in {self.load_time_ms:.0f} ms")
             logger.info(f"Estimated hardware performance: {self.device_capabilities['estimated_tops']} TOPS")
             logger.info(f"Available devices: {self.core.available_devices}")
             
@@ -413,6 +796,155 @@ class OpenVINOVoiceModifier:
             logger.info("Falling back to signal processing mode")
             self.model = None
     
+    def _compile(self, model_file: Path) -> Tuple:
+        """
+        Read, optimize and compile the latency and throughput models.
+        
+        Returns:
+            (model, latency_model, throughput_model, batch_rows,
+             input_shape, output_shape, chunk_samples, precision, dynamic_length)
+        """
+        self.model = self.core.read_model(str(model_file))
+        dynamic_input = self.model.input(0).partial_shape[-1].is_dynamic
+        
+        # Compress before the static reshape so the saved IR stays reusable
+        # for any chunk length
+        if self._int8_compress and model_file != self._int8_ir:
+            if not self._compress_weights_int8(self._int8_ir):
+                self._int8_compress = False
+                self._int8_ir = None
+        
+        # Fix dynamic input dims so the compiled blob is cacheable and the
+        # model never recompiles for a new input length
+        self._reshape_static()
+        
+        # Get input/output info
+        inputs = self.model.inputs
+        outputs = self.model.outputs
+        
+        if inputs:
+            self.input_shape = inputs[0].shape
+            self.chunk_samples = int(np.prod(tuple(self.input_shape)))
+            logger.info(f"Model input shape: {self.input_shape}")
+        
+        if outputs:
+            self.output_shape = outputs[0].shape
+            logger.info(f"Model output shape: {self.output_shape}")
+        
+        # Optimize model for Intel hardware
+        self._optimize_model_for_device()
+        
+        # Compile model for target device with optimizations
+        latency_source = self._bounded_length_model() if dynamic_input else None
+        latency_model = self.core.compile_model(
+            latency_source or self.model,
+            device_name=self.device,
+            config=self._get_compilation_config('LATENCY')
+        )
+        throughput_model = self._compile_throughput_model()
+        
+        return (self.model, latency_model, throughput_model, self._batch_rows,
+                self.input_shape, self.output_shape, self.chunk_samples, self.precision,
+                latency_source is not None)
+    
+    def _reshape_static(self):
+        """Reshape dynamic input dims to a single chunk_samples-long input"""
+        partial_shape = self.model.input(0).partial_shape
+        if not any(d.is_dynamic for d in partial_shape):
+            return
+        
+        dims = [1 if d.is_dynamic else d.get_length() for d in list(partial_shape)[:-1]]
+        try:
+            self.model.reshape({0: ov.PartialShape(dims + [self.chunk_samples])})
+            logger.info(f"Reshaped dynamic model input to {dims + [self.chunk_samples]}")
+        except Exception as e:
+            logger.warning(f"Could not reshape model input to static: {e}")
+    
+    def _bounded_length_model(self):
+        """
+        Copy of the (static) model whose length is bounded by chunk_samples,
+        for infer(); None if dynamic_length is off or the reshape fails
+        """
+        wanted = self._dynamic_length_requested
+        if wanted is None:
+            wanted = self.device.upper() == 'CPU'
+        if not wanted or not self.input_shape:
+            return None
+        
+        dims = list(self.input_shape)[:-1]
+        try:
+            bounded = self.model.clone()
+            bounded.reshape({0: ov.PartialShape(dims + [ov.Dimension(1, self.chunk_samples)])})
+        except Exception as e:
+            logger.warning(f"Cannot bound model input length, padding frames to {self.chunk_samples}: {e}")
+            return None
+        
+        logger.info(f"infer() model takes 1..{self.chunk_samples} samples per chunk (no padding)")
+        return bounded
+    
+    def _compile_throughput_model(self):
+        """Compile the infer_batch() model, reshaped to batch_size when possible"""
+        model = self.model
+        self._batch_rows = 1
+        
+        if self.batch_size > 1 and self.input_shape:
+            try:
+                batched = self.model.clone()
+                ov.set_batch(batched, self.batch_size)
+                model = batched
+                self._batch_rows = self.batch_size
+            except Exception as e:
+                logger.warning(f"Cannot reshape model to batch {self.batch_size}, submitting inputs singly: {e}")
+        
+        return self.core.compile_model(
+            model,
+            device_name=self.device,
+            config=self._get_compilation_config('THROUGHPUT')
+        )
+    
+    @staticmethod
+    def _optimal_requests(compiled_model, default: int) -> int:
+        """Infer requests the compiled model can keep busy at once"""
+        try:
+            return max(1, int(compiled_model.get_property('OPTIMAL_NUMBER_OF_INFER_REQUESTS')))
+        except Exception:
+            return default
+    
+    def _make_slot(self, request) -> Tuple[Any, Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Preallocate input/output host buffers for an infer() request and bind
+        them as zero-copy tensors, so chunks are written in place instead of
+        building a new ov.Tensor per call.
+        """
+        if not self.input_shape:
+            return request, None, None
+        
+        in_arr = np.zeros(tuple(self.input_shape), dtype=np.float32)
+        if self.dynamic_length:
+            # Input length varies per chunk: infer() wraps a prefix of the
+            # buffer per call, and the output is read from the request
+            return request, in_arr, None
+        
+        try:
+            request.set_input_tensor(ov.Tensor(in_arr, shared_memory=True))
+        except Exception as e:
+            logger.debug(f"Shared input tensor unavailable, using per-call tensors: {e}")
+            return request, None, None
+        
+        # The input stays bound even when the output has to be read back
+        # from the request (dynamic or unbindable output)
+        if not self.output_shape:
+            return request, in_arr, None
+        
+        try:
+            out_arr = np.zeros(tuple(self.output_shape), dtype=np.float32)
+            request.set_output_tensor(ov.Tensor(out_arr, shared_memory=True))
+        except Exception as e:
+            logger.debug(f"Shared output tensor unavailable, reading it per call: {e}")
+            return request, in_arr, None
+        
+        return request, in_arr, out_arr
+    
     def _optimize_model_for_device(self):
         """Optimize model for Intel hardware capabilities"""
         if not self.model:
@@ -420,16 +952,110 @@ class OpenVINOVoiceModifier:
         
         # Set precision based on device capabilities
         if self.precision == "INT8" and self.device_capabilities['supports_int8']:
-            # INT8 quantization for maximum performance
-            logger.info("Optimizing model for INT8 precision (maximum TOPS)")
-            # Note: Model should be pre-quantized or use Post-Training Optimization Tool
+            if not self._int8_worthwhile():
+                # Without VNNI, INT8 on CPU is typically no faster than float
+                fallback = "FP16" if self.device_capabilities['supports_fp16'] else "FP32"
+                logger.info(f"CPU lacks VNNI; using {fallback} instead of INT8")
+                self.precision = fallback
+            elif self.calibration_dataset is not None:
+                self._quantize_int8()
+            elif self._int8_compress:
+                logger.info("Using INT8 weight-compressed model")
+            else:
+                # INT8 quantization for maximum performance
+                logger.info("Optimizing model for INT8 precision (maximum TOPS)")
+                # Note: Model should be pre-quantized, or pass calibration_dataset
         elif self.precision == "FP16" and self.device_capabilities['supports_fp16']:
             logger.info("Optimizing model for FP16 precision")
         else:
             logger.info(f"Using {self.precision} precision")
     
-    def _get_compilation_config(self) -> Dict[str, Any]:
-        """Get compilation configuration for maximum Intel hardware performance"""
+    def _int8_worthwhile(self) -> bool:
+        """False on CPUs known to lack INT8 dot-product (VNNI/AMX) support"""
+        cpu_flags = _cpu_flags()
+        return not (self.device.upper() == 'CPU' and cpu_flags
+                    and not cpu_flags & {'avx512_vnni', 'avx_vnni', 'amx_int8'})
+    
+    def _int8_cache_path(self, model_file: Path, st: os.stat_result) -> Path:
+        """
+        Where the compressed IR for model_file lives under cache_dir.
+        
+        The name is keyed on the source's path and on its mtime and size, so
+        editing or replacing the source model makes the old IR unreachable
+        and it is regenerated on the next load.
+        """
+        source = os.path.abspath(model_file)
+        path_key = hashlib.sha256(source.encode('utf-8')).hexdigest()[:8]
+        version_key = hashlib.sha256(f"{st.st_mtime_ns}:{st.st_size}".encode('ascii')).hexdigest()[:8]
+        return Path(self.cache_dir) / 'int8' / f"{model_file.stem}-{path_key}-{version_key}.xml"
+    
+    def _compress_weights_int8(self, save_path: Optional[Path]) -> bool:
+        """
+        Data-free INT8 (asymmetric) weight compression via NNCF, saved as an
+        IR at save_path (when given) so later loads read it directly.
+        
+        Returns:
+            True if the model weights are now INT8
+        """
+        try:
+            import nncf
+        except ImportError:
+            logger.warning("NNCF not available; using model as-is. Install with: pip install nncf")
+            return False
+        
+        try:
+            self.model = nncf.compress_weights(self.model, mode=nncf.CompressWeightsMode.INT8_ASYM)
+            logger.info("Compressed model weights to INT8 (NNCF, asymmetric)")
+        except Exception as e:
+            logger.warning(f"INT8 weight compression failed, using uncompressed model: {e}")
+            return False
+        
+        if save_path is None:
+            return True
+        
+        try:
+            save_path.parent.mkdir(parents=True, exist_ok=True)
+            ov.serialize(self.model, str(save_path))
+            logger.info(f"Saved INT8 model to {save_path}")
+        except Exception as e:
+            logger.debug(f"Could not save INT8 model to {save_path}: {e}")
+            return True
+        
+        # IRs for earlier versions of the same source are never read again
+        for old in save_path.parent.glob(f"{save_path.stem.rsplit('-', 1)[0]}-*"):
+            if old.stem != save_path.stem:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+        
+        return True
+    
+    def _quantize_int8(self):
+        """Post-training INT8 quantization via NNCF (symmetric PERFORMANCE preset)"""
+        try:
+            import nncf
+        except ImportError:
+            logger.warning("NNCF not available; using model as-is. Install with: pip install nncf")
+            return
+        
+        kwargs = {'preset': nncf.QuantizationPreset.PERFORMANCE}
+        if 'transformer' in (self.model.get_friendly_name() or '').lower():
+            kwargs['model_type'] = nncf.ModelType.TRANSFORMER
+        
+        try:
+            self.model = nncf.quantize(self.model, nncf.Dataset(list(self.calibration_dataset)), **kwargs)
+            logger.info("Quantized model to INT8 (NNCF PERFORMANCE preset, symmetric)")
+        except Exception as e:
+            logger.warning(f"INT8 quantization failed, using unquantized model: {e}")
+    
+    def _get_compilation_config(self, hint: str = 'LATENCY') -> Dict[str, Any]:
+        """
+        Get compilation configuration for maximum Intel hardware performance.
+        
+        Args:
+            hint: PERFORMANCE_HINT for the model ('LATENCY' or 'THROUGHPUT')
+        """
         config = {}
         
         device_upper = self.device.upper()
@@ -437,7 +1063,7 @@ class OpenVINOVoiceModifier:
         # Multi-device configuration with DMA shared memory
         if device_upper.startswith('MULTI:'):
             # Configure for multi-device with DMA shared memory
-            config['PERFORMANCE_HINT'] = 'THROUGHPUT'  # Maximum throughput
+            config['PERFORMANCE_HINT'] = hint
             
             # Enable DMA shared memory for efficient data transfer
             # This allows zero-copy data sharing between VPUs, GPU, and CPU
@@ -447,19 +1073,19 @@ class OpenVINOVoiceModifier:
             # VPUs handle initial processing, GPU handles complex ops, CPU handles coordination
             devices_str = self.device.split(':', 1)[1]
             devices = [d.strip() for d in devices_str.split(',')]
+            kinds = [_device_kind(d) for d in devices]
             
             # Set device-specific configurations
-            for device in devices:
-                device_upper = device.upper()
-                if 'VPU' in device_upper or 'MYRIAD' in device_upper:
+            for device, kind in zip(devices, kinds):
+                if kind == 'VPU':
                     # VPU-specific optimizations
                     config[f'{device}.PERFORMANCE_HINT'] = 'THROUGHPUT'
                     config[f'{device}.NUM_STREAMS'] = '2'  # Parallel streams per VPU
-                elif 'GPU' in device_upper:
+                elif kind == 'GPU':
                     # GPU-specific optimizations
                     config[f'{device}.PERFORMANCE_HINT'] = 'THROUGHPUT'
                     config[f'{device}.NUM_STREAMS'] = str(self.num_streams)
-                elif 'CPU' in device_upper:
+                elif kind == 'CPU':
                     # CPU with DMA shared memory
                     config[f'{device}.PERFORMANCE_HINT'] = 'THROUGHPUT'
                     config[f'{device}.ENABLE_MMAP'] = 'YES'  # DMA shared memory
@@ -468,94 +1094,191 @@ class OpenVINOVoiceModifier:
             config['MULTI_DEVICE_PRIORITIES'] = devices_str  # Device priority order
             
             logger.info(f"Configured MULTI-device with DMA shared memory: {devices_str}")
-            logger.info(f"  - {len([d for d in devices if 'VPU' in d.upper()])} VPU(s)")
-            logger.info(f"  - {len([d for d in devices if 'GPU' in d.upper()])} GPU(s)")
-            logger.info(f"  - {len([d for d in devices if 'CPU' in d.upper()])} CPU(s)")
+            logger.info(f"  - {kinds.count('VPU')} VPU(s)")
+            logger.info(f"  - {kinds.count('GPU')} GPU(s)")
+            logger.info(f"  - {kinds.count('CPU')} CPU(s)")
         
         else:
             # Single device configuration
-            if self.num_streams > 1:
+            config['PERFORMANCE_HINT'] = hint
+            
+            # Real-time infer() model is served first when AUTO shares devices
+            if device_upper.startswith('AUTO') and hint == 'LATENCY':
+                config['MODEL_PRIORITY'] = 'HIGH'
+            
+            # Streams only pay off for the throughput (infer_batch) model;
+            # under AUTO the hint alone picks per-device stream counts
+            if hint == 'THROUGHPUT' and self.num_streams > 1 and not device_upper.startswith('AUTO'):
                 config['NUM_STREAMS'] = str(self.num_streams)
                 logger.info(f"Configured {self.num_streams} inference streams for parallel processing")
             
-            # Set performance mode for maximum throughput
-            if 'GPU' in device_upper or 'NPU' in device_upper or 'GAUDI' in device_upper:
-                config['PERFORMANCE_HINT'] = 'THROUGHPUT'  # Maximize TOPS utilization
-            else:
-                config['PERFORMANCE_HINT'] = 'LATENCY'
-        
-        # Enable caching for faster subsequent loads
-        config['CACHE_DIR'] = str(Path.home() / '.cache' / 'openvino')
+            # Latency model: pin threads to physical P-cores to cut scheduler
+            # jitter and cache thrash (tail latency matters for real-time audio)
+            if device_upper == 'CPU' and hint == 'LATENCY':
+                config['ENABLE_CPU_PINNING'] = 'YES'
+                config['SCHEDULING_CORE_TYPE'] = 'PCORE_ONLY'
+                config['ENABLE_HYPER_THREADING'] = 'NO'
+            
+            # Float models run at BF16 on CPUs with native BF16 (AVX512-BF16/AMX)
+            if device_upper == 'CPU' and self.precision in ('FP32', 'AUTO') and self._cpu_supports_bf16():
+                config['INFERENCE_PRECISION_HINT'] = 'bf16'
+                if 'amx_bf16' in _cpu_flags():
+                    logger.info("CPU inference precision: BF16 (AMX tiles)")
+                else:
+                    logger.info("CPU inference precision: BF16")
         
         return config
     
-    def preprocess_audio(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    def _cpu_supports_bf16(self) -> bool:
+        """Whether the CPU plugin reports native BF16 execution"""
+        try:
+            return 'BF16' in self.core.get_property('CPU', 'OPTIMIZATION_CAPABILITIES')
+        except Exception:
+            return bool(_cpu_flags() & {'avx512_bf16', 'amx_bf16'})
+    
+    def preprocess_audio(self, audio: np.ndarray, sample_rate: int,
+                         assume_normalized: Optional[bool] = None) -> np.ndarray:
         """
         Preprocess audio for model input.
         
         Args:
-            audio: Input audio signal
+            audio: Input audio signal (float, or int16 PCM)
             sample_rate: Input sample rate
+            assume_normalized: Skip peak normalization (input already in
+                [-1, 1]); defaults to the instance's assume_normalized
             
         Returns:
-            Preprocessed audio tensor
+            Resampled, normalized float32 signal (the inference paths
+            skip this and scale while loading chunks, see _prepare)
+        """
+        signal, scale = self._prepare(audio, sample_rate, assume_normalized)
+        if scale == 1.0:
+            return np.asarray(signal, dtype=np.float32)
+        return np.multiply(signal, np.float32(scale), dtype=np.float32)
+    
+    def _prepare(self, audio: np.ndarray, sample_rate: int,
+                 assume_normalized: Optional[bool] = None) -> Tuple[np.ndarray, float]:
         """
-        if not HAS_LIBROSA:
-            raise RuntimeError("Librosa required for audio preprocessing")
+        Model-rate signal plus the gain that normalizes it. The gain (and
+        any int16/float64 -> float32 conversion) is applied as chunks are
+        copied into the input buffer, so it costs no pass of its own.
+        """
+        if assume_normalized is None:
+            assume_normalized = self.assume_normalized
+        
+        scale = 1.0
+        if audio.dtype == np.int16:
+            if sample_rate == self.sample_rate:
+                # PCM at the model rate is loaded as-is; the 1/32768
+                # conversion folds into the gain
+                scale = 1.0 / 32768.0
+            else:
+                audio = np.multiply(audio, np.float32(1.0 / 32768.0), dtype=np.float32)
         
         # Resample if needed
         if sample_rate != self.sample_rate:
-            audio = librosa.resample(audio, orig_sr=sample_rate, target_sr=self.sample_rate)
+            audio = self._resample(audio, sample_rate)
         
-        # Normalize
-        if audio.max() > 0:
-            audio = audio / (np.abs(audio).max() + 1e-8)
+        if not assume_normalized and audio.size:
+            # Normalize to unit peak: one max/min reduction pair (no abs()
+            # temporary); the scaling itself happens in _load_chunk
+            peak = max(float(audio.max()), -float(audio.min())) * scale
+            if peak > 0:
+                scale /= peak + 1e-8
         
-        # Pad/trim to model input size if needed
-        if self.input_shape and len(self.input_shape) >= 2:
-            target_length = self.input_shape[-1] if len(self.input_shape) > 1 else len(audio)
-            
-            if len(audio) < target_length:
-                # Pad with zeros
-                audio = np.pad(audio, (0, target_length - len(audio)), mode='constant')
-            elif len(audio) > target_length:
-                # Trim
-                audio = audio[:target_length]
+        return audio, scale
+    
+    def _num_chunks(self, signal: np.ndarray) -> int:
+        """Number of chunk_samples-long inferences needed to cover signal"""
+        return max(1, -(-len(signal) // self.chunk_samples))
+    
+    def _load_chunk(self, dst: np.ndarray, signal: np.ndarray, index: int, scale: float = 1.0):
+        """
+        Copy chunk `index` of signal into the flat float32 buffer dst,
+        scaled by `scale` in the same pass, zero-padding the tail
+        """
+        start = index * self.chunk_samples
+        piece = signal[start:start + self.chunk_samples]
+        if scale == 1.0:
+            dst[:len(piece)] = piece
+        else:
+            np.multiply(piece, np.float32(scale), out=dst[:len(piece)])
+        dst[len(piece):] = 0.0
+    
+    def _resample(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Resample to the model rate (soxr, else cached polyphase FIR, else librosa)"""
+        if HAS_SOXR:
+            # Same SoX HQ kernel librosa.resample defaults to, minus its overhead
+            return soxr.resample(audio, sample_rate, self.sample_rate, quality='HQ')
+        
+        if HAS_SCIPY:
+            entry = self._resample_filters.get(sample_rate)
+            if entry is None:
+                g = gcd(sample_rate, self.sample_rate)
+                up, down = self.sample_rate // g, sample_rate // g
+                # Same design resample_poly uses by default, built only once
+                max_rate = max(up, down)
+                taps = firwin(20 * max_rate + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+                entry = self._resample_filters[sample_rate] = (up, down, taps)
+            up, down, taps = entry
+            return resample_poly(audio, up, down, window=taps)
+        
+        if _lazy_librosa() is None:
+            raise RuntimeError("soxr, SciPy or librosa required for resampling")
+        return librosa.resample(audio, orig_sr=sample_rate, target_sr=self.sample_rate)
+    
+    def _stream_resampler(self, sample_rate: int) -> Optional[Callable[..., np.ndarray]]:
+        """
+        Stateful soxr resampler for one continuous stream, or None (same
+        rate, or no soxr: chunks are then resampled one by one). Filter
+        state carries across chunks, so chunk edges don't pick up the
+        transients of resampling each chunk in isolation. Pass last=True
+        with the final chunk to flush the filter's delayed tail.
+        """
+        if sample_rate == self.sample_rate or not HAS_SOXR:
+            return None
+        
+        stream = soxr.ResampleStream(sample_rate, self.sample_rate, 1, dtype='float32', quality='HQ')
         
-        # Reshape for model input
-        if self.input_shape:
-            # Add batch dimension if needed
-            if len(self.input_shape) == 1:
-                audio = audio.reshape(1, -1)
-            elif len(self.input_shape) == 2:
-                audio = audio.reshape(1, 1, -1)
+        def _resample(audio: np.ndarray, last: bool = False) -> np.ndarray:
+            if audio.dtype == np.int16:
+                audio = np.multiply(audio, np.float32(1.0 / 32768.0), dtype=np.float32)
+            return stream.resample_chunk(np.asarray(audio, dtype=np.float32), last=last)
         
-        return audio.astype(np.float32)
+        return _resample
     
-    def postprocess_audio(self, output: np.ndarray) -> np.ndarray:
+    def postprocess_audio(self, output: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Postprocess model output to audio signal.
         
         Args:
             output: Model output tensor
+            out: Optional flat float32 buffer of output.size to write into
             
         Returns:
-            Audio signal array
+            Audio signal array (out, if given)
         """
-        # Remove batch/channel dimensions
-        if len(output.shape) > 1:
-            output = output.squeeze()
-        
-        # Ensure 1D array
-        if len(output.shape) > 1:
-            output = output.flatten()
-        
-        # Denormalize
-        output = np.clip(output, -1.0, 1.0)
-        
-        return output
+        # Drop batch/channel dimensions (a view for contiguous output) and
+        # denormalize in one pass, without intermediate copies
+        return np.clip(output.reshape(-1), -1.0, 1.0, out=out)
+    
+    def _chunk_out_samples(self) -> int:
+        """Output samples produced per chunk_samples-long inference"""
+        return int(np.prod(tuple(self.output_shape))) if self.output_shape else self.chunk_samples
     
-    def infer(self, audio: np.ndarray, sample_rate: int = 16000) -> MLInferenceResult:
+    def _result_buffer(self, signal: np.ndarray) -> np.ndarray:
+        """Output buffer for signal, sized without the last chunk's zero padding"""
+        return np.empty(min(self._num_chunks(signal) * self._chunk_out_samples(), len(signal)),
+                        dtype=np.float32)
+    
+    def _store_chunk(self, output: np.ndarray, result: np.ndarray, index: int):
+        """Postprocess chunk `index`'s output into its slice of result (padding is never clipped)"""
+        step = self._chunk_out_samples()
+        dst = result[index * step:(index + 1) * step]
+        self.postprocess_audio(output.reshape(-1)[:len(dst)], out=dst)
+    
+    def infer(self, audio: np.ndarray, sample_rate: int = 16000,
+              pre_f0: Optional[np.ndarray] = None) -> MLInferenceResult:
         """
         Run optimized ML inference on audio using Intel hardware acceleration.
         
@@ -564,65 +1287,77 @@ class OpenVINOVoiceModifier:
         Args:
             audio: Input audio signal
             sample_rate: Input sample rate
+            pre_f0: F0 track (Hz) already extracted from audio, reused for
+                    pitch-shift estimation instead of re-analysing the input
             
         Returns:
             MLInferenceResult with modified audio and metadata
         """
         if not self.compiled_model:
             # Fallback to signal processing
-            logger.debug("No ML model loaded, using fallback")
+            if not self._fallback_logged:
+                self._fallback_logged = True
+                logger.debug("No ML model loaded, using fallback")
             return self._fallback_process(audio, sample_rate)
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
+        
+        if self._silence_ms is not None and self._is_silent(audio):
+            return self._silence_result(audio, sample_rate, start_time)
         
         try:
-            with self._lock:
-                # Preprocess
-                preprocessed = self.preprocess_audio(audio, sample_rate)
-                
-                # Batch processing if enabled (utilizes more TOPS)
-                if self.batch_size > 1 and len(preprocessed.shape) == 2:
-                    # Expand batch dimension
-                    batch_input = np.repeat(preprocessed[np.newaxis, :], self.batch_size, axis=0)
-                    preprocessed = batch_input
-                
-                # Run inference on Intel hardware
-                input_tensor = ov.Tensor(preprocessed)
-                self.infer_request.set_input_tensor(input_tensor)
-                
-                # Execute inference (utilizes Intel hardware TOPS)
-                self.infer_request.infer()
-                
-                # Get output
-                output_tensor = self.infer_request.get_output_tensor()
-                output = output_tensor.data
-                
-                # Handle batch output
-                if len(output.shape) > 1 and output.shape[0] > 1:
-                    # Take first batch item
-                    output = output[0]
+            # Preprocess
+            signal, scale = self._prepare(audio, sample_rate)
+            
+            # Check out a request of our own; concurrent callers run on
+            # other requests (and device streams) instead of queueing
+            slot = self._request_pool.get()
+            try:
+                request, in_arr, out_arr = slot
+                bound = in_arr is not None
+                if not bound:
+                    in_arr = np.zeros((1, 1, self.chunk_samples), dtype=np.float32)
                 
-                # Postprocess
-                modified_audio = self.postprocess_audio(output)
+                # One inference per chunk_samples slice of the signal, each
+                # postprocessed straight into its slice of the result
+                modified_audio = self._result_buffer(signal)
+                flat = in_arr.reshape(-1)
+                for index in range(self._num_chunks(signal)):
+                    if self.dynamic_length:
+                        # Feed only the samples this chunk has (a short last
+                        # chunk isn't padded out to chunk_samples)
+                        n = max(1, min(self.chunk_samples, len(signal) - index * self.chunk_samples))
+                        self._load_chunk(flat[:n], signal, index, scale)
+                        request.set_input_tensor(
+                            ov.Tensor(flat[:n].reshape(in_arr.shape[:-1] + (n,)), shared_memory=True))
+                    else:
+                        # The request reads the bound input buffer in place
+                        self._load_chunk(flat, signal, index, scale)
+                        if not bound:
+                            # Wrap (not copy) the scratch buffer for this call
+                            request.set_input_tensor(ov.Tensor(in_arr, shared_memory=True))
+                    
+                    # Execute inference (utilizes Intel hardware TOPS)
+                    request.infer()
+                    
+                    # The kernel writes into the bound output buffer when
+                    # there is one; otherwise read the request's own tensor
+                    output = out_arr if out_arr is not None else request.get_output_tensor().data
+                    
+                    # Postprocess
+                    self._store_chunk(output, modified_audio, index)
                 
                 # Calculate processing time
-                processing_time = (time.time() - start_time) * 1000
-                self.inference_times.append(processing_time)
-                self.total_inferences += 1
+                processing_time = (time.perf_counter_ns() - start_time) * 1e-6
                 
                 # Estimate operations for TOPS calculation
                 # Rough estimate: input_size * output_size * model_complexity_factor
                 ops_estimate = len(audio) * len(modified_audio) * 10  # Simplified
-                self.total_ops += ops_estimate
-                
-                # Keep only recent times (last 100)
-                if len(self.inference_times) > 100:
-                    self.inference_times.pop(0)
                 
                 # Collect profiling data if enabled
                 if self.enable_profiling:
                     try:
-                        profiling_info = self.infer_request.get_profiling_info()
+                        profiling_info = request.get_profiling_info()
                         self.profiling_data.append({
                             'time': processing_time,
                             'ops': ops_estimate,
@@ -630,20 +1365,28 @@ class OpenVINOVoiceModifier:
                         })
                     except:
                         pass
-                
-                # Estimate pitch/formant changes (simplified)
-                pitch_shift = self._estimate_pitch_shift(audio, modified_audio)
-                formant_ratio = self._estimate_formant_ratio(audio, modified_audio)
-                confidence = min(1.0, max(0.0, 1.0 - processing_time / 100.0))  # Simple heuristic
-                
-                return MLInferenceResult(
-                    modified_audio=modified_audio,
-                    pitch_shift=pitch_shift,
-                    formant_ratio=formant_ratio,
-                    confidence=confidence,
-                    processing_time_ms=processing_time,
-                    model_used=self.device
-                )
+            finally:
+                self._request_pool.put(slot)
+            
+            # Estimate pitch/formant changes (simplified)
+            # Pitch estimation is diagnostic only; keep it off the hot path.
+            # The input F0 is summarized once and handed back to the caller
+            f0_median = _median_f0(pre_f0)
+            pitch_shift = self._estimate_pitch_shift(audio, sample_rate, modified_audio, f0_median) if self.enable_profiling else 0.0
+            formant_ratio = self._estimate_formant_ratio(audio, modified_audio)
+            confidence = min(1.0, max(0.0, 1.0 - processing_time / 100.0))  # Simple heuristic
+            
+            self._record_inference(processing_time, ops_estimate, pitch_shift, formant_ratio, confidence)
+            
+            return MLInferenceResult(
+                modified_audio=modified_audio,
+                pitch_shift=pitch_shift,
+                formant_ratio=formant_ratio,
+                confidence=confidence,
+                processing_time_ms=processing_time,
+                model_used=f"{self.execution_devices} ({self.precision})",
+                f0_median=f0_median
+            )
         
         except Exception as e:
             logger.error(f"Inference error: {e}")
@@ -662,21 +1405,248 @@ class OpenVINOVoiceModifier:
         Returns:
             List of MLInferenceResult objects
         """
-        results = []
+        if not self.compiled_model or self._queue is None:
+            return [self.infer(audio, sample_rate) for audio in audio_batch]
+        
+        n = len(audio_batch)
+        rows = self._batch_rows
+        
+        # Inputs are copied into each request on submit, so one scratch
+        # buffer serves the whole batch; each row holds a distinct chunk
+        # (rows past the end of a short final group are ignored)
+        input_shape = tuple(self.input_shape or (1, 1, self.chunk_samples))
+        scratch = np.zeros((rows,) + input_shape[1:] if rows > 1 else input_shape, dtype=np.float32)
+        scratch_rows = scratch.reshape(rows, -1)
         
-        # Process in batches to maximize TOPS utilization
-        batch_size = min(self.batch_size, len(audio_batch))
+        start_time = time.perf_counter_ns()
         
-        for i in range(0, len(audio_batch), batch_size):
-            batch = audio_batch[i:i + batch_size]
+        try:
+            if sample_rate != self.sample_rate and n > 1:
+                # Resampling dominates preprocessing and releases the GIL
+                if self._prep_pool is None:
+                    self._prep_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                                         thread_name_prefix="openvino-preprocess")
+                prepared = list(self._prep_pool.map(lambda audio: self._prepare(audio, sample_rate),
+                                                    audio_batch))
+            else:
+                prepared = [self._prepare(audio, sample_rate) for audio in audio_batch]
+            signals = [signal for signal, _ in prepared]
+            
+            # Every (input, chunk) pair is one row of work
+            jobs = [(i, k) for i, signal in enumerate(signals) for k in range(self._num_chunks(signal))]
+            outputs = [self._result_buffer(signal) for signal in signals]
+            
+            # Callbacks may run concurrently; each writes only its own slices.
+            # Errors raised inside a callback don't reliably reach wait_all()
+            # (older OpenVINO releases drop them), which would leave the
+            # failed slices as uninitialised memory, so collect them here
+            errors = []
+            
+            def _on_done(request, first):
+                try:
+                    data = request.get_output_tensor().data
+                    for j, (i, k) in enumerate(jobs[first:first + rows]):
+                        self._store_chunk(data if rows == 1 else data[j], outputs[i], k)
+                except Exception as e:
+                    errors.append(e)
             
-            # Process batch
-            for audio in batch:
-                result = self.infer(audio, sample_rate)
-                results.append(result)
+            # Pipeline requests across streams. The queue's callback and
+            # wait_all() are queue-wide, so concurrent batches take turns
+            with self._batch_lock:
+                self._queue.set_callback(_on_done)
+                for first in range(0, len(jobs), rows):
+                    for j, (i, k) in enumerate(jobs[first:first + rows]):
+                        self._load_chunk(scratch_rows[j], signals[i], k, prepared[i][1])
+                    self._queue.start_async({0: scratch}, userdata=first)
+                self._queue.wait_all()
+            if errors:
+                raise errors[0]
+        except Exception as e:
+            logger.error(f"Batch inference error: {e}")
+            return [self._fallback_process(audio, sample_rate) for audio in audio_batch]
+        
+        # Attribute wall time evenly across the batch
+        processing_time = (time.perf_counter_ns() - start_time) * 1e-6 / max(n, 1)
+        confidence = min(1.0, max(0.0, 1.0 - processing_time / 100.0))
+        
+        results = []
+        for audio, modified_audio in zip(audio_batch, outputs):
+            result = MLInferenceResult(
+                modified_audio=modified_audio,
+                pitch_shift=self._estimate_pitch_shift(audio, sample_rate, modified_audio) if self.enable_profiling else 0.0,
+                formant_ratio=self._estimate_formant_ratio(audio, modified_audio),
+                confidence=confidence,
+                processing_time_ms=processing_time,
+                model_used=f"{self.execution_devices} ({self.precision})"
+            )
+            self._record_inference(processing_time, len(audio) * len(modified_audio) * 10,
+                                   result.pitch_shift, result.formant_ratio, confidence)
+            results.append(result)
         
         return results
     
+    def infer_stream(self, audio_iter: Iterable[np.ndarray], sample_rate: int = 16000,
+                     depth: int = 2) -> Iterator[np.ndarray]:
+        """
+        Modify a stream of audio chunks, overlapping preprocessing of the
+        next chunk with device inference of the current one.
+        
+        A worker thread preprocesses chunks into `depth` preallocated input
+        slots (one infer request each) and starts them asynchronously;
+        completion callbacks hand outputs back and free their slot.
+        
+        The chunks are treated as one continuous signal: with soxr, they
+        are resampled by a single stateful resampler (see
+        _stream_resampler), so output lengths can differ slightly from the
+        per-chunk ratio while the resampler's delay line fills. To flush
+        that delay line with the last chunk, resampled streams read one
+        chunk ahead of the one being processed.
+        
+        Args:
+            audio_iter: Iterable of audio chunks
+            sample_rate: Sample rate of the chunks
+            depth: Maximum model chunks in flight
+            
+        Yields:
+            Modified audio for each input chunk, in input order
+        """
+        if not self.compiled_model:
+            for audio in audio_iter:
+                yield self._fallback_process(audio, sample_rate).modified_audio
+            return
+        
+        input_shape = tuple(self.input_shape or (1, 1, self.chunk_samples))
+        requests = []
+        slot_bufs = []
+        slot_jobs: List[Optional[Tuple[int, int]]] = [None] * depth
+        free = queue.Queue()  # Idle slot indices; bounds requests in flight
+        done = queue.Queue()  # Finished (index, None) or (None, count, error)
+        stop = threading.Event()
+        
+        def _on_done(slot):
+            # Runs on an OpenVINO thread: a failure must still free the slot
+            # and reach the consumer, or both sides would wait forever
+            try:
+                index, piece = slot_jobs[slot]
+                result = inputs[index][3]
+                self._store_chunk(requests[slot].get_output_tensor().data, result, piece)
+                done.put((index, None, None))
+            except Exception as e:
+                done.put((None, None, e))
+            finally:
+                free.put(slot)
+        
+        for slot in range(depth):
+            request = self.compiled_model.create_infer_request()
+            buf = np.zeros(input_shape, dtype=np.float32)
+            request.set_input_tensor(ov.Tensor(buf, shared_memory=True))
+            request.set_callback(_on_done, slot)
+            requests.append(request)
+            slot_bufs.append(buf.reshape(-1))
+            free.put(slot)
+        
+        # index -> (chunks, samples, start time (ns), result buffer)
+        inputs: Dict[int, Tuple[int, int, int, np.ndarray]] = {}
+        resample = self._stream_resampler(sample_rate)
+        
+        def _produce():
+            count = 0
+            error = None
+            try:
+                if resample is not None:
+                    items = _mark_last(audio_iter)
+                else:
+                    items = ((audio, False) for audio in audio_iter)
+                for index, (audio, last) in enumerate(items):
+                    if stop.is_set():
+                        break
+                    start_time = time.perf_counter_ns()
+                    if resample is not None:
+                        signal, scale = self._prepare(resample(audio, last), self.sample_rate)
+                    else:
+                        signal, scale = self._prepare(audio, sample_rate)
+                    chunks = self._num_chunks(signal)
+                    inputs[index] = (chunks, len(signal), start_time,
+                                     self._result_buffer(signal))
+                    for piece in range(chunks):
+                        slot = free.get()
+                        requests[slot].wait()
+                        self._load_chunk(slot_bufs[slot], signal, piece, scale)
+                        slot_jobs[slot] = (index, piece)
+                        requests[slot].start_async()
+                    count = index + 1
+            except Exception as e:
+                error = e
+            done.put((None, count, error))
+        
+        worker = threading.Thread(target=_produce, name="openvino-infer-stream", daemon=True)
+        worker.start()
+        
+        finished: Dict[int, int] = {}  # index -> chunks completed
+        next_index = 0
+        total = None
+        try:
+            while total is None or next_index < total:
+                index, count, error = done.get()
+                if index is None:
+                    if error is not None:
+                        raise error
+                    total = count
+                    continue
+                finished[index] = finished.get(index, 0) + 1
+                
+                # Yield every input whose chunks have all arrived, in order
+                while next_index in finished and finished[next_index] == inputs[next_index][0]:
+                    del finished[next_index]
+                    chunks, samples, start_time, result = inputs.pop(next_index)
+                    modified_audio = result
+                    processing_time = (time.perf_counter_ns() - start_time) * 1e-6
+                    self._record_inference(processing_time, samples * len(modified_audio) * 10,
+                                           confidence=min(1.0, max(0.0, 1.0 - processing_time / 100.0)))
+                    next_index += 1
+                    yield modified_audio
+        finally:
+            stop.set()
+    
+    def _is_silent(self, audio: np.ndarray) -> bool:
+        """Whether audio's mean-square level is under the silence gate (one dot product)"""
+        if not audio.size:
+            return True
+        if audio.dtype == np.int16:
+            # Accumulate in float64; int16 products would overflow
+            energy = float(np.einsum('i,i->', audio, audio, dtype=np.float64)) / (32768.0 * 32768.0)
+        else:
+            energy = float(np.dot(audio, audio))
+        return energy < self._silence_ms * audio.size
+    
+    def _silence_result(self, audio: np.ndarray, sample_rate: int, start_time: int) -> MLInferenceResult:
+        """Silence at the model rate for a frame the energy gate skipped"""
+        with self._lock:
+            self.silence_skipped += 1
+        samples = len(audio) if sample_rate == self.sample_rate else int(round(len(audio) * self.sample_rate / sample_rate))
+        return MLInferenceResult(
+            modified_audio=np.zeros(samples, dtype=np.float32),
+            pitch_shift=0.0,
+            formant_ratio=1.0,
+            confidence=1.0,
+            processing_time_ms=(time.perf_counter_ns() - start_time) * 1e-6,
+            model_used="silence_skip"
+        )
+    
+    def _record_inference(self, processing_time: float, ops_estimate: int,
+                          pitch_shift: float = 0.0, formant_ratio: float = 1.0,
+                          confidence: float = 0.0):
+        """Update timing/TOPS counters and the stats window for one completed inference"""
+        with self._lock:
+            self._history[:, self._history_pos] = (processing_time, pitch_shift, formant_ratio, confidence)
+            self._history_pos = (self._history_pos + 1) % STATS_WINDOW
+            if self._history_len < STATS_WINDOW:
+                self._history_len += 1
+            
+            self._total_time_ms += processing_time
+            self.total_inferences += 1
+            self.total_ops += ops_estimate
+    
     def _fallback_process(self, audio: np.ndarray, sample_rate: int) -> MLInferenceResult:
         """Fallback processing when ML model not available"""
         # Simple passthrough with minimal processing
@@ -691,29 +1661,50 @@ class OpenVINOVoiceModifier:
             model_used="fallback"
         )
     
-    def _estimate_pitch_shift(self, original: np.ndarray, modified: np.ndarray) -> float:
-        """Estimate pitch shift in semitones"""
-        if not HAS_LIBROSA:
-            return 0.0
-        
+    def _estimate_pitch_shift(self, original: np.ndarray, sample_rate: int, modified: np.ndarray,
+                              f0_orig: float = 0.0) -> float:
+        """
+        Estimate pitch shift in semitones (modified is at the model rate);
+        f0_orig is the input's known F0, estimated from original if 0.0
+        """
         try:
-            # Extract pitch from both signals
-            f0_orig = librosa.yin(original, fmin=50, fmax=400)
-            f0_mod = librosa.yin(modified, fmin=50, fmax=400)
-            
-            # Calculate median
-            f0_orig_median = np.median(f0_orig[f0_orig > 0])
-            f0_mod_median = np.median(f0_mod[f0_mod > 0])
+            if f0_orig <= 0:
+                f0_orig = self._estimate_pitch_fft(original, sample_rate)
+            f0_mod = self._estimate_pitch_fft(modified, self.sample_rate)
             
-            if f0_orig_median > 0 and f0_mod_median > 0:
-                ratio = f0_mod_median / f0_orig_median
+            if f0_orig > 0 and f0_mod > 0:
+                ratio = f0_mod / f0_orig
                 semitones = 12 * np.log2(ratio)
                 return float(np.clip(semitones, -12, 12))
-        except:
+        except Exception:
             pass
         
         return 0.0
     
+    @staticmethod
+    def _estimate_pitch_fft(signal: np.ndarray, sample_rate: int, fmin: float = 50.0, fmax: float = 400.0) -> float:
+        """
+        Dominant f0 in Hz from one FFT autocorrelation (Wiener-Khinchin),
+        or 0.0 if the signal is silent or too short for fmin.
+        """
+        min_lag = int(sample_rate / fmax)
+        max_lag = int(sample_rate / fmin)
+        if len(signal) <= max_lag:
+            return 0.0
+        
+        # Zero-pad to >= 2N so the circular autocorrelation doesn't wrap
+        n_fft = next_fast_len(2 * len(signal)) if HAS_SCIPY else 2 * len(signal)
+        spectrum = np.fft.rfft(signal * np.hanning(len(signal)), n_fft)
+        power = np.square(spectrum.real)
+        power += np.square(spectrum.imag)
+        autocorr = np.fft.irfft(power, n_fft)
+        
+        if autocorr[0] <= 0:
+            return 0.0
+        
+        lag = min_lag + int(np.argmax(autocorr[min_lag:max_lag]))
+        return sample_rate / lag
+    
     def _estimate_formant_ratio(self, original: np.ndarray, modified: np.ndarray) -> float:
         """Estimate formant ratio"""
         # Simplified estimation
@@ -722,32 +1713,44 @@ class OpenVINOVoiceModifier:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get performance statistics including TOPS utilization"""
-        avg_time = np.mean(self.inference_times) if self.inference_times else 0.0
-        min_time = np.min(self.inference_times) if self.inference_times else 0.0
-        max_time = np.max(self.inference_times) if self.inference_times else 0.0
-        
-        # Calculate actual TOPS utilization
-        if self.inference_times and len(self.inference_times) > 0:
-            total_time_seconds = sum(self.inference_times) / 1000.0
-            if total_time_seconds > 0:
-                actual_tops = (self.total_ops / total_time_seconds) / 1e12  # Convert to TOPS
-                utilization = (actual_tops / self.device_capabilities['estimated_tops']) * 100
-            else:
-                actual_tops = 0.0
-                utilization = 0.0
+        with self._lock:
+            # Order within the window doesn't matter to any reduction below
+            window = self._history[:, :self._history_len].copy()
+        
+        if window.shape[1]:
+            times = window[0]
+            avg_time, min_time, max_time = float(times.mean()), float(times.min()), float(times.max())
+            p50, p95, p99 = (float(p) for p in np.percentile(times, (50, 95, 99)))
+            avg_pitch, avg_formant, avg_confidence = (float(v) for v in window[1:].mean(axis=1))
+        else:
+            avg_time = min_time = max_time = p50 = p95 = p99 = 0.0
+            avg_pitch, avg_formant, avg_confidence = 0.0, 1.0, 0.0
+        
+        # Calculate actual TOPS utilization (lifetime ops over lifetime time)
+        total_time_seconds = self._total_time_ms / 1000.0
+        if total_time_seconds > 0:
+            actual_tops = (self.total_ops / total_time_seconds) / 1e12  # Convert to TOPS
+            utilization = (actual_tops / self.device_capabilities['estimated_tops']) * 100
+            throughput = self.total_inferences / total_time_seconds
         else:
             actual_tops = 0.0
             utilization = 0.0
-        
-        # Calculate throughput
-        throughput = (self.total_inferences / (sum(self.inference_times) / 1000.0)) if self.inference_times and sum(self.inference_times) > 0 else 0.0
+            throughput = 0.0
         
         return {
             'total_inferences': self.total_inferences,
+            'silence_skipped': self.silence_skipped,
             'avg_processing_time_ms': avg_time,
             'min_processing_time_ms': min_time,
             'max_processing_time_ms': max_time,
+            'p50_processing_time_ms': p50,
+            'p95_processing_time_ms': p95,
+            'p99_processing_time_ms': p99,
+            'avg_pitch_shift': avg_pitch,
+            'avg_formant_ratio': avg_formant,
+            'avg_confidence': avg_confidence,
             'device': self.device,
+            'execution_devices': self.execution_devices,
             'model_loaded': self.compiled_model is not None,
             'hardware_capabilities': self.device_capabilities,
             'estimated_tops': self.device_capabilities['estimated_tops'],
@@ -758,6 +1761,10 @@ class OpenVINOVoiceModifier:
             'precision': self.precision,
             'batch_size': self.batch_size,
             'num_streams': self.num_streams,
+            'compiled_num_streams': dict(self._stream_counts),
+            'dynamic_length': self.dynamic_length,
+            'cache_dir': self.cache_dir,
+            'load_time_ms': round(self.load_time_ms, 1),
         }
 
 
@@ -771,22 +1778,28 @@ class MLDynamicAnonymizer:
     
     def __init__(self,
                  model_path: Optional[str] = None,
-                 device: str = "CPU",
-                 use_ml: bool = True):
+                 device: str = "AUTO",
+                 use_ml: bool = True,
+                 max_batch: int = 1,
+                 flush_ms: float = 2.0):
         """
         Initialize ML-enhanced dynamic anonymizer.
         
         Args:
             model_path: Path to OpenVINO voice conversion model
-            device: Inference device (CPU, GPU, VPU)
+            device: Inference device (CPU, GPU, VPU, AUTO)
             use_ml: Enable ML processing (falls back to rule-based if False)
+            max_batch: Frames from concurrent process() calls to batch into
+                       one infer_batch() call (1 disables batching)
+            flush_ms: Longest a frame waits for the batch to fill
         """
-        self.use_ml = use_ml and HAS_OPENVINO
+        self.use_ml = use_ml and _lazy_ov() is not None
         
         if self.use_ml:
             self.ml_modifier = OpenVINOVoiceModifier(
                 model_path=model_path,
-                device=device
+                device=device,
+                batch_size=max(1, max_batch)
             )
         else:
             self.ml_modifier = None
@@ -799,6 +1812,104 @@ class MLDynamicAnonymizer:
         # Hybrid mode: combine ML and rule-based
         self.hybrid_mode = True
         self.ml_weight = 0.7  # 70% ML, 30% rule-based
+        
+        # Re-estimate F0 every N process() calls, reusing the last track
+        # in between (raise for streams of short frames from one speaker)
+        self.f0_interval = 1
+        self._f0_calls = 0
+        self._last_f0: Optional[np.ndarray] = None
+        
+        # process() may run on several threads (that is what batching is
+        # for); this serialises the shared F0 track and the rule-based
+        # anonymizer, whose process_telemetry is single-writer
+        self._state_lock = threading.Lock()
+        
+        # Adaptive batching: pending [audio, sample_rate, result, error, taken]
+        # entries, flushed by whichever caller fills the batch or times out
+        self.max_batch = max(1, max_batch)
+        self.flush_ms = flush_ms
+        self._pending: deque = deque()
+        self._batch_cond = threading.Condition()
+        self._rule_based_logged = False  # Rule-based mode is logged once, not per call
+    
+    def _f0_track(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        """F0 track for audio, recomputed every f0_interval calls"""
+        if self.f0_interval <= 1:
+            return yin_f0(audio, sample_rate)
+        
+        # Reusing a track only makes sense for a single stream; the lock
+        # keeps the shared track and call count consistent regardless
+        with self._state_lock:
+            if self._last_f0 is None or self._f0_calls % self.f0_interval == 0:
+                self._last_f0 = yin_f0(audio, sample_rate)
+            self._f0_calls += 1
+            return self._last_f0
+    
+    def _rule_based_params(self, f0_median: float) -> Dict[str, Any]:
+        """Feed one F0 sample to the rule-based anonymizer"""
+        with self._state_lock:
+            return self.rule_based.process_telemetry({'f0_median': f0_median})
+    
+    def _infer_batched(self, audio: np.ndarray, sample_rate: int) -> MLInferenceResult:
+        """
+        Queue audio for the next infer_batch() and wait for its result.
+        
+        The caller that fills the batch to max_batch, or whose flush_ms
+        deadline passes first, runs inference for everything pending;
+        results are handed back to each caller by entry. The batch is taken
+        under the lock but inferred outside it, so new frames keep queuing
+        while a batch runs.
+        """
+        entry = [audio, sample_rate, None, None, False]
+        deadline = time.monotonic() + self.flush_ms / 1000.0
+        batch = None
+        
+        with self._batch_cond:
+            self._pending.append(entry)
+            self._batch_cond.notify_all()
+            
+            while not entry[4]:
+                remaining = deadline - time.monotonic()
+                if len(self._pending) < self.max_batch and remaining > 0:
+                    self._batch_cond.wait(remaining)
+                    continue
+                
+                batch = list(self._pending)
+                self._pending.clear()
+                for pending in batch:
+                    pending[4] = True
+        
+        if batch is not None:
+            try:
+                self._run_batch(batch)
+            finally:
+                with self._batch_cond:
+                    self._batch_cond.notify_all()
+        else:
+            # Another caller took this frame; wait for it to post the result
+            with self._batch_cond:
+                while entry[2] is None and entry[3] is None:
+                    self._batch_cond.wait()
+        
+        if entry[3] is not None:
+            raise entry[3]
+        return entry[2]
+    
+    def _run_batch(self, batch: List[list]):
+        """Infer a taken batch, storing each entry's result or error"""
+        by_rate: Dict[int, List[list]] = {}
+        for pending in batch:
+            by_rate.setdefault(pending[1], []).append(pending)
+        for rate, group in by_rate.items():
+            try:
+                results = self.ml_modifier.infer_batch([p[0] for p in group], rate)
+                for pending, result in zip(group, results):
+                    pending[2] = result
+            except BaseException as e:
+                for pending in group:
+                    pending[3] = e
+                if not isinstance(e, Exception):
+                    raise
     
     def process(self, 
                 audio: np.ndarray,
@@ -816,15 +1927,22 @@ class MLDynamicAnonymizer:
             Tuple of (modified_audio, metadata)
         """
         if self.use_ml and self.ml_modifier and self.ml_modifier.compiled_model:
+            # Extract F0 once; infer() reuses it for its pitch-shift estimate
+            # and returns its median for the rule-based telemetry
+            f0 = self._f0_track(audio, sample_rate) if self.hybrid_mode else None
+            
             # ML-based processing
-            result = self.ml_modifier.infer(audio, sample_rate)
+            if self.max_batch > 1:
+                result = self._infer_batched(audio, sample_rate)
+            else:
+                result = self.ml_modifier.infer(audio, sample_rate, pre_f0=f0)
             
             # Optionally blend with rule-based
             if self.hybrid_mode:
                 # Apply rule-based adjustments
-                rule_params = self.rule_based.process_telemetry({
-                    'f0_median': np.mean(librosa.yin(audio, fmin=50, fmax=400)) if HAS_LIBROSA else 165.0
-                })
+                rule_params = self._rule_based_params(
+                    result.f0_median or _median_f0(f0, 165.0)
+                )
                 
                 # Blend results (simplified - in practice would apply rule-based post-processing)
                 modified_audio = result.modified_audio
@@ -844,10 +1962,12 @@ class MLDynamicAnonymizer:
         
         else:
             # Fallback to rule-based
-            logger.debug("Using rule-based anonymization")
-            params = self.rule_based.process_telemetry({
-                'f0_median': np.mean(librosa.yin(audio, fmin=50, fmax=400)) if HAS_LIBROSA else 165.0
-            })
+            if not self._rule_based_logged:
+                self._rule_based_logged = True
+                logger.debug("Using rule-based anonymization")
+            params = self._rule_based_params(
+                _median_f0(self._f0_track(audio, sample_rate), 165.0)
+            )
             
             # Apply rule-based modifications (would need actual audio processing here)
             modified_audio = audio.copy()  # Placeholder
@@ -878,7 +1998,7 @@ class MLDynamicAnonymizer:
 
 # Convenience functions
 def create_ml_anonymizer(model_path: Optional[str] = None,
-                        device: str = "CPU") -> MLDynamicAnonymizer:
+                        device: str = "AUTO") -> MLDynamicAnonymizer:
     """
     Create ML-enhanced anonymizer.
     
@@ -895,15 +2015,16 @@ def create_ml_anonymizer(model_path: Optional[str] = None,
 def check_openvino_availability() -> Dict[str, Any]:
     """Check OpenVINO availability and device support"""
     result = {
-        'available': HAS_OPENVINO,
+        'available': _lazy_ov() is not None,
         'numpy_available': HAS_NUMPY,
-        'librosa_available': HAS_LIBROSA,
+        # Probe without importing; librosa is only loaded when used
+        'librosa_available': importlib.util.find_spec('librosa') is not None,
         'devices': [],
     }
     
-    if HAS_OPENVINO:
+    if result['available']:
         try:
-            core = Core()
+            core = ov.Core()
             result['devices'] = core.available_devices
         except:
             pass
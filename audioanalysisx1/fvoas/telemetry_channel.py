@@ -18,14 +18,18 @@ import logging
 import hashlib
 import time
 import json
+import struct
+import sys
 import zlib
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional, List, Tuple, Callable, Dict, Any
 import threading
-import queue
+from collections import deque
 from pathlib import Path
 
+from .kernel_interface import ThreatType
+
 logger = logging.getLogger(__name__)
 
 # Import numpy safely
@@ -37,6 +41,159 @@ except ImportError:
     HAS_NUMPY = False
     logger.warning("NumPy not available - some features disabled")
 
+# Import zstandard (optional, faster codec for telemetry packets)
+try:
+    import zstandard as zstd
+    HAS_ZSTD = True
+except ImportError:
+    zstd = None
+    HAS_ZSTD = False
+
+# Import orjson (optional, faster JSON encoder emitting UTF-8 bytes)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+# zstd frame magic; zlib streams start with 0x78 so the two never collide
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZSTD_LEVEL = 3
+
+# Frames compressed against a dictionary carry this prefix plus a 1-byte
+# dictionary ID, so receivers pick the matching dictionary
+DICT_FRAME_PREFIX = b'FVD'
+
+# Raw-content dictionaries primed with typical packets: the JSON keys and
+# enumerated strings are matched against them instead of being spelled out
+# in every frame. Entries are never edited once shipped; add a new ID and
+# point TELEMETRY_DICT_ID at it so older frames stay decodable.
+_TELEMETRY_DICTS = {
+    1: (
+        b'{"f0_median": 0.0, "formants": [0.0, 0.0, 0.0], '
+        b'"manipulation_confidence": 0.0, "ai_voice_probability": 0.0, '
+        b'"voiceprint_hash": "", "threat_type": null, "threat_confidence": 0.0, '
+        b'"artifact_signatures": [], "timestamp": "2025-01-01T00:00:00.000000+00:00", '
+        b'"classification_level": "SECRET", "session_id": "", "device_id": 9}'
+        b'"DEEPFAKE" "TTS" "VOICE_CLONE" "PITCH_SHIFT" "TIME_STRETCH" "COMBINED" '
+        b'"deepfake" "tts" "cloned" "mel_features_size": '
+    ),
+    # Compact separators, matching _json_dumps()
+    2: (
+        b'{"f0_median":0.0,"formants":[0.0,0.0,0.0],'
+        b'"manipulation_confidence":0.0,"ai_voice_probability":0.0,'
+        b'"voiceprint_hash":"","threat_type":null,"threat_confidence":0.0,'
+        b'"artifact_signatures":[],"timestamp":"2025-01-01T00:00:00.000000+00:00",'
+        b'"classification_level":"SECRET","session_id":"","device_id":9}'
+        b'"DEEPFAKE" "TTS" "VOICE_CLONE" "PITCH_SHIFT" "TIME_STRETCH" "COMBINED" '
+        b'"deepfake" "tts" "cloned" "mel_features_size":'
+    ),
+}
+TELEMETRY_DICT_ID = 2
+
+# Packets below this size go out as plain JSON; compressing them costs
+# CPU and rarely saves more than a few bytes
+MIN_COMPRESS_SIZE = 256
+
+# Fixed binary record for high-rate links: timestamp (epoch s), f0, F1-F3,
+# manipulation / AI / threat confidence, device ID, threat code and the raw
+# SHA-384 voiceprint digest
+_RECORD_STRUCT = struct.Struct('<d7fHB48s')  # 87 bytes
+RECORD_SIZE = _RECORD_STRUCT.size
+
+# Threat codes are ThreatType values (NONE = no threat); other threat
+# strings are carried as _OTHER_THREAT
+_THREAT_CODES = {t.name: t.value for t in ThreatType if t is not ThreatType.NONE}
+_THREAT_NAMES = {v: k for k, v in _THREAT_CODES.items()}
+_OTHER_THREAT = 0xFF
+_NO_DIGEST = bytes(48)
+
+# Compression contexts are not thread-safe, so each thread keeps its own
+_codec_local = threading.local()
+
+# Per-thread float32 workspace for normalising speaker embeddings
+_embedding_local = threading.local()
+
+
+def _zstd_contexts(dict_id: Optional[int] = None):
+    """Get this thread's reusable zstd (compressor, decompressor) pair"""
+    cache = getattr(_codec_local, 'zstd', None)
+    if cache is None:
+        cache = _codec_local.zstd = {}
+
+    contexts = cache.get(dict_id)
+    if contexts is None:
+        if dict_id is None:
+            contexts = (zstd.ZstdCompressor(level=ZSTD_LEVEL), zstd.ZstdDecompressor())
+        else:
+            dict_data = zstd.ZstdCompressionDict(
+                _TELEMETRY_DICTS[dict_id], dict_type=zstd.DICT_TYPE_RAWCONTENT
+            )
+            contexts = (
+                zstd.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dict_data),
+                zstd.ZstdDecompressor(dict_data=dict_data),
+            )
+        cache[dict_id] = contexts
+    return contexts
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when available"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _encode_payload(data: bytes) -> bytes:
+    """Compress serialized JSON, keeping it plain when that is smaller"""
+    if len(data) < MIN_COMPRESS_SIZE:
+        return data
+
+    if HAS_ZSTD:
+        header = DICT_FRAME_PREFIX + bytes((TELEMETRY_DICT_ID,))
+        compressed = header + _zstd_contexts(TELEMETRY_DICT_ID)[0].compress(data)
+    else:
+        compressed = zlib.compress(data, level=6)
+
+    if len(compressed) >= len(data) - 8:
+        return data
+    return compressed
+
+
+def _decode_payload(data: bytes) -> bytes:
+    """Undo _encode_payload(), dispatching on the frame's leading bytes"""
+    if data[:1] in (b'{', b'['):
+        return data
+
+    if data[:3] == DICT_FRAME_PREFIX or data[:4] == ZSTD_MAGIC:
+        if not HAS_ZSTD:
+            raise ValueError("zstd-compressed telemetry requires the zstandard package")
+        dict_id = None
+        if data[:3] == DICT_FRAME_PREFIX:
+            dict_id = data[3]
+            if dict_id not in _TELEMETRY_DICTS:
+                raise ValueError(f"Unknown telemetry dictionary ID: {dict_id}")
+            data = data[4:]
+        return _zstd_contexts(dict_id)[1].decompress(data)
+
+    return zlib.decompress(data)
+
+
+def _embedding_buffer(shape) -> 'np.ndarray':
+    """Get this thread's reusable float32 buffer for an embedding shape"""
+    buf = getattr(_embedding_local, 'buf', None)
+    if buf is None or buf.shape != shape:
+        buf = _embedding_local.buf = np.empty(shape, dtype=np.float32)
+    return buf
+
 
 @dataclass
 class VoiceTelemetry:
@@ -72,6 +229,11 @@ class VoiceTelemetry:
     session_id: str = ""
     device_id: int = 9  # DSMIL Audio device
 
+    # (timestamp, isoformat) of the last serialization
+    _iso_cache: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_dict(self, include_embeddings: bool = False) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         result = {
@@ -83,7 +245,7 @@ class VoiceTelemetry:
             'threat_type': self.threat_type,
             'threat_confidence': self.threat_confidence,
             'artifact_signatures': self.artifact_signatures,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp_iso(),
             'classification_level': self.classification_level,
             'session_id': self.session_id,
             'device_id': self.device_id,
@@ -99,38 +261,183 @@ class VoiceTelemetry:
 
         return result
 
+    def timestamp_iso(self) -> str:
+        """ISO-8601 timestamp, formatted once per timestamp value"""
+        cached = self._iso_cache
+        if cached is None or cached[0] is not self.timestamp:
+            cached = self._iso_cache = (self.timestamp, self.timestamp.isoformat())
+        return cached[1]
+
     def compute_voiceprint_hash(self) -> str:
-        """Compute SHA-384 hash of speaker embedding"""
+        """
+        Compute SHA-384 hash of speaker embedding.
+
+        SHA-384 is required for voiceprints (SC-13), so the algorithm is
+        fixed; the embedding is normalised into a reused float32 buffer
+        that is hashed in place without copying it.
+        """
         if not HAS_NUMPY or self.speaker_embedding is None:
             return ""
 
-        # Normalize embedding
-        norm = np.linalg.norm(self.speaker_embedding)
+        embedding = self.speaker_embedding
+
+        # Normalize embedding straight into the float32 workspace
+        norm = np.linalg.norm(embedding)
         if norm > 0:
-            normalized = self.speaker_embedding / norm
+            data = _embedding_buffer(embedding.shape)
+            np.divide(embedding, norm, out=data, casting='same_kind')
         else:
-            normalized = self.speaker_embedding
+            data = np.ascontiguousarray(embedding, dtype=np.float32)
 
-        # Hash
-        data = normalized.astype(np.float32).tobytes()
         hash_obj = hashlib.sha384(data)
         self.voiceprint_hash = hash_obj.hexdigest()
         return self.voiceprint_hash
 
+    @staticmethod
+    def compute_voiceprint_hashes(batch: List['VoiceTelemetry']):
+        """
+        Compute voiceprint hashes for a batch of telemetry.
+
+        Embeddings of the same shape and dtype are normalised together in
+        one divide; digests match compute_voiceprint_hash() exactly.
+        Anything else is hashed packet by packet.
+        """
+        if not HAS_NUMPY:
+            return
+
+        rows = [t for t in batch if t.speaker_embedding is not None]
+        if not rows:
+            return
+
+        first = rows[0].speaker_embedding
+        if first.ndim != 1 or any(
+            t.speaker_embedding.shape != first.shape or t.speaker_embedding.dtype != first.dtype
+            for t in rows
+        ):
+            for t in rows:
+                t.compute_voiceprint_hash()
+            return
+
+        # Per-row dot products keep each norm bit-identical to np.linalg.norm
+        embeddings = np.stack([t.speaker_embedding for t in rows])
+        norms = np.sqrt(np.array([e.dot(e) for e in embeddings], dtype=embeddings.dtype))
+        if not norms.all():
+            for t in rows:
+                t.compute_voiceprint_hash()
+            return
+
+        normalized = np.empty(embeddings.shape, dtype=np.float32)
+        np.divide(embeddings, norms[:, None], out=normalized, casting='same_kind')
+        for t, row in zip(rows, normalized):
+            t.voiceprint_hash = hashlib.sha384(row).hexdigest()
+
     def to_json(self) -> str:
         """Serialize to JSON string"""
         return json.dumps(self.to_dict())
 
     def compress(self) -> bytes:
-        """Compress telemetry for transmission"""
-        data = self.to_json().encode('utf-8')
-        return zlib.compress(data, level=6)
+        """
+        Compress telemetry for transmission.
+
+        Small packets, and packets the codec can't shrink, are returned as
+        plain JSON; decompress() recognises those by their leading '{'.
+        """
+        return _encode_payload(_json_dumps(self.to_dict()))
 
     @classmethod
     def decompress(cls, data: bytes) -> 'VoiceTelemetry':
-        """Decompress and deserialize telemetry"""
-        json_data = zlib.decompress(data).decode('utf-8')
-        d = json.loads(json_data)
+        """Decompress and deserialize telemetry (plain JSON, zstd or zlib frames)"""
+        return cls.from_dict(_json_loads(_decode_payload(data)))
+
+    @staticmethod
+    def compress_batch(batch: List['VoiceTelemetry']) -> bytes:
+        """
+        Compress a batch of telemetry as a single frame.
+
+        Packets repeat the same keys, so one frame over the whole batch
+        compresses far better than a frame per packet.
+        """
+        return _encode_payload(_json_dumps([t.to_dict() for t in batch]))
+
+    @classmethod
+    def decompress_batch(cls, data: bytes) -> List['VoiceTelemetry']:
+        """Decompress and deserialize a frame produced by compress_batch()"""
+        return [cls.from_dict(d) for d in _json_loads(_decode_payload(data))]
+
+    def _record_fields(self) -> tuple:
+        """Values in _RECORD_STRUCT order"""
+        threat = self.threat_type
+        if threat is None:
+            code = ThreatType.NONE.value
+        else:
+            code = _THREAT_CODES.get(threat, _OTHER_THREAT)
+
+        digest = _NO_DIGEST
+        if len(self.voiceprint_hash) == 96:
+            digest = bytes.fromhex(self.voiceprint_hash)
+
+        f1, f2, f3 = self.formants
+        return (self.timestamp.timestamp(), self.f0_median, f1, f2, f3,
+                self.manipulation_confidence, self.ai_voice_probability,
+                self.threat_confidence, self.device_id, code, digest)
+
+    def to_bytes(self) -> bytes:
+        """
+        Convert to the fixed binary record (87 bytes).
+
+        Measurements are stored as float32. Session, classification and
+        artifact strings are not carried, and threat types other than the
+        kernel's ThreatType names come back as 'OTHER'.
+        """
+        return _RECORD_STRUCT.pack(*self._record_fields())
+
+    def pack_into(self, buf: bytearray, offset: int = 0):
+        """Write the binary record into buf at offset (87 bytes)"""
+        _RECORD_STRUCT.pack_into(buf, offset, *self._record_fields())
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> 'VoiceTelemetry':
+        """Parse a binary record written by to_bytes()"""
+        if len(data) - offset < RECORD_SIZE:
+            raise ValueError(f"Expected {RECORD_SIZE} bytes, got {len(data) - offset}")
+
+        (ts, f0, f1, f2, f3, manipulation, ai_prob, threat_conf,
+         device_id, code, digest) = _RECORD_STRUCT.unpack_from(data, offset)
+
+        if code == ThreatType.NONE.value:
+            threat_type = None
+        else:
+            threat_type = _THREAT_NAMES.get(code, 'OTHER')
+
+        return cls(
+            f0_median=f0,
+            formants=(f1, f2, f3),
+            manipulation_confidence=manipulation,
+            ai_voice_probability=ai_prob,
+            voiceprint_hash=digest.hex() if digest != _NO_DIGEST else '',
+            threat_type=threat_type,
+            threat_confidence=threat_conf,
+            timestamp=datetime.fromtimestamp(ts, timezone.utc),
+            device_id=device_id,
+        )
+
+    @staticmethod
+    def pack_batch(batch: List['VoiceTelemetry']) -> bytes:
+        """Pack a batch as back-to-back binary records"""
+        buf = bytearray(RECORD_SIZE * len(batch))
+        for i, telemetry in enumerate(batch):
+            telemetry.pack_into(buf, i * RECORD_SIZE)
+        return bytes(buf)
+
+    @classmethod
+    def unpack_batch(cls, data: bytes) -> List['VoiceTelemetry']:
+        """Parse back-to-back binary records written by pack_batch()"""
+        return [cls.from_bytes(data, offset) for offset in range(0, len(data), RECORD_SIZE)]
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> 'VoiceTelemetry':
+        """Rebuild telemetry from a to_dict() dictionary"""
+        ts = d.get('timestamp')
         return cls(
             f0_median=d.get('f0_median', 0.0),
             formants=tuple(d.get('formants', [0.0, 0.0, 0.0])),
@@ -140,13 +447,20 @@ class VoiceTelemetry:
             threat_type=d.get('threat_type'),
             threat_confidence=d.get('threat_confidence', 0.0),
             artifact_signatures=d.get('artifact_signatures', []),
-            timestamp=datetime.fromisoformat(d.get('timestamp', datetime.now(timezone.utc).isoformat())),
+            timestamp=datetime.fromisoformat(ts) if ts else datetime.now(timezone.utc),
             classification_level=d.get('classification_level', 'SECRET'),
             session_id=d.get('session_id', ''),
             device_id=d.get('device_id', 9),
         )
 
 
+def _add_ai_path():
+    """Put the DSMIL ai/ tree on sys.path for brain and crypto imports"""
+    path = str(Path(__file__).parents[4] / 'ai')
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
 class TelemetryChannel:
     """
     Manages telemetry streaming to DSMILBrain.
@@ -163,7 +477,10 @@ class TelemetryChannel:
                  brain=None,
                  encrypt: bool = True,
                  batch_size: int = 10,
-                 flush_interval: float = 1.0):
+                 flush_interval: float = 1.0,
+                 max_retries: int = 2,
+                 retry_backoff: float = 0.05,
+                 binary_batches: bool = False):
         """
         Initialize telemetry channel.
 
@@ -172,19 +489,34 @@ class TelemetryChannel:
             encrypt: Enable DSSSL encryption for telemetry
             batch_size: Number of items to batch before sending
             flush_interval: Max seconds to wait before flushing batch
+            max_retries: Retries for a failed brain call before giving up
+            retry_backoff: Initial retry delay in seconds, doubled per retry
+            binary_batches: Send batches as fixed binary records instead of
+                compressed JSON (measurements only, see VoiceTelemetry.to_bytes)
         """
         self.brain = brain
         self.encrypt = encrypt
         self.batch_size = batch_size
         self.flush_interval = flush_interval
-
-        # Telemetry queue (thread-safe)
-        self._queue: queue.Queue = queue.Queue(maxsize=10000)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.binary_batches = binary_batches
+
+        # Telemetry queue: deque appends/pops are atomic, and maxlen drops
+        # the oldest packet on overflow. _wake tells the worker it has work.
+        self._queue: deque = deque(maxlen=10000)
+        self._wake = threading.Event()
         self._running = False
         self._worker_thread: Optional[threading.Thread] = None
 
         # Crypto (lazy-loaded)
         self._crypto = None
+        self._security_level = None
+
+        # Set once an import has shown the brain / crypto layer is absent,
+        # so the worker doesn't retry a failing import on every packet
+        self._brain_missing = False
+        self._crypto_missing = False
 
         # Statistics
         self.stats = {
@@ -194,6 +526,7 @@ class TelemetryChannel:
             'threats_reported': 0,
             'bytes_transmitted': 0,
             'batches_sent': 0,
+            'retries': 0,
         }
 
         # Callbacks
@@ -205,15 +538,20 @@ class TelemetryChannel:
         """Get or discover DSMILBrain instance"""
         if self.brain is not None:
             return self.brain
+        if self._brain_missing:
+            return None
 
         try:
             # Try to import and get brain instance
-            import sys
-            sys.path.insert(0, str(Path(__file__).parents[4] / 'ai'))
+            _add_ai_path()
             from brain.brain_interface import DSMILBrain
             self.brain = DSMILBrain.get_instance()
             return self.brain
-        except (ImportError, AttributeError) as e:
+        except ImportError as e:
+            self._brain_missing = True
+            logger.debug(f"DSMILBrain not available: {e}")
+            return None
+        except AttributeError as e:
             logger.debug(f"DSMILBrain not available: {e}")
             return None
 
@@ -221,15 +559,18 @@ class TelemetryChannel:
         """Get DSSSL crypto layer"""
         if self._crypto is not None:
             return self._crypto
+        if self._crypto_missing:
+            return None
 
         try:
-            import sys
-            sys.path.insert(0, str(Path(__file__).parents[4] / 'ai'))
-            from integrations.security.quantum import get_crypto_layer
+            _add_ai_path()
+            from integrations.security.quantum import get_crypto_layer, SecurityLevel
             self._crypto = get_crypto_layer()
+            self._security_level = SecurityLevel.SECRET
             logger.info("DSSSL quantum crypto initialized")
             return self._crypto
         except ImportError as e:
+            self._crypto_missing = True
             logger.debug(f"DSSSL crypto not available: {e}")
             return None
 
@@ -254,11 +595,8 @@ class TelemetryChannel:
 
         self._running = False
 
-        # Wait for queue to drain
-        try:
-            self._queue.join()
-        except Exception:
-            pass
+        # Wake the worker; it drains the queue before exiting
+        self._wake.set()
 
         if self._worker_thread:
             self._worker_thread.join(timeout=timeout)
@@ -275,15 +613,10 @@ class TelemetryChannel:
         """
         self.stats['telemetry_queued'] += 1
 
-        try:
-            self._queue.put_nowait(telemetry)
-        except queue.Full:
+        if len(self._queue) == self._queue.maxlen:
             logger.warning("Telemetry queue full, dropping oldest")
-            try:
-                self._queue.get_nowait()
-                self._queue.put_nowait(telemetry)
-            except queue.Empty:
-                pass
+        self._queue.append(telemetry)
+        self._wake.set()
 
         # Check for threats
         if telemetry.threat_type is not None:
@@ -297,20 +630,31 @@ class TelemetryChannel:
     def _process_queue(self):
         """Background thread for processing telemetry queue"""
         batch: List[VoiceTelemetry] = []
-        last_flush = time.time()
+        last_flush = time.monotonic()
+
+        pending = self._queue
 
-        while self._running or not self._queue.empty():
+        while True:
             try:
-                # Try to get item with timeout
-                try:
-                    telemetry = self._queue.get(timeout=0.1)
-                    batch.append(telemetry)
-                    self._queue.task_done()
-                except queue.Empty:
-                    pass
+                if not pending:
+                    if not self._running:
+                        break
+
+                    # Sleep until submit() or stop() sets the event, or the
+                    # pending batch is due; an idle channel never wakes
+                    timeout = None
+                    if batch:
+                        timeout = max(last_flush + self.flush_interval - time.monotonic(), 0.0)
+                    self._wake.wait(timeout)
+                    self._wake.clear()
+
+                # This thread is the only consumer, so everything counted
+                # here is still queued when popped
+                for _ in range(min(self.batch_size - len(batch), len(pending))):
+                    batch.append(pending.popleft())
 
                 # Flush batch if needed
-                now = time.time()
+                now = time.monotonic()
                 should_flush = (
                     len(batch) >= self.batch_size or
                     (batch and now - last_flush >= self.flush_interval)
@@ -333,39 +677,117 @@ class TelemetryChannel:
         brain = self._get_brain()
         self.stats['batches_sent'] += 1
 
+        # Hash any embeddings not hashed yet, normalising the batch at once
+        unhashed = [t for t in batch if t.speaker_embedding is not None and not t.voiceprint_hash]
+        if unhashed:
+            VoiceTelemetry.compute_voiceprint_hashes(unhashed)
+
+        if self._send_batch_frame(brain, batch):
+            return
+
         for telemetry in batch:
             try:
                 # Convert to dict
                 data = telemetry.to_dict()
+                nbytes = 0
 
                 # Encrypt if enabled
                 if self.encrypt:
                     crypto = self._get_crypto()
                     if crypto:
                         try:
-                            from ai.integrations.security.quantum import SecurityLevel
-                            encrypted = crypto.encrypt_json(data, SecurityLevel.SECRET)
+                            encrypted = crypto.encrypt_json(data, self._security_level)
                             data = {'encrypted': True, 'payload': encrypted, 'level': 'SECRET'}
+                            nbytes = len(encrypted)
                         except Exception as e:
                             logger.debug(f"Encryption skipped: {e}")
 
-                # Send to brain
+                # Send to brain (plain packets go over as dicts, so only the
+                # encrypted payload has a wire size to count)
                 if brain:
                     self._send_to_brain(brain, telemetry, data)
 
                 self.stats['telemetry_sent'] += 1
-                self.stats['bytes_transmitted'] += len(str(data))
+                self.stats['bytes_transmitted'] += nbytes
 
             except Exception as e:
                 logger.error(f"Failed to send telemetry: {e}")
                 self.stats['telemetry_failed'] += 1
 
+    def _send_batch_frame(self, brain, batch: List[VoiceTelemetry]) -> bool:
+        """
+        Send the whole batch as one compressed frame.
+
+        Only used when the brain accepts batches and the packets would go
+        out unencrypted; otherwise returns False and the batch is sent
+        packet by packet.
+        """
+        if brain is None or not hasattr(brain, 'ingest_telemetry_batch'):
+            return False
+        if self.encrypt and self._get_crypto() is not None:
+            return False
+
+        try:
+            if self.binary_batches:
+                payload = VoiceTelemetry.pack_batch(batch)
+            else:
+                payload = VoiceTelemetry.compress_batch(batch)
+            self._with_retry(brain.ingest_telemetry_batch, {
+                'batch': True,
+                'count': len(batch),
+                'format': 'records' if self.binary_batches else 'json',
+                'payload': payload,
+            })
+        except Exception as e:
+            logger.debug(f"Batch ingestion failed, sending packets singly: {e}")
+            return False
+
+        for telemetry in batch:
+            if telemetry.threat_type is not None:
+                self._propagate_threat(brain, telemetry)
+
+        self.stats['telemetry_sent'] += len(batch)
+        self.stats['bytes_transmitted'] += len(payload)
+        return True
+
+    def _propagate_threat(self, brain, telemetry: VoiceTelemetry):
+        """Propagate a detected threat to the brain's intel network"""
+        if not hasattr(brain, 'propagate_intel'):
+            return
+
+        try:
+            self._with_retry(brain.propagate_intel, {
+                'type': 'voice_threat',
+                'threat_type': telemetry.threat_type,
+                'confidence': telemetry.threat_confidence,
+                'voiceprint_hash': telemetry.voiceprint_hash,
+                'artifacts': telemetry.artifact_signatures,
+                'timestamp': telemetry.timestamp_iso(),
+            }, priority='high')
+        except Exception as e:
+            logger.debug(f"Brain integration error: {e}")
+
+    def _with_retry(self, func: Callable, *args, **kwargs):
+        """Call a brain method, retrying failures with exponential backoff"""
+        delay = self.retry_backoff
+        for attempt in range(self.max_retries + 1):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                self.stats['retries'] += 1
+                logger.debug(f"Brain call failed ({e}), retrying in {delay:.2f}s")
+                time.sleep(delay)
+                delay *= 2
+
     def _send_to_brain(self, brain, telemetry: VoiceTelemetry, data: Dict[str, Any]):
         """Send telemetry to brain memory systems"""
         try:
             # Store in working memory
             if hasattr(brain, '_working_memory') and brain._working_memory:
-                brain._working_memory.store(
+                self._with_retry(
+                    brain._working_memory.store,
                     key=f"voice_telemetry:{telemetry.session_id}:{telemetry.timestamp.timestamp()}",
                     value=data,
                     metadata={
@@ -377,15 +799,8 @@ class TelemetryChannel:
                 )
 
             # If threat detected, propagate intel
-            if telemetry.threat_type is not None and hasattr(brain, 'propagate_intel'):
-                brain.propagate_intel({
-                    'type': 'voice_threat',
-                    'threat_type': telemetry.threat_type,
-                    'confidence': telemetry.threat_confidence,
-                    'voiceprint_hash': telemetry.voiceprint_hash,
-                    'artifacts': telemetry.artifact_signatures,
-                    'timestamp': telemetry.timestamp.isoformat(),
-                }, priority='high')
+            if telemetry.threat_type is not None:
+                self._propagate_threat(brain, telemetry)
 
         except Exception as e:
             logger.debug(f"Brain integration error: {e}")
@@ -410,7 +825,7 @@ class TelemetryChannel:
                     'formants': list(telemetry.formants),
                     'manipulation_confidence': telemetry.manipulation_confidence,
                     'ai_probability': telemetry.ai_voice_probability,
-                    'timestamp': telemetry.timestamp.isoformat(),
+                    'timestamp': telemetry.timestamp_iso(),
                 }, priority='critical')
 
             logger.warning(f"THREAT ALERT: {telemetry.threat_type} "
@@ -423,7 +838,7 @@ class TelemetryChannel:
         """Get channel statistics"""
         return {
             **self.stats,
-            'queue_size': self._queue.qsize(),
+            'queue_size': len(self._queue),
             'running': self._running,
             'brain_connected': self.brain is not None,
             'encryption_enabled': self.encrypt,
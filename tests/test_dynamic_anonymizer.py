@@ -0,0 +1,215 @@
+"""
+Tests for the FVOAS Dynamic Anonymizer
+======================================
+
+Adaptation behaviour and state snapshots of DynamicAnonymizer.
+"""
+
+import threading
+import time
+
+import pytest
+import numpy as np
+
+from audioanalysisx1.fvoas.dynamic_anonymizer import (
+    DynamicAnonymizer,
+    TargetProfile,
+    VoiceProfile,
+)
+
+
+def _telemetry_stream(f0_hz, n=300, seed=0):
+    """Telemetry dicts for a speaker around f0_hz with small jitter"""
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            'f0_median': float(f0_hz + rng.normal(0, 2)),
+            'formants': (float(450 + rng.normal(0, 10)),
+                         float(1400 + rng.normal(0, 20)),
+                         float(2400 + rng.normal(0, 30))),
+        }
+        for _ in range(n)
+    ]
+
+
+class TestRobotTarget:
+    """ROBOT runs the same adaptation pipeline as every other target."""
+
+    @pytest.mark.parametrize("f0_hz", [85.0, 150.0, 260.0])
+    def test_robot_matches_general_path(self, f0_hz):
+        """ROBOT output matches a CUSTOM anonymizer using the robot profile."""
+        robot = DynamicAnonymizer(target=TargetProfile.ROBOT)
+        general = DynamicAnonymizer(target=TargetProfile.CUSTOM,
+                                    custom_profile=VoiceProfile.robot())
+        robot.start()
+        general.start()
+
+        for telemetry in _telemetry_stream(f0_hz):
+            assert robot.process_telemetry(telemetry) == general.process_telemetry(telemetry)
+
+        assert dict(robot.get_state())['profile_stable'] == dict(general.get_state())['profile_stable']
+
+    def test_robot_reaches_target_outside_clamp_range(self):
+        """A low voice is shifted all the way to 150 Hz once stable."""
+        robot = DynamicAnonymizer(target=TargetProfile.ROBOT)
+        robot.start()
+
+        for telemetry in _telemetry_stream(85.0):
+            params = robot.process_telemetry(telemetry)
+
+        assert params['profile_stable']
+        expected = 12 * np.log2(150.0 / 85.0)
+        assert params['pitch_semitones'] == pytest.approx(expected, abs=0.3)
+        assert params['pitch_semitones'] > 6.0
+
+
+class TestParamsResults:
+    """Parameter dicts handed out are owned by the caller."""
+
+    def test_results_are_independent(self):
+        """A retained result is not changed by later samples."""
+        anonymizer = DynamicAnonymizer(target=TargetProfile.NEUTRAL)
+        anonymizer.start()
+        stream = _telemetry_stream(120.0, n=40)
+
+        first = anonymizer.process_telemetry(stream[0])
+        kept = dict(first)
+        for telemetry in stream[1:]:
+            latest = anonymizer.process_telemetry(telemetry)
+
+        assert latest is not first
+        assert first == kept
+
+    def test_callback_shares_read_only_result(self):
+        """on_params_changed gets the returned mapping, which can't be modified."""
+        anonymizer = DynamicAnonymizer(target=TargetProfile.NEUTRAL)
+        anonymizer.start()
+        seen = []
+        anonymizer.on_params_changed = seen.append
+
+        returned = [anonymizer.process_telemetry(t) for t in _telemetry_stream(120.0, n=20)]
+
+        assert all(p is r for p, r in zip(seen, returned))
+        with pytest.raises(TypeError):
+            returned[-1]['pitch_semitones'] = 0.0
+
+
+class TestProfileDerivedValues:
+    """Values derived from the profile follow the installed profile."""
+
+    def test_caller_edits_do_not_leak_in(self):
+        """Editing a custom profile after handing it over changes nothing."""
+        profile = VoiceProfile(f0_hz=200.0)
+        edited = DynamicAnonymizer(target=TargetProfile.CUSTOM, custom_profile=profile)
+        reference = DynamicAnonymizer(target=TargetProfile.CUSTOM,
+                                      custom_profile=VoiceProfile(f0_hz=200.0))
+        profile.f0_hz = 100.0
+        profile.adaptation_rate = 0.9
+        edited.start()
+        reference.start()
+
+        for telemetry in _telemetry_stream(120.0, n=80):
+            assert edited.process_telemetry(telemetry) == reference.process_telemetry(telemetry)
+
+    def test_set_target_rebuilds_derived_values(self):
+        """After set_target() the anonymizer behaves as if built with the new profile."""
+        new_profile = VoiceProfile(f0_hz=220.0, smoothing=0.5, adaptation_rate=0.4)
+        switched = DynamicAnonymizer(target=TargetProfile.MALE)
+        switched.set_target(TargetProfile.CUSTOM, new_profile)
+        fresh = DynamicAnonymizer(target=TargetProfile.CUSTOM, custom_profile=new_profile)
+        switched.start()
+        fresh.start()
+
+        for telemetry in _telemetry_stream(120.0, n=80):
+            assert switched.process_telemetry(telemetry) == fresh.process_telemetry(telemetry)
+
+
+class TestStateSnapshot:
+    """get_state() returns consistent, immutable snapshots."""
+
+    def test_snapshot_does_not_change(self):
+        """A snapshot taken earlier is unaffected by later samples."""
+        anonymizer = DynamicAnonymizer(target=TargetProfile.NEUTRAL)
+        anonymizer.start()
+        stream = _telemetry_stream(120.0, n=20)
+        anonymizer.process_telemetry(stream[0])
+
+        before = anonymizer.get_state()
+        kept = dict(before)
+        for telemetry in stream[1:]:
+            anonymizer.process_telemetry(telemetry)
+        anonymizer.stop()
+
+        assert dict(before) == kept
+        assert anonymizer.get_state()['samples_analyzed'] == 20
+        assert anonymizer.get_state()['running'] is False
+
+    def test_concurrent_reads_are_not_torn(self):
+        """Fields read from one snapshot always belong to the same sample."""
+        anonymizer = DynamicAnonymizer(target=TargetProfile.NEUTRAL)
+        anonymizer.start()
+        done = threading.Event()
+        torn = []
+
+        def read():
+            while not done.is_set():
+                state = dict(anonymizer.get_state())
+                count = state['samples_analyzed']
+                if count and state['current_f0'] != 100.0 + count:
+                    torn.append(state)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for i in range(1, 5001):
+                anonymizer.process_telemetry({'f0_median': 100.0 + i,
+                                              'formants': (500.0, 1500.0, 2500.0)})
+        finally:
+            done.set()
+            reader.join()
+
+        assert not torn
+
+    def test_snapshot_reused_until_state_changes(self):
+        """Repeated reads share one snapshot; a new sample yields a new one."""
+        anonymizer = DynamicAnonymizer(target=TargetProfile.NEUTRAL)
+        anonymizer.start()
+        stream = _telemetry_stream(120.0, n=2)
+
+        anonymizer.process_telemetry(stream[0])
+        first = anonymizer.get_state()
+        assert anonymizer.get_state() is first
+
+        anonymizer.process_telemetry(stream[1])
+        assert anonymizer.get_state() is not first
+        assert anonymizer.get_state()['samples_analyzed'] == 2
+
+
+class TestAdjustmentHistory:
+    """Adjustment history is opt-in and exposed read-only."""
+
+    def test_history_matches_getter(self):
+        """state.adjustment_history mirrors get_adjustment_history()."""
+        anonymizer = DynamicAnonymizer(target=TargetProfile.MALE, record_history=True)
+        anonymizer.start()
+        for telemetry in _telemetry_stream(210.0, n=50):
+            anonymizer.process_telemetry(telemetry)
+
+        history = anonymizer.state.adjustment_history
+        recorded = anonymizer.get_adjustment_history()
+        assert history
+        assert [h['pitch'] for h in history] == recorded['pitch']
+        assert [h['formant'] for h in history] == recorded['formant']
+        assert history[-1]['time'] == pytest.approx(time.time(), abs=5.0)
+
+        with pytest.raises(AttributeError):
+            anonymizer.state.adjustment_history = []
+
+    def test_history_off_by_default(self):
+        """Without record_history, nothing is recorded."""
+        anonymizer = DynamicAnonymizer(target=TargetProfile.MALE)
+        anonymizer.start()
+        for telemetry in _telemetry_stream(210.0, n=50):
+            anonymizer.process_telemetry(telemetry)
+
+        assert anonymizer.state.adjustment_history == []
@@ -0,0 +1,99 @@
+"""
+Tests for the FVOAS Kernel Interface
+====================================
+
+ioctl paths of FVOASKernelInterface against an in-process fake driver.
+"""
+
+import os
+
+import pytest
+
+from audioanalysisx1.fvoas import kernel_interface
+from audioanalysisx1.fvoas.kernel_interface import (
+    DeviceState,
+    FVOASKernelInterface,
+    ObfuscationMode,
+    ObfuscationParams,
+)
+
+
+class _FakeDriver:
+    """Stands in for fcntl.ioctl on the FVOAS character device"""
+
+    def __init__(self):
+        self.state = DeviceState()
+        self.calls = []
+
+    def ioctl(self, fd, cmd, buf, *args):
+        self.calls.append(cmd)
+        if cmd == kernel_interface.FVOAS_IOC_GET_STATE:
+            buf[:] = self.state.to_bytes()
+        elif cmd == kernel_interface.FVOAS_IOC_SET_STATE:
+            self.state = DeviceState.from_bytes(bytes(buf))
+        elif cmd == kernel_interface.FVOAS_IOC_GET_PARAMS:
+            buf[:] = self.state.params.to_bytes()
+        elif cmd == kernel_interface.FVOAS_IOC_SET_PARAMS:
+            self.state.params = ObfuscationParams.from_bytes(bytes(buf))
+        return 0
+
+
+@pytest.fixture
+def driver(monkeypatch):
+    fake = _FakeDriver()
+    monkeypatch.setattr(kernel_interface.fcntl, 'ioctl', fake.ioctl)
+    return fake
+
+
+@pytest.fixture
+def interface(driver):
+    iface = FVOASKernelInterface()
+    iface.fd = os.open(os.devnull, os.O_RDWR)
+    yield iface
+    iface.close()
+
+
+class TestStateCache:
+    """The state cache never hands out objects callers can alias."""
+
+    def test_mutated_params_are_written(self, interface, driver):
+        """get_params(), modify, set_params() reaches the driver."""
+        interface.get_state()
+
+        params = interface.get_params()
+        params.pitch_semitones = 5.0
+        interface.set_params(params)
+
+        assert driver.state.params.pitch_semitones == 5.0
+        assert interface.get_params().pitch_semitones == 5.0
+
+    def test_mutated_state_is_not_cached(self, interface, driver):
+        """Modifying a returned state leaves the cache untouched."""
+        state = interface.get_state()
+        state.mode = ObfuscationMode.ANONYMIZE
+        state.params.formant_ratio = 1.5
+
+        cached = interface.get_state()
+        assert cached.mode == driver.state.mode
+        assert cached.params.formant_ratio == driver.state.params.formant_ratio
+
+    def test_identical_params_skip_the_ioctl(self, interface, driver):
+        """Re-sending the cached params is a no-op while the cache is fresh."""
+        interface.get_state()
+        driver.calls.clear()
+
+        interface.set_params(interface.get_params())
+
+        assert kernel_interface.FVOAS_IOC_SET_PARAMS not in driver.calls
+
+    def test_apply_merges_into_fresh_state(self, interface, driver):
+        """apply() keeps fields that changed behind a still-fresh cache."""
+        interface.get_state()
+        driver.state.bypass = True
+        driver.state.enabled = False
+
+        interface.apply({'pitch_semitones': 3.0})
+
+        assert driver.state.bypass is True
+        assert driver.state.enabled is False
+        assert driver.state.params.pitch_semitones == 3.0
@@ -0,0 +1,111 @@
+"""
+Tests for the FVOAS OpenVINO ML Module
+======================================
+
+F0 tracking runs without OpenVINO; the OpenVINOVoiceModifier tests run a
+tiny gain model and are skipped when OpenVINO isn't installed.
+"""
+
+import threading
+
+import pytest
+import numpy as np
+
+from audioanalysisx1.fvoas.openvino_ml import yin_f0, _median_f0, OpenVINOVoiceModifier
+
+
+def _voiced(f0_hz, duration_s, sample_rate):
+    """A harmonic tone at f0_hz"""
+    t = np.arange(int(sample_rate * duration_s)) / sample_rate
+    return (0.5 * np.sin(2 * np.pi * f0_hz * t)
+            + 0.2 * np.sin(2 * np.pi * 2 * f0_hz * t)).astype(np.float32)
+
+
+class TestYinF0:
+    """YIN F0 tracking."""
+
+    @pytest.mark.parametrize("sample_rate", [16000, 48000])
+    @pytest.mark.parametrize("f0_hz", [110.0, 220.0])
+    def test_short_voiced_chunk(self, sample_rate, f0_hz):
+        """A 40 ms chunk, shorter than the default frame, still gets an F0."""
+        f0 = yin_f0(_voiced(f0_hz, 0.04, sample_rate), sample_rate)
+
+        assert len(f0) == 1
+        assert _median_f0(f0) == pytest.approx(f0_hz, rel=0.02)
+
+    def test_long_signal_frames(self):
+        """Longer input is split into default-length frames."""
+        f0 = yin_f0(_voiced(150.0, 1.0, 16000), 16000)
+
+        assert len(f0) == 16000 // 1280
+        assert np.allclose(f0, 150.0, rtol=0.02)
+
+    def test_silence_is_unvoiced(self):
+        """Silent input yields only unvoiced frames."""
+        f0 = yin_f0(np.zeros(1600, dtype=np.float32), 16000)
+
+        assert not f0.any()
+
+
+@pytest.fixture
+def modifier(tmp_path):
+    """Modifier over a model that halves its one-second input"""
+    ov = pytest.importorskip("openvino.runtime")
+    param = ov.opset13.parameter([1, 1, 16000], np.float32)
+    model = ov.Model([ov.opset13.multiply(param, ov.opset13.constant(np.float32(0.5)))], [param])
+    ov.serialize(model, str(tmp_path / 'model.xml'))
+    return OpenVINOVoiceModifier(model_path=str(tmp_path / 'model.xml'), device='CPU',
+                                 precision='FP32', num_streams=2, cache_dir='',
+                                 assume_normalized=True)
+
+
+class _DroppingQueue:
+    """AsyncInferQueue that drops callback errors, as older OpenVINO releases do"""
+
+    def __init__(self, queue):
+        self._queue = queue
+
+    def set_callback(self, callback):
+        def _quiet(request, userdata):
+            try:
+                callback(request, userdata)
+            except Exception:
+                pass
+        self._queue.set_callback(_quiet)
+
+    def __getattr__(self, name):
+        return getattr(self._queue, name)
+
+
+class TestInferBatch:
+    """Batched inference through the async queue."""
+
+    def test_batch_output(self, modifier):
+        """Every input comes back through the model."""
+        batch = [np.full(16000, 0.5, dtype=np.float32) for _ in range(3)]
+
+        for result in modifier.infer_batch(batch):
+            assert result.model_used != "fallback"
+            assert np.allclose(result.modified_audio, 0.25)
+
+    def test_failed_request_is_not_returned(self, modifier, monkeypatch):
+        """A request whose callback fails sends the batch to the fallback."""
+        monkeypatch.setattr(modifier, '_queue', _DroppingQueue(modifier._queue))
+        store_chunk = modifier._store_chunk
+        lock = threading.Lock()
+        calls = []
+
+        def _store_chunk(output, result, index):
+            with lock:
+                calls.append(index)
+                first = len(calls) == 1
+            if first:
+                raise ValueError("output tensor unavailable")
+            store_chunk(output, result, index)
+
+        monkeypatch.setattr(modifier, '_store_chunk', _store_chunk)
+        batch = [np.full(16000, 0.5, dtype=np.float32) for _ in range(3)]
+
+        for audio, result in zip(batch, modifier.infer_batch(batch)):
+            assert result.model_used == "fallback"
+            assert np.array_equal(result.modified_audio, audio)
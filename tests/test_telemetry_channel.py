@@ -0,0 +1,218 @@
+"""
+Tests for the FVOAS Telemetry Channel
+=====================================
+
+Wire formats and batch sending of VoiceTelemetry.
+"""
+
+import zlib
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+import numpy as np
+
+from audioanalysisx1.fvoas import telemetry_channel
+from audioanalysisx1.fvoas.telemetry_channel import (
+    DICT_FRAME_PREFIX,
+    RECORD_SIZE,
+    TELEMETRY_DICT_ID,
+    TelemetryChannel,
+    VoiceTelemetry,
+)
+
+requires_zstd = pytest.mark.skipif(not telemetry_channel.HAS_ZSTD,
+                                   reason="zstandard not installed")
+
+
+def _telemetry(**overrides):
+    """Telemetry whose measurements are exact in float32"""
+    values = dict(
+        f0_median=150.5,
+        formants=(500.0, 1500.25, 2500.5),
+        manipulation_confidence=0.25,
+        ai_voice_probability=0.75,
+        voiceprint_hash='ab' * 48,
+        threat_type='DEEPFAKE',
+        threat_confidence=0.5,
+        timestamp=datetime(2026, 1, 2, 3, 4, 5, 250000, tzinfo=timezone.utc),
+        device_id=12,
+    )
+    values.update(overrides)
+    return VoiceTelemetry(**values)
+
+
+def _large_telemetry():
+    """Telemetry big enough to be compressed rather than sent plain"""
+    return _telemetry(artifact_signatures=[f'artifact-{i}' for i in range(40)],
+                      session_id='session-0001')
+
+
+class TestBinaryRecords:
+    """Fixed-size binary records round-trip the fields they carry."""
+
+    def test_record_round_trip(self):
+        """to_bytes()/from_bytes() preserve every carried field."""
+        telemetry = _telemetry()
+        data = telemetry.to_bytes()
+
+        assert len(data) == RECORD_SIZE
+        assert VoiceTelemetry.from_bytes(data) == telemetry
+
+    def test_record_without_threat_or_hash(self):
+        """No threat and no voiceprint come back as None and ''."""
+        telemetry = _telemetry(threat_type=None, voiceprint_hash='')
+        decoded = VoiceTelemetry.from_bytes(telemetry.to_bytes())
+
+        assert decoded.threat_type is None
+        assert decoded.voiceprint_hash == ''
+
+    def test_unknown_threat_comes_back_as_other(self):
+        """Threat names outside ThreatType are carried as 'OTHER'."""
+        decoded = VoiceTelemetry.from_bytes(_telemetry(threat_type='replay').to_bytes())
+
+        assert decoded.threat_type == 'OTHER'
+
+    def test_batch_round_trip(self):
+        """pack_batch()/unpack_batch() preserve order and contents."""
+        batch = [_telemetry(f0_median=100.0 + i, device_id=i) for i in range(5)]
+        data = VoiceTelemetry.pack_batch(batch)
+
+        assert len(data) == 5 * RECORD_SIZE
+        assert VoiceTelemetry.unpack_batch(data) == batch
+
+    def test_truncated_record(self):
+        """A short record raises ValueError instead of misparsing."""
+        data = _telemetry().to_bytes()
+
+        with pytest.raises(ValueError):
+            VoiceTelemetry.from_bytes(data[:-1])
+        with pytest.raises(ValueError):
+            VoiceTelemetry.unpack_batch(VoiceTelemetry.pack_batch([_telemetry()] * 2)[:-10])
+
+
+class TestCompression:
+    """compress()/decompress() across codecs and frame formats."""
+
+    def test_plain_json_frames(self):
+        """Uncompressed JSON frames are recognised by their leading byte."""
+        telemetry = _telemetry()
+        data = telemetry_channel._json_dumps(telemetry.to_dict())
+
+        assert VoiceTelemetry.decompress(data).to_dict() == telemetry.to_dict()
+        assert VoiceTelemetry.compress_batch([]) == b'[]'
+        assert VoiceTelemetry.decompress_batch(b'[]') == []
+
+    def test_large_packet_round_trip(self):
+        """Compressed packets decompress to the same telemetry."""
+        telemetry = _large_telemetry()
+        data = telemetry.compress()
+
+        assert data[:1] != b'{'
+        assert VoiceTelemetry.decompress(data).to_dict() == telemetry.to_dict()
+
+    def test_batch_round_trip(self):
+        """compress_batch()/decompress_batch() round-trip a whole batch."""
+        batch = [_large_telemetry() for _ in range(8)]
+        decoded = VoiceTelemetry.decompress_batch(VoiceTelemetry.compress_batch(batch))
+
+        assert [t.to_dict() for t in decoded] == [t.to_dict() for t in batch]
+
+    @requires_zstd
+    def test_dictionary_frame(self):
+        """With zstandard, packets use the current dictionary."""
+        data = _large_telemetry().compress()
+
+        assert data[:4] == DICT_FRAME_PREFIX + bytes((TELEMETRY_DICT_ID,))
+
+    @requires_zstd
+    def test_older_dictionary_id(self):
+        """Frames from senders on an older dictionary still decode."""
+        telemetry = _large_telemetry()
+        payload = telemetry_channel._json_dumps(telemetry.to_dict())
+        compressor = telemetry_channel._zstd_contexts(1)[0]
+        data = DICT_FRAME_PREFIX + b'\x01' + compressor.compress(payload)
+
+        assert VoiceTelemetry.decompress(data).to_dict() == telemetry.to_dict()
+
+    @requires_zstd
+    def test_unknown_dictionary_id(self):
+        """A dictionary ID this receiver doesn't ship raises ValueError."""
+        with pytest.raises(ValueError, match="dictionary ID"):
+            VoiceTelemetry.decompress(DICT_FRAME_PREFIX + b'\xfe' + b'\x00' * 16)
+
+    def test_zlib_frame_from_older_sender(self):
+        """Plain zlib frames, as older senders produced, still decode."""
+        telemetry = _large_telemetry()
+        data = zlib.compress(telemetry.to_json().encode('utf-8'), 6)
+
+        assert VoiceTelemetry.decompress(data).to_dict() == telemetry.to_dict()
+
+    def test_without_zstandard(self, monkeypatch):
+        """Without zstandard, packets fall back to zlib and still round-trip."""
+        monkeypatch.setattr(telemetry_channel, 'HAS_ZSTD', False)
+        telemetry = _large_telemetry()
+        data = telemetry.compress()
+
+        assert data[:1] == b'\x78'
+        assert VoiceTelemetry.decompress(data).to_dict() == telemetry.to_dict()
+
+    @requires_zstd
+    def test_zstd_frame_without_zstandard(self, monkeypatch):
+        """A zstd frame on a receiver without zstandard raises ValueError."""
+        data = _large_telemetry().compress()
+        monkeypatch.setattr(telemetry_channel, 'HAS_ZSTD', False)
+
+        with pytest.raises(ValueError, match="zstandard"):
+            VoiceTelemetry.decompress(data)
+
+
+class _BatchBrain:
+    """Brain stand-in that accepts whole batches"""
+
+    def __init__(self):
+        self.frames = []
+
+    def ingest_telemetry_batch(self, frame):
+        self.frames.append(frame)
+
+
+class TestBatchSending:
+    """Batches are prepared once before they go out."""
+
+    def test_send_batch_hashes_embeddings(self):
+        """Unhashed embeddings get the same digest compute_voiceprint_hash() gives."""
+        rng = np.random.default_rng(0)
+        batch = [VoiceTelemetry(f0_median=140.0 + i) for i in range(4)]
+        for telemetry in batch:
+            telemetry.speaker_embedding = rng.standard_normal(192).astype(np.float32)
+        batch[3].voiceprint_hash = 'f' * 96
+        expected = [replace(t).compute_voiceprint_hash() for t in batch[:3]]
+
+        brain = _BatchBrain()
+        channel = TelemetryChannel(brain=brain, encrypt=False)
+        channel._send_batch(batch)
+
+        assert [t.voiceprint_hash for t in batch[:3]] == expected
+        assert batch[3].voiceprint_hash == 'f' * 96
+        sent = VoiceTelemetry.decompress_batch(brain.frames[0]['payload'])
+        assert [t.voiceprint_hash for t in sent] == [t.voiceprint_hash for t in batch]
+
+    def test_packet_with_numpy_values_is_delivered(self, monkeypatch):
+        """Packets are delivered as dicts without being serialized first."""
+        monkeypatch.setattr(telemetry_channel, 'HAS_ORJSON', False)
+        stored = []
+
+        class _Memory:
+            def store(self, key, value, metadata):
+                stored.append(value)
+
+        class _Brain:
+            _working_memory = _Memory()
+
+        channel = TelemetryChannel(brain=_Brain(), encrypt=False)
+        channel._send_batch([VoiceTelemetry(f0_median=np.float32(140.0))])
+
+        assert channel.stats['telemetry_sent'] == 1
+        assert channel.stats['telemetry_failed'] == 0
+        assert stored[0]['f0_median'] == 140.0